@@ -0,0 +1,118 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Deduplicate test metadata and make source hash unique
+
+Revision ID: 3c1f9e7a5d2b
+Revises: 5e6b0fe14ac9
+Create Date: 2026-10-17 10:04:12.530817
+
+"""
+import hashlib
+import json
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3c1f9e7a5d2b"
+down_revision = "5e6b0fe14ac9"
+branch_labels = None
+depends_on = None
+
+# Metadata tables, along with the execution table and column referencing them
+METADATA_TABLES = [
+    ("testsuitemetadata", "testsuiteexecution", "test_suite_metadata_id"),
+    ("testcasemetadata", "testcaseexecution", "test_case_metadata_id"),
+]
+
+SOURCE_HASH_FIELDS = ("public_id", "version", "title", "description", "mandatory")
+
+
+def _source_hash(row: sa.Row) -> str:
+    # Same hash as app.test_engine.models.test_metadata.metadata_source_hash
+    fields = {field: getattr(row, field) for field in SOURCE_HASH_FIELDS}
+    payload = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def upgrade():
+    connection = op.get_bind()
+
+    for metadata_table, execution_table, metadata_column in METADATA_TABLES:
+        # Keep the oldest record of each test version
+        duplicates = f"""
+            SELECT id, MIN(id) OVER (
+                PARTITION BY public_id, version, title, description, mandatory
+            ) AS kept_id
+            FROM {metadata_table}
+        """
+        op.execute(
+            f"""
+            UPDATE {execution_table}
+            SET {metadata_column} = duplicates.kept_id
+            FROM ({duplicates}) AS duplicates
+            WHERE {execution_table}.{metadata_column} = duplicates.id
+            AND duplicates.id <> duplicates.kept_id
+            """
+        )
+        op.execute(
+            f"""
+            DELETE FROM {metadata_table}
+            USING ({duplicates}) AS duplicates
+            WHERE {metadata_table}.id = duplicates.id
+            AND duplicates.id <> duplicates.kept_id
+            """
+        )
+
+        # Replace the placeholder hashes with the hash of the metadata content
+        rows = connection.execute(
+            sa.text(
+                "SELECT id, public_id, version, title, description, mandatory "
+                f"FROM {metadata_table}"
+            )
+        ).all()
+        if rows:
+            connection.execute(
+                sa.text(
+                    f"UPDATE {metadata_table} SET source_hash = :source_hash "
+                    "WHERE id = :id"
+                ),
+                [{"id": row.id, "source_hash": _source_hash(row)} for row in rows],
+            )
+
+        op.drop_index(
+            op.f(f"ix_{metadata_table}_source_hash"), table_name=metadata_table
+        )
+        op.create_index(
+            op.f(f"ix_{metadata_table}_source_hash"),
+            metadata_table,
+            ["source_hash"],
+            unique=True,
+        )
+
+
+def downgrade():
+    for metadata_table, _, _ in METADATA_TABLES:
+        op.drop_index(
+            op.f(f"ix_{metadata_table}_source_hash"), table_name=metadata_table
+        )
+        op.create_index(
+            op.f(f"ix_{metadata_table}_source_hash"),
+            metadata_table,
+            ["source_hash"],
+            unique=False,
+        )
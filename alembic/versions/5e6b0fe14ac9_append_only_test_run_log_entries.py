@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Move test run log to append-only log entry table
+
+Revision ID: 5e6b0fe14ac9
+Revises: e2c185af1226
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e6b0fe14ac9"
+down_revision = "e2c185af1226"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "testrunlogentry",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("level", sa.String(), nullable=False),
+        sa.Column("timestamp", sa.Float(), nullable=False),
+        sa.Column("message", sa.String(), nullable=False),
+        sa.Column("test_suite_execution_index", sa.Integer(), nullable=True),
+        sa.Column("test_case_execution_index", sa.Integer(), nullable=True),
+        sa.Column("test_step_execution_index", sa.Integer(), nullable=True),
+        sa.Column("test_run_execution_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["test_run_execution_id"],
+            ["testrunexecution.id"],
+            name=op.f("fk_testrunlogentry_test_run_execution_id_testrunexecution"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_testrunlogentry")),
+    )
+    op.create_index(
+        op.f("ix_testrunlogentry_id"), "testrunlogentry", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_testrunlogentry_test_run_execution_id"),
+        "testrunlogentry",
+        ["test_run_execution_id"],
+        unique=False,
+    )
+
+    # Copy existing logs, keeping the original order of the entries
+    op.execute(
+        """
+        INSERT INTO testrunlogentry (
+            level,
+            timestamp,
+            message,
+            test_suite_execution_index,
+            test_case_execution_index,
+            test_step_execution_index,
+            test_run_execution_id
+        )
+        SELECT
+            entry.value ->> 'level',
+            (entry.value ->> 'timestamp')::float,
+            entry.value ->> 'message',
+            (entry.value ->> 'test_suite_execution_index')::integer,
+            (entry.value ->> 'test_case_execution_index')::integer,
+            (entry.value ->> 'test_step_execution_index')::integer,
+            testrunexecution.id
+        FROM testrunexecution,
+            json_array_elements(testrunexecution.log)
+            WITH ORDINALITY AS entry(value, position)
+        ORDER BY testrunexecution.id, entry.position
+        """
+    )
+
+    op.drop_column("testrunexecution", "log")
+
+
+def downgrade():
+    op.add_column(
+        "testrunexecution",
+        sa.Column("log", sa.JSON(), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE testrunexecution SET log = COALESCE(
+            (
+                SELECT json_agg(
+                    json_build_object(
+                        'level', level,
+                        'timestamp', timestamp,
+                        'message', message,
+                        'test_suite_execution_index', test_suite_execution_index,
+                        'test_case_execution_index', test_case_execution_index,
+                        'test_step_execution_index', test_step_execution_index
+                    )
+                    ORDER BY id
+                )
+                FROM testrunlogentry
+                WHERE test_run_execution_id = testrunexecution.id
+            ),
+            '[]'::json
+        )
+        """
+    )
+    op.alter_column("testrunexecution", "log", existing_type=sa.JSON(), nullable=False)
+
+    op.drop_index(
+        op.f("ix_testrunlogentry_test_run_execution_id"),
+        table_name="testrunlogentry",
+    )
+    op.drop_index(op.f("ix_testrunlogentry_id"), table_name="testrunlogentry")
+    op.drop_table("testrunlogentry")
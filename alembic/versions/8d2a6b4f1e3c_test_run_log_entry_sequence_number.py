@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Store the sequence number of test run log entries
+
+Revision ID: 8d2a6b4f1e3c
+Revises: 3c1f9e7a5d2b
+Create Date: 2026-10-17 12:31:05.204117
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8d2a6b4f1e3c"
+down_revision = "3c1f9e7a5d2b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "testrunlogentry", sa.Column("sequence_number", sa.Integer(), nullable=True)
+    )
+    # Number the existing entries by their position in the log of their test run
+    op.execute(
+        """
+        UPDATE testrunlogentry
+        SET sequence_number = numbered.sequence_number
+        FROM (
+            SELECT
+                id,
+                row_number() OVER (
+                    PARTITION BY test_run_execution_id ORDER BY id
+                ) - 1 AS sequence_number
+            FROM testrunlogentry
+        ) AS numbered
+        WHERE testrunlogentry.id = numbered.id
+        """
+    )
+    op.alter_column("testrunlogentry", "sequence_number", nullable=False)
+    op.create_index(
+        "ix_testrunlogentry_test_run_execution_id_sequence_number",
+        "testrunlogentry",
+        ["test_run_execution_id", "sequence_number"],
+        unique=True,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_testrunlogentry_test_run_execution_id_sequence_number",
+        table_name="testrunlogentry",
+    )
+    op.drop_column("testrunlogentry", "sequence_number")
@@ -0,0 +1,39 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Store the performance analytics of test case executions
+
+Revision ID: b7e4c2d9a1f6
+Revises: 8d2a6b4f1e3c
+Create Date: 2026-10-17 09:10:42.518306
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7e4c2d9a1f6"
+down_revision = "8d2a6b4f1e3c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("testcaseexecution", sa.Column("analytics", sa.JSON(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("testcaseexecution", "analytics")
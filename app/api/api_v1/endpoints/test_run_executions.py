@@ -40,6 +40,9 @@ from app.utils import (
     selected_tests_from_execution,
 )
 from app.version import version_information
+from test_collections.matter.sdk_tests.support.performance_tests.utils import (
+    CommissioningLogParser,
+)
 
 router = APIRouter()
 
@@ -395,12 +398,11 @@ def download_log(
             "Content-Disposition": f'attachment; filename="{filename}"'
         }
 
-    log_output = log_utils.convert_execution_log_to_list(
-        log=test_run_execution.log, json_entries=json_entries
-    )
-
+    # Entries are read from the DB and formatted while the response is sent
     return StreamingResponse(
-        log_utils.async_log_generator(items=log_output),
+        log_utils.log_stream_generator(
+            log_entries=test_run_execution.iter_log(), json_entries=json_entries
+        ),
         **options,
     )
 
@@ -424,7 +426,7 @@ def download_grouped_log(
         for each state; one file with the logs from the executed test suites; one file
         per state with the logs from all test cases that finished with that state
     """
-    test_run_execution = crud.test_run_execution.get(db=db, id=id)
+    test_run_execution = crud.test_run_execution.get_with_executions(db=db, id=id)
     if not test_run_execution:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail="Test Run Execution not found"
@@ -434,7 +436,7 @@ def download_grouped_log(
         test_run_execution=test_run_execution
     )
 
-    zip_file = log_utils.create_grouped_log_zip_file(grouped_logs=logs)
+    zip_file = log_utils.grouped_log_zip_generator(grouped_logs=logs)
 
     file_name = f"{test_run_execution.id}-{test_run_execution.title}.zip"
     options: dict = {
@@ -448,6 +450,47 @@ def download_grouped_log(
     )
 
 
+@router.get("/{id}/performance-analytics", response_model=Dict[str, Dict[str, Any]])
+def read_performance_analytics(
+    *,
+    db: Session = Depends(get_db),
+    id: int,
+) -> Dict[str, Dict[str, Any]]:
+    """Commissioning duration analytics for a performance test run.
+
+    Args:
+        id (int): ID of the TestRunExectution the analytics are requested for
+
+    Raises:
+        HTTPException: If there's no TestRunExectution with the given ID
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each analytics parameter (durations,
+        discovery_durations, read_durations, PASE_durations), the percentiles,
+        min/max, mean/stddev, histogram and outlier iterations, in microseconds
+    """
+    test_run_execution = crud.test_run_execution.get(db=db, id=id)
+    if not test_run_execution:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail="Test Run Execution not found"
+        )
+
+    # Performance test cases store their analytics at the end of the run
+    for test_suite_execution in test_run_execution.test_suite_executions:
+        for test_case_execution in test_suite_execution.test_case_executions:
+            if test_case_execution.analytics is not None:
+                return test_case_execution.analytics
+
+    # Runs executed before the analytics were stored are parsed from the log
+    parser = CommissioningLogParser()
+    for line in log_utils.log_generator(
+        log_entries=test_run_execution.iter_log(), json_entries=False
+    ):
+        parser.feed(line)
+
+    return parser.analytics_summary()
+
+
 @router.post("/file_upload/")
 def upload_file(
     *,
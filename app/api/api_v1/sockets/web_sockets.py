@@ -13,13 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import asyncio
-
 from fastapi import APIRouter, WebSocket
 from fastapi.websockets import WebSocketDisconnect
 
 from app.socket_connection_manager import SocketConnectionManager
 
+# Registers the handler of test log subscription messages
+from app.test_engine import test_log_subscription  # noqa: F401
+
 router = APIRouter()
 
 
@@ -29,15 +30,11 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     await socket_connection_manager.connect(websocket)
     try:
         while True:
-            # WebSocketDisconnect is not raised unless we poll
-            # https://github.com/tiangolo/fastapi/issues/3008
-            try:
-                message = await asyncio.wait_for(websocket.receive_text(), 0.1)
-                await socket_connection_manager.received_message(
-                    socket=websocket, message=message
-                )
-            except asyncio.TimeoutError:
-                pass
-
+            # Waiting for a message raises WebSocketDisconnect when the client
+            # disconnects, so idle connections don't need to be polled
+            message = await websocket.receive_text()
+            await socket_connection_manager.received_message(
+                socket=websocket, message=message
+            )
     except WebSocketDisconnect:
         socket_connection_manager.disconnect(websocket)
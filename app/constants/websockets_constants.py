@@ -21,6 +21,9 @@ INVALID_JSON_ERROR_STR = "The message received is not a valid JSON object"
 MISSING_TYPE_ERROR_STR = "The message is missing a type key"
 NO_HANDLER_FOR_MSG_ERROR_STR = "There is no handler registered for this message type"
 
+# WebSocket subprotocol clients can request to receive messages as compact JSON
+COMPACT_JSON_SUBPROTOCOL = "compact-json"
+
 
 # Enum Keys for different types of messages currently supported by the tool
 class MessageTypeEnum(str, Enum):
@@ -32,7 +35,9 @@ class MessageTypeEnum(str, Enum):
     TEST_UPDATE = "test_update"
     TIME_OUT_NOTIFICATION = "time_out_notification"
     TEST_LOG_RECORDS = "test_log_records"
+    TEST_LOG_SUBSCRIBE = "test_log_subscribe"
     INVALID_MESSAGE = "invalid_message"
+    HEARTBEAT = "heartbeat"
 
 
 # Enum keys used with messages at the top level
@@ -17,12 +17,16 @@ import asyncio
 import io
 import tarfile
 from asyncio import TimeoutError, wait_for
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Optional
+from time import time
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 import docker
 from docker.errors import DockerException, NotFound
 from docker.models.containers import Container
+from docker.types.daemon import CancellableStream
 from loguru import logger
 
 from app.singleton import Singleton
@@ -31,20 +35,87 @@ from app.singleton import Singleton
 # point to later configure the image to be a particular type
 container_bring_up_timeout = 5  # Seconds
 
+# Max number of docker API calls running concurrently in the docker thread pool
+DOCKER_EXECUTOR_MAX_WORKERS = 4
+
+T = TypeVar("T")
+
 
 class ContainerManager(object, metaclass=Singleton):
+    """Manages the docker containers used by the test harness.
+
+    docker-py calls are blocking HTTP requests to the docker daemon. The coroutine
+    methods run them in a dedicated thread pool, so they don't block the event loop,
+    and should be used from async code. The plain methods are kept for sync code.
+    """
+
     def __init__(self) -> None:
         self.__client = docker.from_env()
+        self.__executor = ThreadPoolExecutor(
+            max_workers=DOCKER_EXECUTOR_MAX_WORKERS, thread_name_prefix="docker"
+        )
 
     async def create_container(
         self, docker_image_tag: str, parameters: Dict = {}
     ) -> Container:
-        container = self.__run_new_container(docker_image_tag, parameters)
-        await self.__container_ready(container)
+        # Container events are requested from before the container is created, so
+        # its start event can't be missed. The docker daemon only has a resolution of
+        # seconds for this.
+        since = int(time()) - 1
+        container = await self.run_in_executor(
+            self.__run_new_container, docker_image_tag, parameters
+        )
+        await self.__container_ready(container, since)
         logger.info("Container running for " + docker_image_tag)
 
         return container
 
+    async def run_in_executor(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run a blocking function doing docker I/O in the docker thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.__executor, partial(func, *args, **kwargs)
+        )
+
+    async def get_container_async(self, id_or_name: str) -> Optional[Container]:
+        return await self.run_in_executor(self.get_container, id_or_name)
+
+    async def is_running_async(self, container: Container) -> bool:
+        return await self.run_in_executor(self.is_running, container)
+
+    async def destroy_async(self, container: Container) -> None:
+        await self.run_in_executor(self.destroy, container)
+
+    async def copy_file_from_container_async(
+        self,
+        container: Container,
+        container_file_path: Path,
+        destination_path: Path,
+        destination_file_name: str,
+    ) -> None:
+        await self.run_in_executor(
+            self.copy_file_from_container,
+            container=container,
+            container_file_path=container_file_path,
+            destination_path=destination_path,
+            destination_file_name=destination_file_name,
+        )
+
+    async def copy_file_to_container_async(
+        self,
+        container: Container,
+        host_file_path: Path,
+        destination_container_path: Path,
+    ) -> None:
+        await self.run_in_executor(
+            self.copy_file_to_container,
+            container=container,
+            host_file_path=host_file_path,
+            destination_container_path=destination_container_path,
+        )
+
     def destroy(self, container: Container) -> None:
         if self.is_running(container):
             container.kill()
@@ -100,29 +171,40 @@ class ContainerManager(object, metaclass=Singleton):
             )
             raise error
 
-    async def __container_ready(self, container: Container) -> None:
+    async def __container_ready(self, container: Container, since: int) -> None:
         # Wait for the container for start running
+        events = await self.run_in_executor(
+            self.__client.events,
+            since=since,
+            filters={"container": container.id, "event": "start"},
+            decode=True,
+        )
         try:
             await wait_for(
-                self.__container_started(container), container_bring_up_timeout
+                self.__container_started(container, events),
+                container_bring_up_timeout,
             )
         except TimeoutError as e:
             logger.error(
                 f"Container did start timed out in {container_bring_up_timeout}s"
             )
-            self.destroy(container)
+            await self.destroy_async(container)
             raise e
+        finally:
+            # Closing the events stream also stops waiting for the next event
+            events.close()
 
-    async def __container_started(self, container: Container) -> None:
-        sleep_interval = 0.2
-
-        while True:
-            # Check if the container is running, then sleep for 0.1 sec
-            if self.is_running(container):
-                return
+    async def __container_started(
+        self, container: Container, events: CancellableStream
+    ) -> None:
+        # The start event is the only one requested, so the container has started when
+        # any event is received
+        if await self.run_in_executor(next, events, None) is not None:
+            return
 
-            # Sleep first to give container some time
-            await asyncio.sleep(sleep_interval)
+        # The events stream ended without any event, e.g. when the daemon closed it
+        if not await self.is_running_async(container):
+            raise TimeoutError("Container did not start")
 
     def copy_file_from_container(
         self,
@@ -14,17 +14,24 @@
 # limitations under the License.
 #
 from datetime import datetime
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import func, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.orm import Session, joinedload
 
 from app.crud import operator as crud_operator
 from app.crud import project as crud_project
 from app.crud import test_run_config as crud_test_run_config
 from app.crud.base import CRUDBaseCreate, CRUDBaseDelete, CRUDBaseRead, CRUDBaseUpdate
-from app.models import Project, TestCaseExecution, TestRunExecution, TestSuiteExecution
+from app.models import (
+    Project,
+    TestCaseExecution,
+    TestCaseMetadata,
+    TestRunExecution,
+    TestSuiteExecution,
+    TestSuiteMetadata,
+)
 from app.schemas import (
     TestRunConfigCreate,
     TestRunExecutionToExport,
@@ -65,6 +72,26 @@ class CRUDTestRunExecution(
         skip: Optional[int] = 0,
         limit: Optional[int] = 100,
     ) -> Sequence[TestRunExecution]:
+        query = self.__select_multi(
+            project_id=project_id,
+            archived=archived,
+            search_query=search_query,
+            order_by=order_by,
+            skip=skip,
+            limit=limit,
+        )
+        return db.scalars(query).all()
+
+    def __select_multi(
+        self,
+        *,
+        project_id: Optional[int],
+        archived: Optional[bool],
+        search_query: Optional[str],
+        order_by: Optional[str],
+        skip: Optional[int],
+        limit: Optional[int],
+    ) -> Select[Tuple[TestRunExecution]]:
         query = self.select()
 
         if project_id is not None:
@@ -89,9 +116,7 @@ class CRUDTestRunExecution(
         else:
             query = query.order_by(order_by)
 
-        query = query.offset(skip).limit(limit)
-
-        return db.scalars(query).all()
+        return query.offset(skip).limit(limit)
 
     def get_multi_with_stats(
         self,
@@ -104,59 +129,73 @@ class CRUDTestRunExecution(
         skip: Optional[int] = 0,
         limit: Optional[int] = 100,
     ) -> List[TestRunExecutionWithStats]:
-        results = self.get_multi(
-            db=db,
+        # Operator is included in the results, so load it in the same query
+        query = self.__select_multi(
             project_id=project_id,
             archived=archived,
             search_query=search_query,
             order_by=order_by,
             skip=skip,
             limit=limit,
-        )
-        # load stats for each test run
-        return list(map(lambda tre: self.__load_stats(db, tre), results))
+        ).options(joinedload(self.model.operator))
+        results = db.scalars(query).all()
+
+        # load stats for all test runs at once
+        stats = self.__load_stats(db, [tre.id for tre in results])
+
+        return [
+            self.__with_stats(tre, stats.get(tre.id, TestRunExecutionStats()))
+            for tre in results
+        ]
 
     def __load_stats(
-        self, db: Session, test_run_execution: TestRunExecution
-    ) -> TestRunExecutionWithStats:
-        stats = TestRunExecutionStats()
-
-        # get total test case count
-        count = (
-            db.scalar(
-                select(func.count())
-                .select_from(TestCaseExecution)
-                .join(TestSuiteExecution)
-                .join(TestRunExecution)
-                .filter(TestRunExecution.id == test_run_execution.id)
-            )
-            or 0
-        )
+        self, db: Session, test_run_execution_ids: List[int]
+    ) -> Dict[int, TestRunExecutionStats]:
+        """Collect test case state statistics for multiple test runs.
+
+        Uses a single query, grouped by test run and test case state.
 
-        stats.test_case_count = count
+        Returns:
+            Dict[int, TestRunExecutionStats]: stats by test run execution id, test runs
+            without test cases are not included.
+        """
+        stats: Dict[int, TestRunExecutionStats] = {}
+
+        if not test_run_execution_ids:
+            return stats
 
-        # Collect state statistics
         state_counts = db.execute(
-            select(func.count(TestCaseExecution.state), TestCaseExecution.state)
+            select(
+                TestSuiteExecution.test_run_execution_id,
+                TestCaseExecution.state,
+                func.count(),
+            )
+            .select_from(TestCaseExecution)
             .join(TestSuiteExecution)
-            .join(TestRunExecution)
-            .filter(TestRunExecution.id == test_run_execution.id)
-            .group_by(TestCaseExecution.state)
+            .filter(
+                TestSuiteExecution.test_run_execution_id.in_(test_run_execution_ids)
+            )
+            .group_by(TestSuiteExecution.test_run_execution_id, TestCaseExecution.state)
         ).all()
-        # The state counts are returned as a list of tuples (Count, Enum):
-        # Example: [(11, TestStateEnum.ERROR), (1, TestStateEnum.PENDING)]
-        # Below we extract these stats, and use subscript notation to access
-        # the tuple elements
-        for state_count in state_counts:
-            count = state_count[0]
-            state = state_count[1].value
-            stats.states[state] = count
 
+        # The state counts are returned as a list of tuples (Id, Enum, Count):
+        # Example: [(1, TestStateEnum.ERROR, 11), (1, TestStateEnum.PENDING, 1)]
+        for test_run_execution_id, state, count in state_counts:
+            test_run_stats = stats.setdefault(
+                test_run_execution_id, TestRunExecutionStats()
+            )
+            test_run_stats.states[state.value] = count
+            test_run_stats.test_case_count += count
+
+        return stats
+
+    def __with_stats(
+        self, test_run_execution: TestRunExecution, stats: TestRunExecutionStats
+    ) -> TestRunExecutionWithStats:
         result = TestRunExecutionWithStats(
             **dict(test_run_execution.__dict__, test_case_stats=stats)
         )
 
-        # Operator is lazy loaded, so it might not be included in __dict__.
         # TODO #296: This could be solved by using from_orm, but it doesn't
         # support adding the `test_case_stats` see :
         # https://github.com/samuelcolvin/pydantic/pull/3375
@@ -213,7 +252,7 @@ class CRUDTestRunExecution(
 
         test_suites = (
             test_script_manager.pending_test_suite_executions_for_selected_tests(
-                selected_tests
+                db=db, selected_tests=selected_tests
             )
         )
 
@@ -246,6 +285,22 @@ class CRUDTestRunExecution(
 
         return project
 
+    def get_with_executions(self, db: Session, id: int) -> Optional[TestRunExecution]:
+        """Get a test run execution with its suite and case executions loaded.
+
+        The executions are eagerly loaded in the same query, instead of lazy loading
+        the case executions of each suite.
+        """
+        return db.get(
+            TestRunExecution,
+            id,
+            options=[
+                joinedload(TestRunExecution.test_suite_executions).joinedload(
+                    TestSuiteExecution.test_case_executions
+                )
+            ],
+        )
+
     def archive(self, db: Session, db_obj: TestRunExecution) -> TestRunExecution:
         db_obj.archived_at = datetime.now()
         db.add(db_obj)
@@ -301,7 +356,11 @@ class CRUDTestRunExecution(
             )
             imported_execution.test_run_config_id = test_run_config.id
 
-        imported_model = TestRunExecution(**jsonable_encoder(imported_execution))
+        imported_execution_data = jsonable_encoder(imported_execution)
+        self.__find_or_create_imported_metadata(
+            db=db, execution_data=imported_execution_data
+        )
+        imported_model = TestRunExecution(**imported_execution_data)
 
         db.add(imported_model)
         db.commit()
@@ -309,5 +368,28 @@ class CRUDTestRunExecution(
 
         return imported_model
 
+    def __find_or_create_imported_metadata(
+        self, db: Session, execution_data: dict
+    ) -> None:
+        """
+        Replace the metadata of the imported test suites and test cases with the
+        matching records, which are unique by source hash.
+        """
+        for test_suite_data in execution_data.get("test_suite_executions") or []:
+            test_suite_metadata = test_script_manager.find_or_create_metadata(
+                db=db,
+                model=TestSuiteMetadata,
+                metadata=test_suite_data["test_suite_metadata"],
+            )
+            test_suite_data["test_suite_metadata"] = test_suite_metadata
+
+            for test_case_data in test_suite_data["test_case_executions"]:
+                test_case_metadata = test_script_manager.find_or_create_metadata(
+                    db=db,
+                    model=TestCaseMetadata,
+                    metadata=test_case_data["test_case_metadata"],
+                )
+                test_case_data["test_case_metadata"] = test_case_metadata
+
 
 test_run_execution = CRUDTestRunExecution(TestRunExecution)
@@ -13,21 +13,52 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import json
 from datetime import datetime
 from functools import reduce
-from io import BytesIO
+from io import RawIOBase
+from itertools import islice
 from operator import add
-from typing import AsyncGenerator, Generator, List, Optional
-from zipfile import ZipFile
+from tempfile import SpooledTemporaryFile
+from typing import IO, Dict, Generator, Iterable, List, Optional, Tuple, cast
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from app import models, schemas
 
 LOG_SECTION_TEMPLATE = "--------------------- {} ---------------------\n"
+# Number of formatted log lines sent at a time when streaming a log
+LOG_STREAM_CHUNK_LINES = 1000
+# The general logs are repeated in several files of the grouped log zip, so they are
+# rendered once. They're kept in memory up to this size, larger logs spill to disk.
+GROUPED_LOG_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+GROUPED_LOG_READ_CHUNK_SIZE = 64 * 1024
+
+
+class _ZipStream(RawIOBase):
+    """Unseekable stream that keeps the bytes written until they are taken.
+
+    ZipFile writes to unseekable streams sequentially, so the zip file can be sent
+    while it's being compressed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self.__buffer += data
+        return len(data)
+
+    def take(self) -> bytes:
+        data = bytes(self.__buffer)
+        self.__buffer.clear()
+        return data
 
 
 def log_generator(
-    log_entries: List[schemas.TestRunLogEntry], json_entries: bool
+    log_entries: Iterable[schemas.TestRunLogEntry], json_entries: bool
 ) -> Generator:
     for log_line in log_entries:
         if json_entries:
@@ -40,31 +71,25 @@ def log_generator(
             yield f"{log_line.level:10} | {timestamp} | {log_line.message}\n"
 
 
-async def async_log_generator(items: list) -> AsyncGenerator:
-    for log_line in items:
-        yield log_line + "\n"
+def log_stream_generator(
+    log_entries: Iterable[schemas.TestRunLogEntry],
+    json_entries: bool,
+    chunk_lines: int = LOG_STREAM_CHUNK_LINES,
+) -> Generator[str, None, None]:
+    """Format log entries lazily, joined in chunks of `chunk_lines` lines.
 
-
-def convert_execution_log_to_list(log: list, json_entries: bool) -> list:
-    log_entries = []
-
-    for log_line in log:
-        if json_entries:
-            log_entries.append(json.dumps(log_line.__dict__))
-        else:
-            entry = log_line
-            timestamp = datetime.fromtimestamp(entry.timestamp).strftime(
-                "%Y-%m-%d %H:%M:%S.%f"
-            )
-            log_entries.append(f"{entry.level:10} | {timestamp} | {entry.message}")
-
-    return log_entries
+    Each chunk is a single write to the response, instead of one write per line.
+    """
+    log_lines = log_generator(log_entries=log_entries, json_entries=json_entries)
+    while chunk := "".join(islice(log_lines, chunk_lines)):
+        yield chunk
 
 
 def group_test_run_execution_logs(
     test_run_execution: models.TestRunExecution,
 ) -> schemas.GroupedTestRunExecutionLogs:
     grouped_logs = schemas.GroupedTestRunExecutionLogs()
+    suites, cases = __test_executions_index(test_run_execution=test_run_execution)
 
     # Log entries have indexes for test suite, test case and test step executions. E.g.:
     #   test_suite_execution_index: 0,
@@ -74,74 +99,88 @@ def group_test_run_execution_logs(
     # - For test suite specific logs (not related to any test case), the indexes for
     # test case and test step are None and the test_suite_execution_index is not None;
     # - For test case logs, the indexes for test suite and test case are not None.
-    for entry in test_run_execution.log:
-        if test_case := __test_case_execution_for_log_entry(
-            test_run_execution=test_run_execution, log_entry=entry
-        ):
-            if grouped_logs.cases.get(test_case.state) is None:
-                grouped_logs.cases[test_case.state] = {}
-
-            if grouped_logs.cases[test_case.state].get(test_case.public_id) is None:
-                grouped_logs.cases[test_case.state][test_case.public_id] = []
-
-            grouped_logs.cases[test_case.state][test_case.public_id].append(entry)
-        elif test_suite := __test_suite_execution_for_log_entry(
-            test_run_execution=test_run_execution, log_entry=entry
-        ):
-            if grouped_logs.suites.get(test_suite.public_id) is None:
-                grouped_logs.suites[test_suite.public_id] = []
-
-            grouped_logs.suites[test_suite.public_id].append(entry)
+    for entry in test_run_execution.iter_log():
+        suite_index = entry.test_suite_execution_index
+        case_index = entry.test_case_execution_index
+
+        if (test_case := cases.get((suite_index, case_index))) is not None:
+            state, test_case_public_id = test_case
+            grouped_logs.cases.setdefault(state, {}).setdefault(
+                test_case_public_id, []
+            ).append(entry)
+        elif (test_suite_public_id := suites.get(suite_index)) is not None:
+            grouped_logs.suites.setdefault(test_suite_public_id, []).append(entry)
         else:
             grouped_logs.general.append(entry)
 
     return grouped_logs
 
 
-def create_grouped_log_zip_file(
+def grouped_log_zip_generator(
     grouped_logs: schemas.GroupedTestRunExecutionLogs,
-) -> BytesIO:
-    file = BytesIO()
-
-    with ZipFile(file=file, mode="w") as zip_file:
-        __create_summary_file(grouped_logs=grouped_logs, zip_file=zip_file)
-        __create_suites_file(grouped_logs=grouped_logs, zip_file=zip_file)
+) -> Generator[bytes, None, None]:
+    """Generate a zip file with the grouped logs, in chunks as it's compressed."""
+    stream = _ZipStream()
 
+    with SpooledTemporaryFile(max_size=GROUPED_LOG_SPOOL_MAX_SIZE) as general_logs:
+        for chunk in __log_section_content(
+            title="Test run general logs", log_entries=grouped_logs.general
+        ):
+            general_logs.write(chunk)
+
+        files = {
+            "summary.txt": __summary_file_content(grouped_logs=grouped_logs),
+            "test_suites_setup_and_cleanup.log": __suites_file_content(
+                grouped_logs=grouped_logs, general_logs=general_logs
+            ),
+        }
         for state in grouped_logs.cases.keys():
-            __create_cases_file(
-                grouped_logs=grouped_logs, state=state, zip_file=zip_file
+            files[f"{state}_test_cases.log"] = __cases_file_content(
+                grouped_logs=grouped_logs, state=state, general_logs=general_logs
             )
 
-    file.seek(0)
-
-    return file
-
-
-def __test_suite_execution_for_log_entry(
-    test_run_execution: models.TestRunExecution, log_entry: schemas.TestRunLogEntry
-) -> Optional[models.TestSuiteExecution]:
-    if (test_suite_index := log_entry.test_suite_execution_index) is None:
-        return None
-
-    return test_run_execution.test_suite_executions[test_suite_index]
-
-
-def __test_case_execution_for_log_entry(
-    test_run_execution: models.TestRunExecution, log_entry: schemas.TestRunLogEntry
-) -> Optional[models.TestCaseExecution]:
-    if (test_suite_index := log_entry.test_suite_execution_index) is None or (
-        test_case_index := log_entry.test_case_execution_index
-    ) is None:
-        return None
+        with ZipFile(
+            file=cast(IO[bytes], stream), mode="w", compression=ZIP_DEFLATED
+        ) as zip_file:
+            for file_name, content in files.items():
+                with zip_file.open(name=file_name, mode="w") as file:
+                    for chunk in content:
+                        file.write(chunk)
+                        if data := stream.take():
+                            yield data
 
-    return test_run_execution.test_suite_executions[
-        test_suite_index
-    ].test_case_executions[test_case_index]
+    # The central directory is written when the zip file is closed
+    yield stream.take()
 
 
-def __create_summary_file(
-    grouped_logs: schemas.GroupedTestRunExecutionLogs, zip_file: ZipFile
-) -> None:
+def __test_executions_index(
+    test_run_execution: models.TestRunExecution,
+) -> Tuple[
+    Dict[Optional[int], str],
+    Dict[Tuple[Optional[int], Optional[int]], Tuple[models.TestStateEnum, str]],
+]:
+    """Index the test suite and test case executions by their execution indexes.
+
+    Returns:
+        Tuple: public_id of each test suite execution, keyed by suite index; state
+        and public_id of each test case execution, keyed by suite and case indexes.
+    """
+    suites: Dict[Optional[int], str] = {}
+    cases: Dict[
+        Tuple[Optional[int], Optional[int]], Tuple[models.TestStateEnum, str]
+    ] = {}
+
+    for suite_index, test_suite in enumerate(test_run_execution.test_suite_executions):
+        suites[suite_index] = test_suite.public_id
+        for case_index, test_case in enumerate(test_suite.test_case_executions):
+            cases[(suite_index, case_index)] = (test_case.state, test_case.public_id)
+
+    return suites, cases
+
+
+def __summary_file_content(
+    grouped_logs: schemas.GroupedTestRunExecutionLogs,
+) -> Generator[bytes, None, None]:
     content: List[str] = []
 
     test_case_count = reduce(add, map(len, grouped_logs.cases.values()), 0)
@@ -158,34 +197,42 @@ def __create_summary_file(
             for test_case_id in test_cases.keys():
                 content.append(f"{test_case_id}\n")
 
-    zip_file.writestr(zinfo_or_arcname="summary.txt", data="".join(content))
+    yield "".join(content).encode()
 
 
-def __create_suites_file(
-    grouped_logs: schemas.GroupedTestRunExecutionLogs, zip_file: ZipFile
-) -> None:
-    content = [LOG_SECTION_TEMPLATE.format("Test run general logs")]
-    content.extend(log_generator(log_entries=grouped_logs.general, json_entries=False))
+def __log_section_content(
+    title: str, log_entries: List[schemas.TestRunLogEntry]
+) -> Generator[bytes, None, None]:
+    yield LOG_SECTION_TEMPLATE.format(title).encode()
+    for chunk in log_stream_generator(log_entries=log_entries, json_entries=False):
+        yield chunk.encode()
 
-    for test_suite, test_suite_logs in grouped_logs.suites.items():
-        content.append(LOG_SECTION_TEMPLATE.format(f"{test_suite} logs"))
-        content.extend(log_generator(log_entries=test_suite_logs, json_entries=False))
 
-    zip_file.writestr(
-        zinfo_or_arcname="test_suites_setup_and_cleanup.log", data="".join(content)
-    )
+def __rendered_content(file: IO[bytes]) -> Generator[bytes, None, None]:
+    file.seek(0)
+    while chunk := file.read(GROUPED_LOG_READ_CHUNK_SIZE):
+        yield chunk
+
 
+def __suites_file_content(
+    grouped_logs: schemas.GroupedTestRunExecutionLogs, general_logs: IO[bytes]
+) -> Generator[bytes, None, None]:
+    yield from __rendered_content(general_logs)
 
-def __create_cases_file(
+    for test_suite, test_suite_logs in grouped_logs.suites.items():
+        yield from __log_section_content(
+            title=f"{test_suite} logs", log_entries=test_suite_logs
+        )
+
+
+def __cases_file_content(
     grouped_logs: schemas.GroupedTestRunExecutionLogs,
     state: models.TestStateEnum,
-    zip_file: ZipFile,
-) -> None:
-    content = [LOG_SECTION_TEMPLATE.format("Test run general logs")]
-    content.extend(log_generator(log_entries=grouped_logs.general, json_entries=False))
+    general_logs: IO[bytes],
+) -> Generator[bytes, None, None]:
+    yield from __rendered_content(general_logs)
 
     for test_case, test_case_logs in grouped_logs.cases[state].items():
-        content.append(LOG_SECTION_TEMPLATE.format(f"{test_case} logs"))
-        content.extend(log_generator(log_entries=test_case_logs, json_entries=False))
-
-    zip_file.writestr(zinfo_or_arcname=f"{state}_test_cases.log", data="".join(content))
+        yield from __log_section_content(
+            title=f"{test_case} logs", log_entries=test_case_logs
+        )
@@ -20,6 +20,7 @@ from .test_case_metadata import TestCaseMetadata
 from .test_enums import TestStateEnum
 from .test_run_config import TestRunConfig
 from .test_run_execution import TestRunExecution
+from .test_run_log_entry import TestRunLogEntry
 from .test_step_execution import TestStepExecution
 from .test_suite_execution import TestSuiteExecution
 from .test_suite_metadata import TestSuiteMetadata
@@ -16,7 +16,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ARRAY, Enum, ForeignKey, String
+from sqlalchemy import ARRAY, JSON, Enum, ForeignKey, String
 from sqlalchemy.ext.orderinglist import ordering_list
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -49,6 +49,9 @@ class TestCaseExecution(Base):
         ARRAY(String, dimensions=1), nullable=False, default=[]
     )
 
+    # Commissioning duration analytics, computed while a performance test runs
+    analytics: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+
     test_case_metadata_id: Mapped[int] = mapped_column(
         ForeignKey("testcasemetadata.id"), nullable=False
     )
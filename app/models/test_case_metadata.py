@@ -34,7 +34,9 @@ class TestCaseMetadata(Base):
     title: Mapped[str] = mapped_column(nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     version: Mapped[str] = mapped_column(nullable=False)
-    source_hash: Mapped[str] = mapped_column(VARCHAR(64), nullable=False, index=True)
+    source_hash: Mapped[str] = mapped_column(
+        VARCHAR(64), nullable=False, index=True, unique=True
+    )
     mandatory: Mapped[bool] = mapped_column(default=False, nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(default=datetime.now, nullable=False)
@@ -14,18 +14,25 @@
 # limitations under the License.
 #
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence
 
-from sqlalchemy import Enum, ForeignKey, func, select
+from sqlalchemy import Enum, ForeignKey, func, inspect, select
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.ext.mutable import MutableList
 from sqlalchemy.ext.orderinglist import ordering_list
-from sqlalchemy.orm import Mapped, deferred, mapped_column, relationship, with_parent
+from sqlalchemy.orm import (
+    Mapped,
+    WriteOnlyMapped,
+    mapped_column,
+    object_session,
+    relationship,
+    with_parent,
+)
 
 from app.db.base_class import Base
-from app.db.pydantic_data_type import PydanticListType
 
 from .test_enums import TestStateEnum
+from .test_run_log_entry import TestRunLogEntry as TestRunLogEntryRecord
 from .test_suite_execution import TestSuiteExecution
 
 if TYPE_CHECKING:
@@ -33,6 +40,9 @@ if TYPE_CHECKING:
     from .project import Project  # noqa: F401
     from .test_run_config import TestRunConfig  # noqa: F401
 
+# Number of log entries fetched at a time when iterating the log of a test run
+LOG_CHUNK_SIZE = 1000
+
 
 class TestRunExecution(Base):
     # Import pydantic schema here to avoid circular import issues
@@ -60,12 +70,14 @@ class TestRunExecution(Base):
     test_run_config: Mapped["TestRunConfig"] = relationship(
         "TestRunConfig", back_populates="test_run_executions"
     )
-    log: Mapped[list[TestRunLogEntry]] = deferred(
-        mapped_column(
-            MutableList.as_mutable(PydanticListType(TestRunLogEntry)),
-            default=[],
-            nullable=False,
-        )
+    # Log entries are append-only, the collection is never loaded as a whole.
+    # Use `log` to read the entries.
+    log_entries: WriteOnlyMapped[TestRunLogEntryRecord] = relationship(
+        TestRunLogEntryRecord,
+        back_populates="test_run_execution",
+        order_by=TestRunLogEntryRecord.sequence_number,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     test_suite_executions: Mapped[list["TestSuiteExecution"]] = relationship(
@@ -87,8 +99,113 @@ class TestRunExecution(Base):
         "Project", back_populates="test_run_executions"
     )
 
+    def __init__(self, log: Optional[list] = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        if log is not None:
+            self.log = log
+
+    @property
+    def log(self) -> list[TestRunLogEntry]:
+        """All log entries of the test run, in the order they were appended."""
+        return list(self.iter_log())
+
+    @log.setter
+    def log(self, log_records: list) -> None:
+        """Set the initial log of a test run that is not stored yet.
+
+        The log of a stored test run can only be appended to, see `extend_log`.
+        """
+        self.log_entries = [
+            self.__log_entry_record(log_record, sequence_number)
+            for sequence_number, log_record in enumerate(
+                self.__parse_log_records(log_records)
+            )
+        ]
+
+    def iter_log(
+        self, chunk_size: int = LOG_CHUNK_SIZE, since: int = 0
+    ) -> Iterator[TestRunLogEntry]:
+        """Iterate the log entries of the test run, in the order they were appended.
+
+        Stored entries are fetched `chunk_size` at a time through a server-side cursor,
+        so the log is never loaded as a whole. Entries pending insert follow the stored
+        ones, the session is not flushed.
+
+        Only entries with a sequence number from `since` are included, the stored ones
+        are looked up by sequence number.
+        """
+        stored_log_entries: Iterable[TestRunLogEntryRecord] = ()
+        if (session := object_session(self)) is not None and inspect(self).has_identity:
+            stored_log_entries = session.scalars(
+                self.log_entries.select()
+                .where(TestRunLogEntryRecord.sequence_number >= since)
+                .execution_options(yield_per=chunk_size)
+            )
+        pending_log_entries = (
+            log_entry
+            for log_entry in inspect(self).attrs.log_entries.history.added
+            if log_entry.sequence_number >= since
+        )
+
+        for log_entry in chain(stored_log_entries, pending_log_entries):
+            yield self.TestRunLogEntry.from_orm(log_entry)
+
+    def __parse_log_records(
+        self, log_records: Iterable[Any]
+    ) -> Iterator[TestRunLogEntry]:
+        for log_record in log_records:
+            if isinstance(log_record, self.TestRunLogEntry):
+                yield log_record
+            else:
+                yield self.TestRunLogEntry.parse_obj(log_record)
+
     def append_to_log(self, log_record: "TestRunLogEntry") -> None:
-        self.log.append(log_record)
+        self.extend_log([log_record])
+
+    def extend_log(self, log_records: Sequence["TestRunLogEntry"]) -> None:
+        """Append log entries to the test run log.
+
+        Only the new entries are inserted when the session is flushed, the existing
+        log is neither loaded nor rewritten.
+
+        Entries keep their sequence number when they have one, e.g. when numbered by
+        the test engine, otherwise they're numbered after the last entry of the log.
+        """
+        next_sequence_number: Optional[int] = None
+        log_entry_records = []
+        for log_record in log_records:
+            sequence_number = log_record.sequence_number
+            if sequence_number is None:
+                if next_sequence_number is None:
+                    next_sequence_number = self.__next_sequence_number()
+                sequence_number = next_sequence_number
+            next_sequence_number = sequence_number + 1
+            log_entry_records.append(
+                self.__log_entry_record(log_record, sequence_number)
+            )
+        self.log_entries.add_all(log_entry_records)
+
+    def __next_sequence_number(self) -> int:
+        if pending_log_entries := inspect(self).attrs.log_entries.history.added:
+            return pending_log_entries[-1].sequence_number + 1
+
+        if (session := object_session(self)) is None or not inspect(self).has_identity:
+            return 0
+        last_sequence_number = session.scalar(
+            select(func.max(TestRunLogEntryRecord.sequence_number)).where(
+                TestRunLogEntryRecord.test_run_execution_id == self.id
+            )
+        )
+        return 0 if last_sequence_number is None else last_sequence_number + 1
+
+    @staticmethod
+    def __log_entry_record(
+        log_record: "TestRunLogEntry", sequence_number: int
+    ) -> TestRunLogEntryRecord:
+        return TestRunLogEntryRecord(
+            **log_record.dict(exclude={"sequence_number"}),
+            sequence_number=sequence_number,
+        )
 
     def test_suite_execution_by_public_id(
         self, public_id: str
@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base_class import Base
+
+if TYPE_CHECKING:
+    from .test_run_execution import TestRunExecution  # noqa: F401
+
+
+class TestRunLogEntry(Base):
+    """A single log line of a test run.
+
+    Log entries are stored one per row, so appending to the log of a running test run
+    only inserts the new entries instead of rewriting the whole log.
+    """
+
+    __test__ = False  # Needed to indicate to PyTest that this is not a "test"
+    __table_args__ = (
+        # Entries are looked up by their position in the log of a test run
+        Index(
+            "ix_testrunlogentry_test_run_execution_id_sequence_number",
+            "test_run_execution_id",
+            "sequence_number",
+            unique=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    # Position of the entry in the test run log, starting at 0
+    sequence_number: Mapped[int] = mapped_column(nullable=False)
+    level: Mapped[str] = mapped_column(nullable=False)
+    timestamp: Mapped[float] = mapped_column(nullable=False)
+    message: Mapped[str] = mapped_column(nullable=False)
+    test_suite_execution_index: Mapped[Optional[int]]
+    test_case_execution_index: Mapped[Optional[int]]
+    test_step_execution_index: Mapped[Optional[int]]
+
+    test_run_execution_id: Mapped[int] = mapped_column(
+        ForeignKey("testrunexecution.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    test_run_execution: Mapped["TestRunExecution"] = relationship(
+        "TestRunExecution", back_populates="log_entries"
+    )
@@ -27,3 +27,8 @@ class TestRunLogEntry(BaseModel):
     test_suite_execution_index: Optional[int]
     test_case_execution_index: Optional[int]
     test_step_execution_index: Optional[int]
+    # Position of the entry in the test run log, starting at 0
+    sequence_number: Optional[int] = None
+
+    class Config:
+        orm_mode = True
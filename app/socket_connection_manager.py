@@ -13,9 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import json
+from collections import OrderedDict
 from json import JSONDecodeError
-from typing import Callable, Dict, List, Union
+from typing import Callable, Dict, Hashable, Optional, Union
 
 import pydantic
 from fastapi import WebSocket
@@ -24,6 +26,7 @@ from starlette.websockets import WebSocketState
 from websockets.exceptions import ConnectionClosedOK
 
 from app.constants.websockets_constants import (
+    COMPACT_JSON_SUBPROTOCOL,
     INVALID_JSON_ERROR_STR,
     MISSING_TYPE_ERROR_STR,
     NO_HANDLER_FOR_MSG_ERROR_STR,
@@ -34,6 +37,138 @@ from app.singleton import Singleton
 
 SocketMessageHander = Callable[[Dict, WebSocket], None]
 
+# Max number of messages waiting to be sent to a single connection. When a client is
+# not able to keep up, its oldest pending messages are dropped.
+SEND_QUEUE_MAX_SIZE = 1000
+
+# Seconds without any message sent to a connection before a heartbeat is sent, so
+# clients can tell an idle connection from a stalled one
+HEARTBEAT_INTERVAL = 30.0
+
+HEARTBEAT_MESSAGE = {MessageKeysEnum.TYPE: MessageTypeEnum.HEARTBEAT}
+
+# JSON item separators, for each of the message formats
+JSON_SEPARATORS = (", ", ": ")
+COMPACT_JSON_SEPARATORS = (",", ":")
+
+
+class SocketConnection(object):
+    """
+    An active socket connection, with a bounded queue of messages waiting to be sent.
+
+    Messages are sent by a writer task, so queueing a message never waits on the
+    client. A pending message is replaced when a message with the same merge key is
+    queued, so slow clients only get the latest of those updates.
+
+    Clients requesting the compact JSON subprotocol get messages without whitespace.
+
+    A heartbeat message is sent when no other message was sent for a while. Sending
+    it also detects connections that are no longer alive.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue_size: int = SEND_QUEUE_MAX_SIZE,
+        compact: bool = False,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+    ) -> None:
+        self.websocket = websocket
+        self.compact = compact
+        self.heartbeat_interval = heartbeat_interval
+        self.max_queue_size = max_queue_size
+        self.dropped_messages = 0
+        self.closed = False
+        self.__pending: OrderedDict[Hashable, str] = OrderedDict()
+        self.__has_pending = asyncio.Event()
+        self.__sent = asyncio.Event()
+        self.__sent.set()
+        self.__writer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self.__writer = asyncio.create_task(self.__send_pending())
+
+    def stop(self) -> None:
+        if self.__writer is not None:
+            self.__writer.cancel()
+        self.__close()
+
+    def send_nowait(self, message: str, merge_key: Optional[Hashable] = None) -> None:
+        if self.closed:
+            return
+
+        if merge_key is None:
+            # Messages without merge key are never replaced
+            merge_key = object()
+        else:
+            # Move the replaced message to the end of the queue
+            self.__pending.pop(merge_key, None)
+        self.__pending[merge_key] = message
+
+        if len(self.__pending) > self.max_queue_size:
+            self.__pending.popitem(last=False)
+            if self.dropped_messages == 0:
+                logger.warning(
+                    f'Socket "{self.websocket}" is not keeping up, '
+                    "dropping its oldest pending messages."
+                )
+            self.dropped_messages += 1
+
+        self.__sent.clear()
+        self.__has_pending.set()
+
+    async def join(self) -> None:
+        """Wait until all pending messages are sent, or the connection is closed."""
+        await self.__sent.wait()
+
+    async def __send_pending(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+            heartbeat_message = json.dumps(
+                HEARTBEAT_MESSAGE,
+                separators=COMPACT_JSON_SEPARATORS if self.compact else JSON_SEPARATORS,
+            )
+            while True:
+                # A timer handle is much cheaper than waiting with a timeout, which
+                # wraps the wait in a new task every time
+                heartbeat = loop.call_later(
+                    self.heartbeat_interval,
+                    self.send_nowait,
+                    heartbeat_message,
+                    MessageTypeEnum.HEARTBEAT,
+                )
+                try:
+                    await self.__has_pending.wait()
+                finally:
+                    heartbeat.cancel()
+                self.__has_pending.clear()
+                while self.__pending:
+                    _, message = self.__pending.popitem(last=False)
+                    await self.websocket.send_text(message)
+                self.__sent.set()
+        except asyncio.CancelledError:
+            pass
+        # Starlette raises websockets.exceptions.ConnectionClosedOK when trying to
+        # send to a closed socket. https://github.com/encode/starlette/issues/759
+        except ConnectionClosedOK:
+            if self.websocket.application_state != WebSocketState.DISCONNECTED:
+                await self.websocket.close()
+            logger.warning(
+                f'Failed to send message to socket: "{self.websocket}", '
+                "connection closed."
+            )
+        except RuntimeError as e:
+            logger.warning(
+                f'Failed to send message to socket: "{self.websocket}". Error: "{e}"'
+            )
+        finally:
+            self.__close()
+
+    def __close(self) -> None:
+        self.closed = True
+        self.__pending.clear()
+        self.__sent.set()
+
 
 # SocketConnectionManager manages and maintains all the active socket connections
 # communicating with the tool:
@@ -43,21 +178,28 @@ SocketMessageHander = Callable[[Dict, WebSocket], None]
 #   - Allows broadcasting as well sending personal messages to all or single client
 class SocketConnectionManager(object, metaclass=Singleton):
     def __init__(self) -> None:
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Dict[WebSocket, SocketConnection] = {}
         self.__message_handlers: Dict[MessageTypeEnum, SocketMessageHander] = {}
 
     async def connect(self, websocket: WebSocket) -> None:
         try:
-            await websocket.accept()
+            # Subprotocols requested by the client, from the connection scope
+            compact = COMPACT_JSON_SUBPROTOCOL in websocket.get("subprotocols", [])
+            await websocket.accept(
+                subprotocol=COMPACT_JSON_SUBPROTOCOL if compact else None
+            )
             logger.info(f'Websocket connected: "{websocket}".')
-            self.active_connections.append(websocket)
+            connection = SocketConnection(websocket, compact=compact)
+            connection.start()
+            self.active_connections[websocket] = connection
         except RuntimeError as e:
             logger.info(f'Failed to connect with error: "{e}".')
             raise e
 
     def disconnect(self, websocket: WebSocket) -> None:
         logger.info(f'Websocket disconnected: "{websocket}".')
-        self.active_connections.remove(websocket)
+        connection = self.active_connections.pop(websocket)
+        connection.stop()
 
     async def send_personal_message(
         self, message: Union[str, dict, list], websocket: WebSocket
@@ -67,28 +209,51 @@ class SocketConnectionManager(object, metaclass=Singleton):
             message = json.dumps(message)
         await websocket.send_text(message)
 
-    async def broadcast(self, message: Union[str, dict, list]) -> None:
-        # Convert dictionaries and lists to string using json
-        if isinstance(message, dict) or isinstance(message, list):
-            message = json.dumps(message, default=pydantic.json.pydantic_encoder)
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            # Starlette raises websockets.exceptions.ConnectionClosedOK when trying to
-            # send to a closed socket. https://github.com/encode/starlette/issues/759
-            except ConnectionClosedOK:
-                if connection.application_state != WebSocketState.DISCONNECTED:
-                    await connection.close()
-                logger.warning(
-                    f'Failed to send message: "{message}" to socket: "{connection}",'
-                    "connection closed."
-                )
-            except RuntimeError as e:
-                logger.warning(
-                    f'Failed to send: "{message}" to socket: "{connection}."',
-                    'Error:"{e}"',
+    def send_personal_message_nowait(
+        self, message: Union[str, dict, list], websocket: WebSocket
+    ) -> None:
+        """Queue a message to a single active connection, after its pending messages."""
+        if (connection := self.active_connections.get(websocket)) is None:
+            return
+        connection.send_nowait(
+            message=self.__encode_message(message=message, compact=connection.compact)
+        )
+
+    async def broadcast(
+        self, message: Union[str, dict, list], merge_key: Optional[Hashable] = None
+    ) -> None:
+        self.broadcast_nowait(message=message, merge_key=merge_key)
+
+    def broadcast_nowait(
+        self, message: Union[str, dict, list], merge_key: Optional[Hashable] = None
+    ) -> None:
+        """
+        Queue a message to all active connections, without waiting for it to be sent.
+
+        The message is serialized once for each message format used by connections.
+        When a merge key is given, it replaces any message with the same merge key still
+        pending for a connection.
+        """
+        encoded_messages: Dict[bool, str] = {}
+        for connection in self.active_connections.values():
+            if connection.compact not in encoded_messages:
+                encoded_messages[connection.compact] = self.__encode_message(
+                    message=message, compact=connection.compact
                 )
-                raise e
+            connection.send_nowait(
+                message=encoded_messages[connection.compact], merge_key=merge_key
+            )
+
+    def __encode_message(self, message: Union[str, dict, list], compact: bool) -> str:
+        if isinstance(message, str):
+            return message
+
+        # Convert dictionaries and lists to string using json
+        return json.dumps(
+            message,
+            default=pydantic.json.pydantic_encoder,
+            separators=COMPACT_JSON_SEPARATORS if compact else JSON_SEPARATORS,
+        )
 
     async def received_message(self, socket: WebSocket, message: str) -> None:
         try:
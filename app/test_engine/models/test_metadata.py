@@ -13,7 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from typing import TypedDict
+import hashlib
+import json
+from typing import Any, Mapping, TypedDict
+
+# Metadata fields describing the content of a test version
+SOURCE_HASH_FIELDS = ("public_id", "version", "title", "description", "mandatory")
 
 
 class TestMetadata(TypedDict):
@@ -21,3 +26,14 @@ class TestMetadata(TypedDict):
     version: str
     title: str
     description: str
+
+
+def metadata_source_hash(metadata: Mapping[str, Any]) -> str:
+    """
+    Compute the source hash of a test's metadata, a sha256 hex digest of the fields
+    describing the test. The same test version always gets the same hash.
+    """
+    content = {"mandatory": False, **metadata}
+    fields = {field: content.get(field) for field in SOURCE_HASH_FIELDS}
+    payload = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
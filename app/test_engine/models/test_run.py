@@ -166,6 +166,8 @@ class TestRun(TestObservable, UserPromptSupport):
             test_suite.cancel()
 
     def append_log_entries(self, entries: list[TestRunLogEntry]) -> None:
+        for sequence_number, entry in enumerate(entries, start=len(self.log)):
+            entry.sequence_number = sequence_number
         self.log.extend(entries)
         self.notify()
 
@@ -13,9 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+from asyncio import CancelledError, Task
+from collections import defaultdict
 from datetime import datetime
-from queue import Empty, Queue
-from typing import Callable, Generator, Union
+from typing import Callable, Generator, Optional, Union
 
 from loguru import logger
 from sqlalchemy import inspect
@@ -30,23 +32,132 @@ from app.models.test_suite_execution import TestSuiteExecution
 from app.test_engine.models import TestCase, TestRun, TestStep, TestSuite
 from app.test_engine.test_observer import Observer
 
+DB_FLUSH_INTERVAL = 1.0
+
+ExecutionObject = Union[
+    TestCaseExecution, TestStepExecution, TestSuiteExecution, TestRunExecution
+]
+ObservableModel = Union[TestRun, TestSuite, TestCase, TestStep]
+
 
 class TestDBObserver(Observer):
+    """Responsible for persisting the state of a Test Run.
+
+    Updated execution objects are kept as pending until the next flush. Several
+    updates of the same object are coalesced, and all pending objects are committed
+    together, in a single transaction per DB session.
+
+    Once started, pending updates are flushed periodically, so at most one flush
+    interval of state is lost if the backend stops during a test run. If a commit
+    fails, its updates are rolled back and applied again on the next flush.
+    """
+
     __test__ = False  # Needed to indicate to PyTest that this is not a "test"
 
     def __init__(
         self, db_generator: Callable[[], Generator[Session, None, None]] = get_db
     ) -> None:
         self.__db_generator = db_generator
-        self.data_queue: Queue = Queue()
+        # Pending execution objects and the models they were updated from, keyed by
+        # object identity to coalesce updates
+        self.__pending_updates: dict[int, tuple[ExecutionObject, ObservableModel]] = {}
+        # Models whose updates were rolled back after a failed commit
+        self.__failed_updates: dict[int, ObservableModel] = {}
+        # Number of log entries added to the session and committed to the DB
+        self.__persisted_log_len = 0
+        self.__committed_log_len = 0
+        self.__flush_task: Optional[Task] = None
+        self.__flush_interval_in_sec = DB_FLUSH_INTERVAL
+
+    def start(self) -> None:
+        """Start flushing pending updates periodically."""
+        self.__flush_task = asyncio.create_task(self.__periodically_apply_updates())
+
+    async def finish(self) -> None:
+        """Cancel the periodic flush and flush remaining updates."""
+        if self.__flush_task is not None:
+            self.__flush_task.cancel()
+            await self.__flush_task
+            self.__flush_task = None
+
+        self.apply_updates()
 
     def apply_updates(self) -> None:
-        while not self.data_queue.empty():
+        """Commit all pending updates.
+
+        Updates are committed in a transaction per DB session. When a commit fails,
+        that session is rolled back and its updates are applied again on the next
+        call, before the error is raised.
+        """
+        self.__reapply_failed_updates()
+        if not self.__pending_updates:
+            return
+
+        pending_updates = self.__pending_updates
+        self.__pending_updates = {}
+
+        sessions: dict[int, Session] = {}
+        session_updates: dict[int, dict[int, ObservableModel]] = defaultdict(dict)
+        for key, (execution_obj, observable) in pending_updates.items():
+            session = self.__session(execution_obj)
+            sessions[id(session)] = session
+            session_updates[id(session)][key] = observable
+
+        error: Optional[Exception] = None
+        for session_id, session in sessions.items():
             try:
-                data = self.data_queue.get(timeout=0.1)
-                self.__save(data)
-            except Empty:
-                pass
+                self.__commit(session)
+            except Exception as e:
+                session.rollback()
+                failed_updates = session_updates[session_id]
+                self.__failed_updates.update(failed_updates)
+                if any(isinstance(o, TestRun) for o in failed_updates.values()):
+                    # New log entries were rolled back with the test run execution
+                    self.__persisted_log_len = self.__committed_log_len
+                error = e
+
+        self.__committed_log_len = self.__persisted_log_len
+        if error is not None:
+            raise error
+
+        logger.debug(f"Saved {len(pending_updates)} execution updates")
+
+    def __reapply_failed_updates(self) -> None:
+        failed_updates = self.__failed_updates
+        self.__failed_updates = {}
+        try:
+            for observable in failed_updates.values():
+                self.dispatch(observable)
+        except Exception:
+            self.__failed_updates = failed_updates
+            raise
+
+    @staticmethod
+    def __commit(session: Session) -> None:
+        # Keep the committed objects loaded, they are read by the test run as it
+        # progresses
+        expire_on_commit = session.expire_on_commit
+        session.expire_on_commit = False
+        try:
+            session.commit()
+        finally:
+            session.expire_on_commit = expire_on_commit
+
+    async def __periodically_apply_updates(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self.__flush_interval_in_sec)
+                try:
+                    self.apply_updates()
+                except Exception as e:
+                    logger.error(f"Failed to save test run updates: {e}")
+        except CancelledError:
+            pass
+
+    def __queue_update(
+        self, execution_obj: ExecutionObject, observable: ObservableModel
+    ) -> None:
+        self.__pending_updates[id(execution_obj)] = (execution_obj, observable)
 
     def dispatch(
         self, observable: Union[TestRun, TestSuite, TestCase, TestStep]
@@ -66,7 +177,12 @@ class TestDBObserver(Observer):
         logger.debug("Test Run Observer received", observable)
         test_run_execution = observable.test_run_execution
         test_run_execution.state = observable.state
-        test_run_execution.log = observable.log
+
+        # Only append the log entries added since the previous update
+        new_log_entries = observable.log[self.__persisted_log_len :]
+        if new_log_entries:
+            test_run_execution.extend_log(new_log_entries)
+            self.__persisted_log_len += len(new_log_entries)
 
         if test_run_execution.started_at is None:
             test_run_execution.started_at = datetime.now()
@@ -74,7 +190,7 @@ class TestDBObserver(Observer):
         if self.isCompleted(observable.state):
             test_run_execution.completed_at = datetime.now()
 
-        self.data_queue.put(test_run_execution)
+        self.__queue_update(test_run_execution, observable)
 
     def __onTestSuiteUpdate(self, observable: "TestSuite") -> None:
         logger.debug("Test Suite Observer received", observable)
@@ -89,7 +205,7 @@ class TestDBObserver(Observer):
             if self.isCompleted(observable.state):
                 observable.test_suite_execution.completed_at = datetime.now()
 
-            self.data_queue.put(observable.test_suite_execution)
+            self.__queue_update(observable.test_suite_execution, observable)
 
     def __onTestCaseUpdate(self, observable: "TestCase") -> None:
         logger.debug("Test Case Observer received", observable)
@@ -104,7 +220,7 @@ class TestDBObserver(Observer):
             if self.isCompleted(observable.state):
                 observable.test_case_execution.completed_at = datetime.now()
 
-            self.data_queue.put(observable.test_case_execution)
+            self.__queue_update(observable.test_case_execution, observable)
 
     def __onTestStepUpdate(self, observable: "TestStep") -> None:
         logger.debug("Test Step Observer received", observable)
@@ -121,14 +237,9 @@ class TestDBObserver(Observer):
             if self.isCompleted(observable.state):
                 observable.test_step_execution.completed_at = datetime.now()
 
-            self.data_queue.put(observable.test_step_execution)
+            self.__queue_update(observable.test_step_execution, observable)
 
-    def __save(
-        self,
-        execution_obj: Union[
-            TestCaseExecution, TestStepExecution, TestSuiteExecution, TestRunExecution
-        ],
-    ) -> None:
+    def __session(self, execution_obj: ExecutionObject) -> Session:
         # We get the session from the model it self to avoid overriding values when
         # using a different session
         insp = inspect(execution_obj)
@@ -138,12 +249,7 @@ class TestDBObserver(Observer):
             )
             session = next(self.__db_generator())
             session.add(execution_obj)
-        session.expire_on_commit = False
-        session.commit()
-        logger.debug(
-            f"Saved {execution_obj.__class__} {execution_obj.id}"
-            f" with state {execution_obj.state}"
-        )
+        return session
 
     @staticmethod
     def isCompleted(state: TestStateEnum) -> bool:
@@ -17,17 +17,47 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from asyncio import CancelledError, Task
-from typing import Optional
+from collections import deque
+from enum import Enum
+from typing import NamedTuple, Optional
 
 import loguru  # this is needed (with __future__ annotations)
 from loguru import logger
 
 from app.schemas.test_run_log_entry import TestRunLogEntry
-from app.test_engine.models import TestCase, TestRun, TestStep, TestSuite
+from app.test_engine.models import TestRun
 
+# Max seconds a log record waits before it is processed
 LOG_PROCESSING_INTERVAL = 0.5
 
+# Pending log records are processed without waiting for the processing interval,
+# once there are this many of them or their messages reach this many bytes. This
+# is also the max number of records processed at once.
+LOG_FLUSH_MAX_ENTRIES = 1000
+LOG_FLUSH_MAX_BYTES = 256 * 1024
+
+# Max number of log records waiting to be processed. When the test run logs faster
+# than the records are processed, the oldest pending records are dropped, and a
+# warning with the number of dropped records is added to the test run log instead.
+LOG_BUFFER_MAX_SIZE = 50000
+
+
+class _PendingLogRecord(NamedTuple):
+    level: str
+    timestamp: float
+    message: str
+    test_suite_execution_index: Optional[int]
+    test_case_execution_index: Optional[int]
+    test_step_execution_index: Optional[int]
+
+
+class _FlushState(Enum):
+    IDLE = 0  # No pending records, the processing task is not woken up
+    COLLECTING = 1  # Waiting for the processing interval to elapse
+    FLUSHING = 2  # A threshold is reached, processing without waiting
+
 
 class TestLogHandler:
     """Responsible for attaching log messages to a Test Run.
@@ -37,15 +67,45 @@ class TestLogHandler:
     the extra data). The log messages are annotated with current test_suite and
     test_case.
 
-    We're putting the annotated messages on a queue, that is processed periodically.
-    This is done to avoid the DB and UI being spammed with updates.
+    We're putting the annotated messages in a bounded buffer, that is processed in
+    batches. This is done to avoid the DB and UI being spammed with updates.
+
+    The logger sink can run on any thread, so it only appends plain records to a
+    deque, which is thread-safe for appending and popping. The log entries are
+    created when the records are processed.
+
+    The processing task is only woken up when a record is logged while none are
+    pending. It then processes the pending records after the processing interval, or
+    as soon as there are enough of them, so bursts of log messages are processed in
+    batches of bounded size.
     """
 
     __test__ = False  # Needed to indicate to PyTest that this is not a "test"
 
-    def __init__(self, test_run: TestRun) -> None:
+    def __init__(
+        self, test_run: TestRun, max_pending_entries: int = LOG_BUFFER_MAX_SIZE
+    ) -> None:
         self.__test_run: TestRun = test_run
-        self.__pending_log_entries: list[TestRunLogEntry] = []
+        self.__pending_log_entries: deque[_PendingLogRecord] = deque(
+            maxlen=max_pending_entries
+        )
+        # Approximate size of the pending messages, used for the byte threshold
+        self.__pending_bytes = 0
+        self.__flush_state = _FlushState.IDLE
+        # time.monotonic() when the oldest pending record was logged
+        self.__first_pending_time = 0.0
+        self.__loop = asyncio.get_running_loop()
+        self.__wake_up = asyncio.Event()
+
+        # Metrics
+        self.dropped_log_entries = 0
+        self.__reported_dropped_log_entries = 0
+        self.max_queue_depth = 0
+        self.flush_count = 0
+        # Seconds between logging the oldest record of the last batch and processing it
+        self.last_flush_latency = 0.0
+        self.max_flush_latency = 0.0
+
         self.__logger_sink_id = self.__subscribe_to_test_run_log_messages()
         self.__process_entries_task: Task = asyncio.create_task(
             self.__periodically_process_entries()
@@ -53,40 +113,26 @@ class TestLogHandler:
         self.__process_interval_in_sec = LOG_PROCESSING_INTERVAL
 
     @property
-    def __current_test_suite(self) -> Optional[TestSuite]:
-        return self.__test_run.current_test_suite
-
-    @property
-    def __current_test_case(self) -> Optional[TestCase]:
-        if self.__current_test_suite is None:
-            return None
-        return self.__current_test_suite.current_test_case
-
-    @property
-    def __current_test_step(self) -> Optional[TestStep]:
-        if (test_case := self.__current_test_case) is None:
-            return None
-        return test_case.current_test_step
+    def queue_depth(self) -> int:
+        """Number of log records waiting to be processed."""
+        return len(self.__pending_log_entries)
 
-    @property
-    def __current_test_suite_index(self) -> Optional[int]:
-        if (test_suite := self.__current_test_suite) is None:
-            return None
-        return test_suite.test_suite_execution.execution_index
+    def __current_execution_indexes(
+        self,
+    ) -> tuple[Optional[int], Optional[int], Optional[int]]:
+        """Execution indexes of the current test suite, test case and test step."""
+        if (test_suite := self.__test_run.current_test_suite) is None:
+            return None, None, None
+        test_suite_index = test_suite.test_suite_execution.execution_index
 
-    @property
-    def __current_test_case_index(self) -> Optional[int]:
-        if (test_case := self.__current_test_case) is None:
-            return None
-        return test_case.test_case_execution.execution_index
+        if (test_case := test_suite.current_test_case) is None:
+            return test_suite_index, None, None
+        test_case_index = test_case.test_case_execution.execution_index
 
-    @property
-    def __current_test_step_index(self) -> Optional[int]:
-        if (test_step := self.__current_test_step) is None:
-            return None
-        if (test_step_execution := test_step.test_step_execution) is None:
-            return None
-        return test_step_execution.execution_index
+        test_step_execution = test_case.current_test_step.test_step_execution
+        if test_step_execution is None:
+            return test_suite_index, test_case_index, None
+        return test_suite_index, test_case_index, test_step_execution.execution_index
 
     async def finish(self) -> None:
         """Cancel the processing task and process remaining entries."""
@@ -95,7 +141,15 @@ class TestLogHandler:
         self.__process_entries_task.cancel()
         await self.__process_entries_task
 
-        await self.__process_pending_entries()
+        while self.__pending_log_entries:
+            await self.__process_pending_entries()
+
+        logger.debug(
+            f"Test run log processed in {self.flush_count} batches, "
+            f"max queue depth: {self.max_queue_depth}, "
+            f"max latency: {self.max_flush_latency:.3f}s, "
+            f"dropped entries: {self.dropped_log_entries}"
+        )
 
     def __subscribe_to_test_run_log_messages(self) -> int:
         """Add a logger sink for log messages, logged via the test_engine_logger.
@@ -115,46 +169,120 @@ class TestLogHandler:
     def __handle_test_run_log_message(self, message: loguru.Message) -> None:
         """Handles log messages, logged via test_engine_logger.
 
-        Creates a test run log entry, associates all messages with current test suite
-        and test case.
+        Creates a pending log record, associates all messages with current test suite,
+        test case and test step.
 
-        The log entry is added to the queue of pending entries, to be handled by the
-        scheduled proccessing task.
+        The record is added to the buffer of pending entries, and the processing task
+        is woken up when needed. Loguru doesn't call a sink concurrently, so updating
+        the counters here is safe.
 
         Args:
             message (Message): log message from loguru
         """
-        log_entry = TestRunLogEntry(
-            level=message.record["level"].name,
-            timestamp=message.record["time"].timestamp(),
-            message=message.record["message"],
-            test_suite_execution_index=self.__current_test_suite_index,
-            test_case_execution_index=self.__current_test_case_index,
-            test_step_execution_index=self.__current_test_step_index,
+        record = message.record
+        pending_log_entries = self.__pending_log_entries
+        if len(pending_log_entries) == pending_log_entries.maxlen:
+            # Appending to a full buffer drops its oldest record
+            self.dropped_log_entries += 1
+        pending_log_entries.append(
+            _PendingLogRecord(
+                record["level"].name,
+                record["time"].timestamp(),
+                record["message"],
+                *self.__current_execution_indexes(),
+            )
         )
-        self.__pending_log_entries.append(log_entry)
+        self.__pending_bytes += len(record["message"])
+
+        queue_depth = len(pending_log_entries)
+        if queue_depth > self.max_queue_depth:
+            self.max_queue_depth = queue_depth
+
+        if self.__flush_state is _FlushState.IDLE:
+            self.__flush_state = _FlushState.COLLECTING
+            self.__first_pending_time = time.monotonic()
+            self.__wake_up_threadsafe()
+        elif self.__flush_state is _FlushState.COLLECTING and (
+            queue_depth >= LOG_FLUSH_MAX_ENTRIES
+            or self.__pending_bytes >= LOG_FLUSH_MAX_BYTES
+        ):
+            self.__flush_state = _FlushState.FLUSHING
+            self.__wake_up_threadsafe()
+
+    def __wake_up_threadsafe(self) -> None:
+        # Loguru might call the sink from a different thread than the event loop's
+        if not self.__loop.is_closed():
+            self.__loop.call_soon_threadsafe(self.__wake_up.set)
 
     async def __periodically_process_entries(self) -> None:
-        """This will process the pending entries at a pre-defined interval."""
+        """Process the pending entries in batches, whenever there are any."""
         try:
             while True:
-                await asyncio.gather(
-                    self.__process_pending_entries(),
-                    asyncio.sleep(self.__process_interval_in_sec),
-                )
+                # Wait without any wake ups until a record is logged
+                await self.__wake_up.wait()
+                self.__wake_up.clear()
+
+                if self.__flush_state is _FlushState.COLLECTING:
+                    # Collect records until the oldest one waited for the processing
+                    # interval, or until a threshold is reached
+                    delay = (
+                        self.__first_pending_time
+                        + self.__process_interval_in_sec
+                        - time.monotonic()
+                    )
+                    timer = self.__loop.call_later(max(delay, 0), self.__wake_up.set)
+                    try:
+                        await self.__wake_up.wait()
+                    finally:
+                        timer.cancel()
+                    self.__wake_up.clear()
+
+                await self.__process_pending_entries()
         except CancelledError:
             pass
 
+    def __dropped_log_entries_warning(self) -> Optional[TestRunLogEntry]:
+        """Log entry marking where log records were dropped since the last batch."""
+        dropped_count = self.dropped_log_entries - self.__reported_dropped_log_entries
+        if dropped_count == 0:
+            return None
+        self.__reported_dropped_log_entries = self.dropped_log_entries
+
+        message = (
+            f"Test run log is not keeping up, dropped {dropped_count} log entries "
+            f"({self.dropped_log_entries} so far)."
+        )
+        logger.warning(message)
+        return TestRunLogEntry(level="WARNING", timestamp=time.time(), message=message)
+
     async def __process_pending_entries(self) -> None:
-        if len(self.__pending_log_entries) == 0:
-            return
+        dropped_log_entries_warning = self.__dropped_log_entries_warning()
+
+        # Reset the state before taking the pending records, so records logged on a
+        # different thread in the meantime wake up the processing task again.
+        first_pending_time = self.__first_pending_time
+        self.__pending_bytes = 0
+        self.__flush_state = _FlushState.IDLE
 
-        # test_run.append_log_entries will cause updating UI/DB so there's a risk
-        # that new log entries are added during this call,
-        # causing entries to be missed. Thus, using a copy and resetting pending.
-        # This is an issue as loguru runs `__handle_test_run_log_message` on
-        # a different thread.
-        entries = self.__pending_log_entries
-        self.__pending_log_entries = []
+        pending_count = min(len(self.__pending_log_entries), LOG_FLUSH_MAX_ENTRIES)
+        if pending_count == 0:
+            if dropped_log_entries_warning is not None:
+                self.__test_run.append_log_entries([dropped_log_entries_warning])
+            return
 
+        popleft = self.__pending_log_entries.popleft
+        entries = [TestRunLogEntry(**popleft()._asdict()) for _ in range(pending_count)]
+        if dropped_log_entries_warning is not None:
+            # The dropped records were logged right before the oldest pending one
+            dropped_log_entries_warning.timestamp = entries[0].timestamp
+            entries.insert(0, dropped_log_entries_warning)
         self.__test_run.append_log_entries(entries)
+
+        self.flush_count += 1
+        self.last_flush_latency = time.monotonic() - first_pending_time
+        self.max_flush_latency = max(self.max_flush_latency, self.last_flush_latency)
+
+        if self.__pending_log_entries:
+            # Records left from a burst are processed right away
+            self.__flush_state = _FlushState.FLUSHING
+            self.__wake_up.set()
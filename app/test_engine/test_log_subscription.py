@@ -0,0 +1,128 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from asyncio import Task
+from itertools import islice
+from typing import Iterable
+
+from fastapi import WebSocket
+from loguru import logger
+from pydantic import BaseModel, Field, ValidationError
+
+from app import crud
+from app.constants.websockets_constants import MessageKeysEnum, MessageTypeEnum
+from app.db.session import get_db
+from app.schemas.test_run_log_entry import TestRunLogEntry
+from app.singleton import Singleton
+from app.socket_connection_manager import socket_connection_manager
+from app.test_engine.test_runner import TestRunner
+
+# Max number of log entries in a single replayed log records message
+LOG_REPLAY_CHUNK_SIZE = 1000
+
+
+class TestLogSubscription(BaseModel):
+    __test__ = False  # Needed to indicate to PyTest that this is not a "test"
+
+    test_run_execution_id: int
+    # Sequence number of the first log entry to replay
+    since: int = Field(default=0, ge=0)
+
+
+class TestLogSubscriptionManager(object, metaclass=Singleton):
+    """Replays the log of a test run to clients subscribing to it.
+
+    Clients subscribe with the sequence number of the first log entry they are
+    missing, e.g. after reconnecting, and only get the entries from that number on.
+
+    The log of the running test run is replayed from memory, before any new entry is
+    sent. The log of other test runs is read from the DB.
+    """
+
+    __test__ = False  # Needed to indicate to PyTest that this is not a "test"
+
+    def __init__(self) -> None:
+        self.__replay_tasks: set[Task] = set()
+        socket_connection_manager.register_handler(
+            callback=self.received_message,
+            message_type=MessageTypeEnum.TEST_LOG_SUBSCRIBE,
+        )
+
+    def received_message(self, message_dict: dict, websocket: WebSocket) -> None:
+        try:
+            subscription = TestLogSubscription(**message_dict)
+        except ValidationError as error:
+            logger.info(error.json())
+            return
+
+        test_run = TestRunner().test_run
+        if (
+            test_run is not None
+            and test_run.test_run_execution.id == subscription.test_run_execution_id
+        ):
+            self.__send_log_entries(
+                websocket=websocket, log_entries=test_run.log[subscription.since :]
+            )
+            return
+
+        task = asyncio.create_task(
+            self.__replay_stored_log(websocket=websocket, subscription=subscription)
+        )
+        # Keep a reference to the task until it's done
+        self.__replay_tasks.add(task)
+        task.add_done_callback(self.__replay_tasks.discard)
+
+    async def __replay_stored_log(
+        self, websocket: WebSocket, subscription: TestLogSubscription
+    ) -> None:
+        log_entries = await asyncio.to_thread(
+            self.__stored_log_entries, subscription=subscription
+        )
+        self.__send_log_entries(websocket=websocket, log_entries=log_entries)
+
+    def __stored_log_entries(
+        self, subscription: TestLogSubscription
+    ) -> list[TestRunLogEntry]:
+        db_generator = get_db()
+        db = next(db_generator)
+        try:
+            test_run_execution = crud.test_run_execution.get(
+                db=db, id=subscription.test_run_execution_id
+            )
+            if test_run_execution is None:
+                logger.info(
+                    f"Test run execution {subscription.test_run_execution_id} not found"
+                )
+                return []
+            return list(test_run_execution.iter_log(since=subscription.since))
+        finally:
+            db_generator.close()
+
+    def __send_log_entries(
+        self, websocket: WebSocket, log_entries: Iterable[TestRunLogEntry]
+    ) -> None:
+        log_entries_iterator = iter(log_entries)
+        while chunk := list(islice(log_entries_iterator, LOG_REPLAY_CHUNK_SIZE)):
+            socket_connection_manager.send_personal_message_nowait(
+                message={
+                    MessageKeysEnum.TYPE: MessageTypeEnum.TEST_LOG_RECORDS,
+                    MessageKeysEnum.PAYLOAD: chunk,
+                },
+                websocket=websocket,
+            )
+
+
+test_log_subscription_manager = TestLogSubscriptionManager()
@@ -172,19 +172,23 @@ class TestRunner(object, metaclass=Singleton):
             db_observer = TestDBObserver(self.__db_generator)
 
             self.test_run.subscribe([ui_observer, db_observer])
-
-            await self.test_run.run()
-
-            # Ensure all log messages are sent out
-            await log_handler.finish()
-
-            self.test_run.unsubscribe([ui_observer, db_observer])
-
-            # Flush all pending DB updates
-            db_observer.apply_updates()
-
-            # Ensure all state updates are sent to the frontend
-            await ui_observer.complete_tasks()
+            ui_observer.start()
+            db_observer.start()
+
+            try:
+                await self.test_run.run()
+            finally:
+                # Ensure all log messages are sent out
+                await log_handler.finish()
+
+                self.test_run.unsubscribe([ui_observer, db_observer])
+
+                try:
+                    # Flush all pending DB updates
+                    await db_observer.finish()
+                finally:
+                    # Ensure all state updates are sent to the frontend
+                    await ui_observer.finish()
         except Exception as e:
             logger.error(e)
 
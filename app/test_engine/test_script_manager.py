@@ -13,8 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from typing import Dict, List, Type
+from threading import Lock
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar
 
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.models import (
@@ -40,11 +43,13 @@ from .models.test_declarations import (
     TestCollectionDeclaration,
     TestSuiteDeclaration,
 )
+from .models.test_metadata import SOURCE_HASH_FIELDS, metadata_source_hash
 from .test_collection_discovery import discover_test_collections
 
 # Type alias:
 TestSuiteClassType = Type[TestSuite]
 TestCaseClassType = Type[TestCase]
+MetadataModelType = TypeVar("MetadataModelType", TestCaseMetadata, TestSuiteMetadata)
 
 
 class TestNotFound(Exception):
@@ -66,16 +71,34 @@ class TestCaseNotFound(TestNotFound):
 class TestScriptManager(object, metaclass=Singleton):
     __test__ = False
 
-    test_collections: Dict[str, TestCollectionDeclaration]
-
     def __init__(self) -> None:
+        self.__test_collections: Optional[Dict[str, TestCollectionDeclaration]] = None
+        # Sync endpoints run in a thread pool, so discovery must only happen once
+        self.__test_collections_lock = Lock()
+        # Metadata ids, by metadata table and source hash
+        self.__metadata_ids: Dict[Tuple[str, str], int] = {}
+
+    @property
+    def test_collections(self) -> Dict[str, TestCollectionDeclaration]:
         """
         Dynamically discover test collections, ignoring internal test collections.
+
+        Discovery imports and parses every test collection, so it only happens the
+        first time the collections are needed instead of when this module is imported.
+        The app warms it on startup, so it isn't done during a request.
         """
-        self.test_collections = discover_test_collections()
+        if self.__test_collections is None:
+            with self.__test_collections_lock:
+                if self.__test_collections is None:
+                    self.__test_collections = discover_test_collections()
+        return self.__test_collections
+
+    @test_collections.setter
+    def test_collections(self, value: Dict[str, TestCollectionDeclaration]) -> None:
+        self.__test_collections = value
 
     def pending_test_suite_executions_for_selected_tests(
-        self, selected_tests: TestSelection
+        self, db: Session, selected_tests: TestSelection
     ) -> List[TestSuiteExecution]:
         """
         This will create and associate pending test suites and test cases, based on the
@@ -89,6 +112,7 @@ class TestScriptManager(object, metaclass=Singleton):
             test_collection = self.test_collections[test_collection_name]
 
             test_suites = self.__pending_test_suites_for_test_collection(
+                db=db,
                 test_collection=test_collection,
                 selected_test_suites=selected_tests[test_collection_name],
             )
@@ -98,6 +122,7 @@ class TestScriptManager(object, metaclass=Singleton):
 
     def __pending_test_suites_for_test_collection(
         self,
+        db: Session,
         test_collection: TestCollectionDeclaration,
         selected_test_suites: Dict[str, dict],
     ) -> List[TestSuiteExecution]:
@@ -114,11 +139,12 @@ class TestScriptManager(object, metaclass=Singleton):
 
             # Create pending test suite
             test_suite_execution = self.__pending_test_suite_execution(
-                test_suite, test_collection
+                db, test_suite, test_collection
             )
 
             # Create pending test cases
             test_cases = self.___pending_test_cases_for_test_suite(
+                db=db,
                 test_suite=test_suite,
                 selected_test_cases=selected_test_suites[test_suite_id],
             )
@@ -132,6 +158,7 @@ class TestScriptManager(object, metaclass=Singleton):
 
     def __pending_test_suite_execution(
         self,
+        db: Session,
         test_suite: TestSuiteDeclaration,
         test_collection: TestCollectionDeclaration,
     ) -> TestSuiteExecution:
@@ -139,8 +166,9 @@ class TestScriptManager(object, metaclass=Singleton):
         This will create a DB entry for test suite.
         """
 
-        # Existing test suite not found creating a new one.
-        metadata = self.__find_or_create_test_suite_metadata(test_suite=test_suite)
+        metadata = self.find_or_create_metadata(
+            db=db, model=TestSuiteMetadata, metadata=test_suite.metadata
+        )
 
         test_suite_execution = TestSuiteExecution(
             public_id=metadata.public_id,
@@ -152,6 +180,7 @@ class TestScriptManager(object, metaclass=Singleton):
 
     def ___pending_test_cases_for_test_suite(
         self,
+        db: Session,
         test_suite: TestSuiteDeclaration,
         selected_test_cases: Dict[str, int],
     ) -> List[TestCaseExecution]:
@@ -166,26 +195,30 @@ class TestScriptManager(object, metaclass=Singleton):
 
             if test_suite.public_id == "Performance Test Suite":
                 test_cases = self.__pending_test_cases_for_iterations(
-                    test_case=test_case_declaration, iterations=1
+                    db=db, test_case=test_case_declaration, iterations=1
                 )
 
-                test_cases[0].test_case_metadata.count = iterations
+                # Metadata records are shared between runs, so the count is kept on
+                # the test case execution instead.
+                test_cases[0].count = iterations
             else:
                 test_cases = self.__pending_test_cases_for_iterations(
-                    test_case=test_case_declaration, iterations=iterations
+                    db=db, test_case=test_case_declaration, iterations=iterations
                 )
             suite_test_cases.extend(test_cases)
 
         return suite_test_cases
 
     def __pending_test_cases_for_iterations(
-        self, test_case: TestCaseDeclaration, iterations: int
+        self, db: Session, test_case: TestCaseDeclaration, iterations: int
     ) -> List[TestCaseExecution]:
         """
         This will create and associate pending test case executions, based on the number
         of iterations.
         """
-        metadata = self.__find_or_create_test_case_metadata(test_case=test_case)
+        metadata = self.find_or_create_metadata(
+            db=db, model=TestCaseMetadata, metadata=test_case.metadata
+        )
         test_cases = []
         for _ in range(0, iterations):
             test_case_execution = TestCaseExecution(
@@ -196,35 +229,43 @@ class TestScriptManager(object, metaclass=Singleton):
 
         return test_cases
 
-    def __find_or_create_test_suite_metadata(
-        self, test_suite: TestSuiteDeclaration
-    ) -> TestSuiteMetadata:
-        """
-        Based on test suite class reference, return a TestSuiteMetadata record.
-        This will check for existing record, and validate the source hash and version.
-        If no match is found, a new updated record will be created
+    def find_or_create_metadata(
+        self,
+        db: Session,
+        model: Type[MetadataModelType],
+        metadata: Mapping[str, Any],
+    ) -> MetadataModelType:
         """
+        Return the TestCaseMetadata or TestSuiteMetadata record matching the source hash
+        of the given metadata. If no match is found, a new record is created.
 
-        # TODO: implement real hash check
-        source_hash = "de7f3c1390cd283f91f74a334aaf0ec3"
-
-        # TODO: check if metadata exists before creating
-        return TestSuiteMetadata(**test_suite.metadata, source_hash=source_hash)
-
-    def __find_or_create_test_case_metadata(
-        self, test_case: TestCaseDeclaration
-    ) -> TestCaseMetadata:
-        """
-        Based on test case class reference, return a TestCaseMetadata record.
-        This will check for existing record, and validate the source hash and version.
-        If no match is found, a new updated record will be created
+        Records are unique by source hash, so runs of the same test version share the
+        same metadata record. The ids of records already found are cached in-process.
         """
+        source_hash = metadata_source_hash(metadata)
+        cache_key = (model.__tablename__, source_hash)
+
+        if (metadata_id := self.__metadata_ids.get(cache_key)) is not None:
+            if (record := db.get(model, metadata_id)) is not None:
+                return record
+
+        query = select(model).where(model.source_hash == source_hash)
+        record = db.scalars(query).first()
+
+        if record is None:
+            # Concurrent run creations may insert the same record, the unique source
+            # hash index makes them share it.
+            content = {"mandatory": False, **metadata}
+            values = {field: content[field] for field in SOURCE_HASH_FIELDS}
+            db.execute(
+                pg_insert(model)
+                .values(**values, source_hash=source_hash)
+                .on_conflict_do_nothing(index_elements=[model.source_hash])
+            )
+            record = db.scalars(query).one()
 
-        # TODO: implement real hash check
-        source_hash = "de7f3c1390cd283f91f74a334aaf0ec3"
-
-        # TODO: check if metadata exists before creating
-        return TestCaseMetadata(**test_case.metadata, source_hash=source_hash)
+        self.__metadata_ids[cache_key] = record.id
+        return record
 
     def get_test_run(
         self,
@@ -237,6 +278,7 @@ class TestScriptManager(object, metaclass=Singleton):
 
     def __load_test_run_test_suites(self, db: Session, test_run: TestRun) -> None:
         test_run.test_suites = []
+        loaded_test_cases: List[Tuple[TestCase, TestCaseExecution]] = []
         for test_suite_execution in test_run.test_run_execution.test_suite_executions:
             # TODO: error handling for TestSuite Missing
             # TODO: Security: Validate TestSuite format with regex,
@@ -246,14 +288,17 @@ class TestScriptManager(object, metaclass=Singleton):
             )
             TestSuiteClass = test_suite_declaration.class_ref
             test_suite = TestSuiteClass(test_suite_execution=test_suite_execution)
-            self.__load_test_suite_test_cases(
-                db,
-                test_suite=test_suite,
-                test_suite_declaration=test_suite_declaration,
-                test_case_executions=test_suite_execution.test_case_executions,
+            loaded_test_cases.extend(
+                self.__load_test_suite_test_cases(
+                    test_suite=test_suite,
+                    test_suite_declaration=test_suite_declaration,
+                    test_case_executions=test_suite_execution.test_case_executions,
+                )
             )
             test_run.test_suites.append(test_suite)
 
+        self.create_pending_teststeps_execution(db, test_cases=loaded_test_cases)
+
     def __test_suite_declaration(self, public_id: str) -> TestSuiteDeclaration:
         # search all collections for test suite
         for collection in self.test_collections.values():
@@ -276,12 +321,18 @@ class TestScriptManager(object, metaclass=Singleton):
 
     def __load_test_suite_test_cases(
         self,
-        db: Session,
         test_suite: TestSuite,
         test_suite_declaration: TestSuiteDeclaration,
         test_case_executions: List[TestCaseExecution],
-    ) -> None:
+    ) -> List[Tuple[TestCase, TestCaseExecution]]:
+        """Load the test cases of the test suite.
+
+        Returns:
+            List[Tuple[TestCase, TestCaseExecution]]: loaded test cases, along with
+            their executions, which don't have test step executions yet.
+        """
         test_suite.test_cases = []
+        loaded_test_cases: List[Tuple[TestCase, TestCaseExecution]] = []
 
         if test_suite_declaration.public_id == "Performance Test Suite":
             test_case_declaration = self.__test_case_declaration(
@@ -291,18 +342,14 @@ class TestScriptManager(object, metaclass=Singleton):
             TestCaseClass = test_case_declaration.class_ref
             test_case = TestCaseClass(test_case_execution=test_case_executions[0])
 
-            additional_step_count = (
-                int(test_case_executions[0].test_case_metadata.count) - 1
-            )
+            additional_step_count = int(test_case_executions[0].count) - 1
 
             for index in range(2, additional_step_count + 2):
                 test_case.test_steps.insert(
                     index, TestStep(f"Loop Commissioning ... {index}")
                 )
 
-            self.create_pending_teststeps_execution(
-                db, test_case, test_case_executions[0]
-            )
+            loaded_test_cases.append((test_case, test_case_executions[0]))
             test_suite.test_cases.append(test_case)
         else:
             for test_case_execution in test_case_executions:
@@ -313,27 +360,46 @@ class TestScriptManager(object, metaclass=Singleton):
                 )
                 TestCaseClass = test_case_declaration.class_ref
                 test_case = TestCaseClass(test_case_execution=test_case_execution)
-                self.create_pending_teststeps_execution(
-                    db, test_case, test_case_execution
-                )
+                loaded_test_cases.append((test_case, test_case_execution))
                 test_suite.test_cases.append(test_case)
 
+        return loaded_test_cases
+
     def create_pending_teststeps_execution(
         self,
         db: Session,
-        test_case: TestCase,
-        test_case_execution: TestCaseExecution,
+        test_cases: List[Tuple[TestCase, TestCaseExecution]],
     ) -> None:
-        execution_index = 0
-        for test_step in test_case.test_steps:
-            test_step_execution = TestStepExecution(
-                title=test_step.name,
-                execution_index=execution_index,
-                test_case_execution_id=test_case_execution.id,
+        """Create the pending test step executions for the given test cases.
+
+        The test step executions of all test cases are created with a single bulk
+        insert, and committed in a single transaction.
+        """
+        test_steps = [
+            (
+                test_step,
+                {
+                    "title": test_step.name,
+                    "execution_index": execution_index,
+                    "test_case_execution_id": test_case_execution.id,
+                },
             )
-            db.add(test_step_execution)
+            for test_case, test_case_execution in test_cases
+            for execution_index, test_step in enumerate(test_case.test_steps)
+        ]
+        if not test_steps:
+            return
+
+        test_step_executions = db.scalars(
+            insert(TestStepExecution).returning(
+                TestStepExecution, sort_by_parameter_order=True
+            ),
+            [values for _, values in test_steps],
+        ).all()
+        for (test_step, _), test_step_execution in zip(
+            test_steps, test_step_executions
+        ):
             test_step.test_step_execution = test_step_execution
-            execution_index += 1
         db.commit()
 
     def available_test_suites(self) -> dict:
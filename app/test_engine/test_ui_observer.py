@@ -13,10 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from asyncio import Task, create_task, gather
+import asyncio
+from asyncio import CancelledError, Task
 from enum import Enum
 from typing import Any, Optional, Union
 
+from fastapi import WebSocket
 from loguru import logger
 
 from app.constants.websockets_constants import MessageKeysEnum, MessageTypeEnum
@@ -26,6 +28,18 @@ from app.socket_connection_manager import socket_connection_manager
 from app.test_engine.models import TestCase, TestRun, TestStep, TestSuite
 from app.test_engine.test_observer import Observer
 
+UI_UPDATE_INTERVAL = 0.1
+
+# Fields identifying the test of an update, sent with every update
+UPDATE_INDEX_FIELDS = frozenset(
+    (
+        "test_run_execution_id",
+        "test_suite_execution_index",
+        "test_case_execution_index",
+        "test_step_execution_index",
+    )
+)
+
 
 class TestUpdateTypeEnum(str, Enum):
     __test__ = False  # Needed to indicate to PyTest that this is not a "test"
@@ -36,11 +50,114 @@ class TestUpdateTypeEnum(str, Enum):
 
 
 class TestUIObserver(Observer):
+    """Responsible for sending the state of a Test Run to the UI.
+
+    Test updates are kept as pending until the next flush, so several updates of the
+    same test are coalesced. Only the fields that changed since the last update sent
+    for a test are included, along with the fields identifying the test.
+
+    Connections that missed some of these changes, as they connected during the test
+    run or dropped messages, are sent the full state of all tests instead.
+
+    Log records are sent as soon as they are added to the Test Run.
+    """
+
     __test__ = False
-    __async_updates: list[Task] = []
     __last_seen_run_state: Optional[TestStateEnum] = None
     __last_seen_run_log_len = 0
 
+    def __init__(self) -> None:
+        # Pending and last sent update bodies, keyed by update type and indexes
+        self.__pending_updates: dict[tuple, tuple[TestUpdateTypeEnum, dict]] = {}
+        self.__sent_updates: dict[tuple, dict] = {}
+        # Connections that got all the changes sent, with their dropped messages count
+        self.__synced_connections: dict[WebSocket, int] = {}
+        self.__flush_task: Optional[Task] = None
+        self.__flush_interval_in_sec = UI_UPDATE_INTERVAL
+
+    def start(self) -> None:
+        """Start sending pending updates periodically."""
+        self.__flush_task = asyncio.create_task(self.__periodically_send_updates())
+
+    async def finish(self) -> None:
+        """Cancel the periodic sending and send remaining updates."""
+        if self.__flush_task is not None:
+            self.__flush_task.cancel()
+            await self.__flush_task
+            self.__flush_task = None
+
+        self.send_updates()
+
+    def send_updates(self) -> None:
+        """Send the changes of all pending updates.
+
+        Connections out of sync are sent the full body of every update sent so far.
+        """
+        pending_updates = self.__pending_updates
+        self.__pending_updates = {}
+
+        update_messages = []
+        for key, (test_type, body) in pending_updates.items():
+            sent_body = self.__sent_updates.get(key, {})
+            changes = {
+                field: value
+                for field, value in body.items()
+                if field in UPDATE_INDEX_FIELDS
+                or field not in sent_body
+                or sent_body[field] != value
+            }
+            if changes.keys() <= UPDATE_INDEX_FIELDS:
+                # Nothing changed since the last update sent
+                continue
+
+            self.__sent_updates[key] = body
+            update_messages.append(self.__test_update_message(test_type, changes))
+
+        connections = socket_connection_manager.active_connections
+        synced_connections = self.__synced_connections
+        # Messages dropped while sending these updates are noticed on the next call
+        self.__synced_connections = {
+            websocket: connection.dropped_messages
+            for websocket, connection in connections.items()
+        }
+        out_of_sync_connections = [
+            websocket
+            for websocket, dropped_messages in self.__synced_connections.items()
+            if synced_connections.get(websocket) != dropped_messages
+        ]
+        if not out_of_sync_connections:
+            for message in update_messages:
+                socket_connection_manager.broadcast_nowait(message)
+            return
+
+        full_update_messages = [
+            self.__test_update_message(key[0], body)
+            for key, body in self.__sent_updates.items()
+        ]
+        for websocket in self.__synced_connections:
+            if websocket in out_of_sync_connections:
+                messages = full_update_messages
+            else:
+                messages = update_messages
+            for message in messages:
+                socket_connection_manager.send_personal_message_nowait(
+                    message, websocket
+                )
+
+    async def __periodically_send_updates(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self.__flush_interval_in_sec)
+                self.send_updates()
+        except CancelledError:
+            pass
+
+    def __queue_update(
+        self, test_type: TestUpdateTypeEnum, indexes: tuple, body: dict
+    ) -> None:
+        key = (test_type, *indexes)
+        self.__pending_updates[key] = (test_type, body)
+
     def dispatch(
         self, observable: Union[TestRun, TestSuite, TestCase, TestStep]
     ) -> None:
@@ -63,14 +180,14 @@ class TestUIObserver(Observer):
     def __handle_test_run_state(self, test_run: TestRun) -> None:
         """Send update to UI when test run state changes."""
         if self.__last_seen_run_state != test_run.state:
-            message = {
-                "test_type": TestUpdateTypeEnum.TEST_RUN,
-                "body": {
-                    "test_run_execution_id": test_run.test_run_execution.id,
-                    "state": test_run.state,
-                },
+            test_run_execution_id = test_run.test_run_execution.id
+            update = {
+                "test_run_execution_id": test_run_execution_id,
+                "state": test_run.state,
             }
-            self.__send_test_update_message(message)
+            self.__queue_update(
+                TestUpdateTypeEnum.TEST_RUN, (test_run_execution_id,), update
+            )
             self.__last_seen_run_state = test_run.state
 
     def __handle_test_run_log(self, test_run: TestRun) -> None:
@@ -88,10 +205,12 @@ class TestUIObserver(Observer):
             update = {
                 "test_suite_execution_index": test_suite_execution.execution_index,
                 "state": observable.state,
-                "errors": observable.errors,
+                "errors": list(observable.errors),
             }
-            self.__send_test_update_message(
-                {"test_type": TestUpdateTypeEnum.TEST_SUITE, "body": update}
+            self.__queue_update(
+                TestUpdateTypeEnum.TEST_SUITE,
+                (test_suite_execution.execution_index,),
+                update,
             )
 
     def __onTestCaseUpdate(self, observable: TestCase) -> None:
@@ -103,10 +222,15 @@ class TestUIObserver(Observer):
                 "test_suite_execution_index": test_suite_execution.execution_index,
                 "test_case_execution_index": test_case_execution.execution_index,
                 "state": observable.state,
-                "errors": observable.errors,
+                "errors": list(observable.errors),
             }
-            self.__send_test_update_message(
-                {"test_type": TestUpdateTypeEnum.TEST_CASE, "body": update}
+            self.__queue_update(
+                TestUpdateTypeEnum.TEST_CASE,
+                (
+                    test_suite_execution.execution_index,
+                    test_case_execution.execution_index,
+                ),
+                update,
             )
 
     def __onTestStepUpdate(self, observable: TestStep) -> None:
@@ -119,20 +243,26 @@ class TestUIObserver(Observer):
                 "test_case_execution_index": test_case_execution.execution_index,
                 "test_step_execution_index": test_step_execution.execution_index,
                 "state": observable.state,
-                "errors": observable.errors,
-                "failures": observable.failures,
+                "errors": list(observable.errors),
+                "failures": list(observable.failures),
             }
-            self.__send_test_update_message(
-                {"test_type": TestUpdateTypeEnum.TEST_STEP, "body": update}
+            self.__queue_update(
+                TestUpdateTypeEnum.TEST_STEP,
+                (
+                    test_suite_execution.execution_index,
+                    test_case_execution.execution_index,
+                    test_step_execution.execution_index,
+                ),
+                update,
             )
 
-    def __send_test_update_message(self, update_payload: dict) -> None:
-        self.__send_message(
-            {
-                MessageKeysEnum.TYPE: MessageTypeEnum.TEST_UPDATE,
-                MessageKeysEnum.PAYLOAD: update_payload,
-            }
-        )
+    @staticmethod
+    def __test_update_message(test_type: TestUpdateTypeEnum, body: dict) -> dict:
+        # Updates only contain changed fields, so they can't be merged when queued
+        return {
+            MessageKeysEnum.TYPE: MessageTypeEnum.TEST_UPDATE,
+            MessageKeysEnum.PAYLOAD: {"test_type": test_type, "body": body},
+        }
 
     def __send_log_records_message(self, log_entries: list[TestRunLogEntry]) -> None:
         self.__send_message(
@@ -143,11 +273,5 @@ class TestUIObserver(Observer):
         )
 
     def __send_message(self, message: dict[str, Any]) -> None:
-        # enqueue update
-        task = create_task(socket_connection_manager.broadcast(message))
-        self.__async_updates.append(task)
-
-    async def complete_tasks(self) -> None:
-        pending_updates = self.__async_updates
-        self.__async_updates = []
-        await gather(*pending_updates)
+        # enqueue update, sending it never waits on the clients
+        socket_connection_manager.broadcast_nowait(message)
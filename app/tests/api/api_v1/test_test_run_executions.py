@@ -36,6 +36,7 @@ from app.models import TestRunExecution
 from app.models.project import Project
 from app.models.test_enums import TestStateEnum
 from app.schemas.test_run_execution import TestRunExecutionCreate
+from app.schemas.test_run_log_entry import TestRunLogEntry
 from app.test_engine import (
     TEST_ENGINE_ABORTING_TESTING_MESSAGE,
     TEST_ENGINE_BUSY_MESSAGE,
@@ -1389,6 +1390,74 @@ def test_unarchive_test_run_execution_description(
     )
 
 
+def test_performance_analytics(client: TestClient, db: Session) -> None:
+    test_run_execution = create_random_test_run_execution(db)
+    for iteration, discovery_ms in enumerate([40, 50, 60], start=1):
+        messages = [
+            (0, f"Begin Commission {iteration}"),
+            (10, "Internal Control start simulated app"),
+            (10 + discovery_ms, "Discovered Device: 1234"),
+            (100, "SecureChannel:PBKDFParamRequest"),
+            (120, "'kEstablishing' --> 'kActive'"),
+            (130, "Performing next commissioning step 'ReadCommissioningInfo'"),
+            (150, "Successfully finished commissioning step 'ReadCommissioningInfo'"),
+            (160, "Performing next commissioning step 'Cleanup'"),
+            (210, "Successfully finished commissioning step 'Cleanup'"),
+            (220, "Internal Control stop simulated app"),
+        ]
+        test_run_execution.extend_log(
+            TestRunLogEntry(
+                level="PYTHON_TEST",
+                timestamp=0,
+                message=f"2024-01-01 10:00:0{iteration}.{ms:03}000 INFO {message}",
+            )
+            for ms, message in messages
+        )
+    db.commit()
+
+    response = client.get(
+        f"{settings.API_V1_STR}/test_run_executions/{test_run_execution.id}"
+        "/performance-analytics"
+    )
+    validate_json_response(
+        response=response,
+        expected_status_code=HTTPStatus.OK,
+        expected_keys=[
+            "durations",
+            "discovery_durations",
+            "read_durations",
+            "PASE_durations",
+        ],
+    )
+    discovery_durations = response.json()["discovery_durations"]
+    assert discovery_durations["count"] == 3
+    assert discovery_durations["min"] == 40000
+    assert discovery_durations["max"] == 60000
+    assert discovery_durations["p50"] == 50000
+    assert discovery_durations["outliers"] == []
+
+
+def test_performance_analytics_stored(client: TestClient, db: Session) -> None:
+    test_run_execution = create_test_run_execution_with_some_test_cases(db)
+    analytics = {"durations": {"count": 1, "unit": "us"}}
+    test_case_execution = test_run_execution.test_suite_executions[
+        0
+    ].test_case_executions[0]
+    test_case_execution.analytics = analytics
+    db.commit()
+
+    response = client.get(
+        f"{settings.API_V1_STR}/test_run_executions/{test_run_execution.id}"
+        "/performance-analytics"
+    )
+    # The stored analytics are returned instead of parsing the log
+    validate_json_response(
+        response=response,
+        expected_status_code=HTTPStatus.OK,
+        expected_content=analytics,
+    )
+
+
 def test_operations_missing_test_run(client: TestClient, db: Session) -> None:
     """Test HTTP errors when attempting operations on an invalid record id.
 
@@ -1444,3 +1513,13 @@ def test_operations_missing_test_run(client: TestClient, db: Session) -> None:
         expected_status_code=HTTPStatus.NOT_FOUND,
         expected_keys=["detail"],
     )
+
+    # Performance analytics
+    response = client.get(
+        f"{settings.API_V1_STR}/test_run_executions/{id}/performance-analytics"
+    )
+    validate_json_response(
+        response=response,
+        expected_status_code=HTTPStatus.NOT_FOUND,
+        expected_keys=["detail"],
+    )
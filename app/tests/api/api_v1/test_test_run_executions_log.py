@@ -15,7 +15,9 @@
 #
 import json
 from http import HTTPStatus
+from io import BytesIO
 from json import JSONDecodeError
+from zipfile import ZipFile
 
 import pytest
 from httpx import AsyncClient
@@ -183,3 +185,26 @@ async def test_test_run_execution_json_log(
     parsed_line = json.loads(response_first_line)
     original_first_line = run_db.log[0]
     assert parsed_line == original_first_line
+
+
+@pytest.mark.asyncio
+async def test_test_run_execution_grouped_log(
+    async_client: AsyncClient, db: Session
+) -> None:
+    _, run, _, _ = await load_and_run_tool_unit_tests(
+        db, TestSuiteExpected, TCTRExpectedPass
+    )
+
+    run_db = run.test_run_execution
+    id = run_db.id
+    url = f"{settings.API_V1_STR}/test_run_executions/{id}/grouped-log"
+    response = await async_client.get(url)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers.get("content-type") == "application/zip"
+
+    zip_file = ZipFile(BytesIO(response.content))
+    assert zip_file.testzip() is None
+    # Summary, test suites logs and the logs of the passed test cases
+    assert len(zip_file.namelist()) == 3
+    assert "summary.txt" in zip_file.namelist()
@@ -0,0 +1,49 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+
+from fastapi.testclient import TestClient
+
+from app.constants.websockets_constants import (
+    INVALID_JSON_ERROR_STR,
+    MessageKeysEnum,
+    MessageTypeEnum,
+)
+from app.core.config import settings
+from app.socket_connection_manager import socket_connection_manager
+
+
+def test_websocket_receive_and_disconnect(client: TestClient) -> None:
+    """
+    Tests that the WebSocket endpoint handles messages and client disconnects.
+
+    Expected results:
+    1. A received message is handled as soon as it arrives
+    2. The connection is removed when the client disconnects
+    """
+    with client.websocket_connect(f"{settings.API_V1_STR}/ws") as websocket:
+        websocket.send_text("Invalid")
+        assert websocket.receive_json() == {
+            MessageKeysEnum.TYPE: MessageTypeEnum.INVALID_MESSAGE,
+            MessageKeysEnum.PAYLOAD: INVALID_JSON_ERROR_STR,
+        }
+        assert len(socket_connection_manager.active_connections) == 1
+
+    # The endpoint handles the disconnect in the test client's event loop thread
+    deadline = time.monotonic() + 1
+    while socket_connection_manager.active_connections and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(socket_connection_manager.active_connections) == 0
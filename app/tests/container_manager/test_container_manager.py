@@ -28,25 +28,37 @@ DEFAULT_MOUNT_WORKING_DIR = "/app"
 
 @pytest.mark.asyncio
 async def test_create_container() -> None:
+    events = mock.MagicMock()
+    events.__next__.return_value = {"status": "start"}
     with mock.patch(
         "docker.models.containers.ContainerCollection.run"
     ) as docker_run, mock.patch(
-        "app.container_manager.container_manager.is_running",
-        return_value=True,
+        "docker.client.DockerClient.events", return_value=events
+    ) as docker_events, mock.patch.object(
+        target=container_manager, attribute="is_running", return_value=False
     ):
         await container_manager.create_container(docker_image_tag="org/image:tag")
         docker_run.assert_called_once()
+        docker_events.assert_called_once()
+
+    # The container start is detected from the events, without checking its status
+    events.close.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_create_container_timeout() -> None:
+    events = mock.MagicMock()
+    events.__next__.side_effect = StopIteration
     with mock.patch("docker.models.containers.ContainerCollection.run"), mock.patch(
-        "app.container_manager.container_manager.is_running",
-        return_value=False,
+        "docker.client.DockerClient.events", return_value=events
+    ), mock.patch.object(
+        target=container_manager, attribute="is_running", return_value=False
     ):
         with pytest.raises(TimeoutError):
             await container_manager.create_container(docker_image_tag="org/image:tag")
 
+    events.close.assert_called_once()
+
 
 def test_get_container_found() -> None:
     with mock.patch(
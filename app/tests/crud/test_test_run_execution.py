@@ -23,6 +23,7 @@ from unittest.mock import call
 
 import pytest
 from faker import Faker
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
@@ -34,6 +35,7 @@ from app.schemas.test_run_execution import (
     TestRunExecutionUpdate,
     TestRunExecutionWithStats,
 )
+from app.test_engine.test_script_manager import test_script_manager
 from app.tests.utils.operator import operator_base_dict
 from app.tests.utils.project import create_random_project
 from app.tests.utils.test_run_config import (
@@ -44,6 +46,7 @@ from app.tests.utils.test_run_execution import (
     create_random_test_run_execution,
     create_random_test_run_execution_archived,
     create_random_test_run_execution_with_test_case_states,
+    create_test_run_execution_with_some_test_cases,
     random_test_run_execution_dict,
     test_run_execution_base_dict,
 )
@@ -213,6 +216,45 @@ def test_delete_test_run_execution_with_a_test_suite(db: Session) -> None:
     assert suite_db is None
 
 
+def test_get_test_run_execution_with_executions(db: Session) -> None:
+    test_run_execution = create_test_run_execution_with_some_test_cases(db=db)
+    db.expunge_all()
+
+    stored_test_run_execution = crud.test_run_execution.get_with_executions(
+        db=db, id=test_run_execution.id
+    )
+
+    assert stored_test_run_execution
+    # Executions were loaded with the test run, no further queries are needed
+    with mock.patch.object(db, "execute", side_effect=AssertionError):
+        test_suite_executions = stored_test_run_execution.test_suite_executions
+        assert len(test_suite_executions) == 1
+        assert len(test_suite_executions[0].test_case_executions) == 6
+
+
+def test_test_run_execution_log_includes_pending_entries(db: Session) -> None:
+    test_run_execution = create_random_test_run_execution(db=db)
+    test_run_execution.extend_log(
+        [
+            schemas.TestRunLogEntry(level="info", timestamp=0.0, message="Stored"),
+        ]
+    )
+    db.commit()
+
+    test_run_execution.extend_log(
+        [
+            schemas.TestRunLogEntry(level="info", timestamp=1.0, message="Pending"),
+        ]
+    )
+
+    log = test_run_execution.log
+    assert [entry.message for entry in log] == ["Stored", "Pending"]
+    assert [entry.sequence_number for entry in log] == [0, 1]
+    # Reading the log doesn't flush the pending entry
+    assert len(inspect(test_run_execution).attrs.log_entries.history.added) == 1
+    db.rollback()
+
+
 def test_get_test_run_execution_with_state_stats(db: Session) -> None:
     # We generate a random test run for this test.
     # To validate the statistics, we create the run with a random number of test cases
@@ -248,6 +290,36 @@ def test_get_test_run_execution_with_state_stats(db: Session) -> None:
         assert expected_state_stats[state] == count
 
 
+def test_get_test_run_executions_with_stats_for_multiple_runs(db: Session) -> None:
+    project = create_random_project(db, config={})
+    first_run_stats = {TestStateEnum.PASSED: 2, TestStateEnum.FAILED: 1}
+    second_run_stats = {TestStateEnum.ERROR: 3}
+
+    first_run = create_random_test_run_execution_with_test_case_states(
+        db, first_run_stats
+    )
+    second_run = create_random_test_run_execution_with_test_case_states(
+        db, second_run_stats
+    )
+    run_without_test_cases = create_random_test_run_execution(db, project_id=project.id)
+    for test_run_execution in [first_run, second_run]:
+        test_run_execution.project_id = project.id
+    db.commit()
+
+    test_run_executions = crud.test_run_execution.get_multi_with_stats(
+        db, project_id=project.id
+    )
+    stats_by_id = {t.id: t.test_case_stats for t in test_run_executions}
+
+    # Stats are computed per test run, even when loaded together
+    assert stats_by_id[first_run.id].test_case_count == 3
+    assert stats_by_id[first_run.id].states == first_run_stats
+    assert stats_by_id[second_run.id].test_case_count == 3
+    assert stats_by_id[second_run.id].states == second_run_stats
+    assert stats_by_id[run_without_test_cases.id].test_case_count == 0
+    assert stats_by_id[run_without_test_cases.id].states == {}
+
+
 def test_get_test_run_executions_by_project(db: Session) -> None:
     project = create_random_project(db, config={})
     test_run_execution = create_random_test_run_execution(db, project_id=project.id)
@@ -748,6 +820,10 @@ def test_import_execution_success_with_test_config() -> None:
         attribute="get_or_create",
         return_value=operator_id,
     ) as mocked_get_or_create, mock.patch.object(
+        target=test_script_manager,
+        attribute="find_or_create_metadata",
+        side_effect=lambda db, model, metadata: model(**metadata),
+    ), mock.patch.object(
         target=crud.test_run_config,
         attribute="create",
         return_value=test_run_config_mock,
@@ -791,7 +867,11 @@ def test_import_execution_success_without_test_config() -> None:
         target=crud.operator,
         attribute="get_or_create",
         return_value=operator_id,
-    ) as mocked_get_or_create:
+    ) as mocked_get_or_create, mock.patch.object(
+        target=test_script_manager,
+        attribute="find_or_create_metadata",
+        side_effect=lambda db, model, metadata: model(**metadata),
+    ):
         imported_test_run = crud.test_run_execution.import_execution(
             db=mocked_db,
             project_id=project_id,
@@ -809,3 +889,27 @@ def test_import_execution_success_without_test_config() -> None:
         assert imported_test_run.project_id == project_id
         assert imported_test_run.title == test_run_execution_dict.get("title")
         assert imported_test_run.operator_id == operator_id
+
+
+def test_import_execution_reuses_metadata(db: Session) -> None:
+    project = create_random_project(db, config={})
+    execution = schemas.TestRunExecutionToExport(**test_run_execution_base_dict)
+
+    first_imported_test_run = crud.test_run_execution.import_execution(
+        db=db, project_id=project.id, execution=execution
+    )
+    second_imported_test_run = crud.test_run_execution.import_execution(
+        db=db, project_id=project.id, execution=execution
+    )
+
+    first_test_suite = first_imported_test_run.test_suite_executions[0]
+    second_test_suite = second_imported_test_run.test_suite_executions[0]
+    assert first_test_suite.id != second_test_suite.id
+    assert (
+        first_test_suite.test_suite_metadata_id
+        == second_test_suite.test_suite_metadata_id
+    )
+    assert (
+        first_test_suite.test_case_executions[0].test_case_metadata_id
+        == second_test_suite.test_case_executions[0].test_case_metadata_id
+    )
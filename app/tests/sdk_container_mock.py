@@ -64,6 +64,10 @@ mock_instance.is_running.return_value = True
 mock_instance.pics_file_created = False
 mock_instance.send_command.return_value = Mock(exit_code=0, output="mocked output")
 mock_instance.start = AsyncMock()
+mock_instance.release = AsyncMock()
+mock_instance.destroy_async = AsyncMock()
+mock_instance.copy_file_from_container_async = AsyncMock()
+mock_instance.copy_file_to_container_async = AsyncMock()
 
 
 # Create mock SDKContainer class
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import json
 from typing import Any, Dict
 from unittest import mock
@@ -23,12 +24,14 @@ from starlette.websockets import WebSocketState
 from websockets.exceptions import ConnectionClosedOK
 
 from app.constants.websockets_constants import (
+    COMPACT_JSON_SUBPROTOCOL,
     INVALID_JSON_ERROR_STR,
     MESSAGE_ID_KEY,
     MessageKeysEnum,
     MessageTypeEnum,
 )
 from app.socket_connection_manager import (
+    SocketConnection,
     SocketConnectionManager,
     socket_connection_manager,
 )
@@ -61,7 +64,7 @@ async def test_connect_successful() -> None:
     socket.accept.assert_called_once()
 
     # Cleanup
-    socket_connection_manager.active_connections.clear()
+    socket_connection_manager.disconnect(websocket=socket)
 
 
 @pytest.mark.asyncio
@@ -91,26 +94,24 @@ async def test_connect_failed() -> None:
     socket.accept.assert_called_once()
 
 
-def test_disconnect() -> None:
+@pytest.mark.asyncio
+async def test_disconnect() -> None:
     """
     Test whether the disconnect() function removes the socket object from the list of
-    active_connections.
+    active_connections, and closes its connection.
     """
     socket_connection_manager.active_connections.clear()
 
-    # Add a websocket object to the "active_connections" list to imitate
-    # an existing active connection
     socket = mock.MagicMock(spec=WebSocket)
-    socket_connection_manager.active_connections.append(socket)
+    await socket_connection_manager.connect(websocket=socket)
     assert len(socket_connection_manager.active_connections) == 1
+    connection = socket_connection_manager.active_connections[socket]
 
     socket_connection_manager.disconnect(websocket=socket)
 
     # Verify that the "active_connections" list does not have the disconnected socket
     assert len(socket_connection_manager.active_connections) == 0
-
-    # Cleanup
-    socket_connection_manager.active_connections.clear()
+    assert connection.closed
 
 
 @pytest.mark.asyncio
@@ -151,23 +152,58 @@ async def test_broadcast_message_data_types() -> None:
     expected_parameter_list = json.dumps(test_message_list)
 
     socket_connection_manager.active_connections.clear()
-    # Add a websocket object to the "active_connections" list to imitate an existing
-    # active connection
     socket = mock.MagicMock(spec=WebSocket)
-    socket_connection_manager.active_connections.append(socket)
+    await socket_connection_manager.connect(websocket=socket)
     assert len(socket_connection_manager.active_connections) == 1
+    connection = socket_connection_manager.active_connections[socket]
 
     await socket_connection_manager.broadcast(message=test_message)
+    await connection.join()
     socket.send_text.assert_called_with(test_message)
 
     await socket_connection_manager.broadcast(message=test_message_dict)
+    await connection.join()
     socket.send_text.assert_called_with(expected_parameter_dict)
 
     await socket_connection_manager.broadcast(message=test_message_list)
+    await connection.join()
     socket.send_text.assert_called_with(expected_parameter_list)
 
     # Cleanup
+    socket_connection_manager.disconnect(websocket=socket)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_compact_json() -> None:
+    """
+    Validate that broadcast() sends compact JSON to the connections that requested the
+    compact JSON subprotocol, and the default JSON format to the others.
+    """
+    test_message_dict = {
+        MessageKeysEnum.TYPE: MessageTypeEnum.INVALID_MESSAGE,
+        MessageKeysEnum.PAYLOAD: ["test", "message"],
+    }
+
     socket_connection_manager.active_connections.clear()
+    socket = mock.MagicMock(spec=WebSocket)
+    compact_socket = mock.MagicMock(spec=WebSocket)
+    compact_socket.get.return_value = [COMPACT_JSON_SUBPROTOCOL]
+    await socket_connection_manager.connect(websocket=socket)
+    await socket_connection_manager.connect(websocket=compact_socket)
+    socket.accept.assert_called_once_with(subprotocol=None)
+    compact_socket.accept.assert_called_once_with(subprotocol=COMPACT_JSON_SUBPROTOCOL)
+
+    await socket_connection_manager.broadcast(message=test_message_dict)
+    for connection in socket_connection_manager.active_connections.values():
+        await connection.join()
+    socket.send_text.assert_called_once_with(json.dumps(test_message_dict))
+    compact_socket.send_text.assert_called_once_with(
+        json.dumps(test_message_dict, separators=(",", ":"))
+    )
+
+    # Cleanup
+    socket_connection_manager.disconnect(websocket=socket)
+    socket_connection_manager.disconnect(websocket=compact_socket)
 
 
 @pytest.mark.asyncio
@@ -178,23 +214,23 @@ async def test_broadcast_failed_for_ConnectionClosed() -> None:
     test_message = "Test"
     socket_connection_manager.active_connections.clear()
 
-    # Add a websocket object to the "active_connections" list to imitate
-    # an existing active connection
     socket = mock.MagicMock(spec=WebSocket)
     socket.application_state = WebSocketState.CONNECTED
-
-    socket_connection_manager.active_connections.append(socket)
+    await socket_connection_manager.connect(websocket=socket)
     assert len(socket_connection_manager.active_connections) == 1
+    connection = socket_connection_manager.active_connections[socket]
 
     # Force a connection closed exception
     socket.send_text.side_effect = ConnectionClosedOK(rcvd=None, sent=None)
 
     await socket_connection_manager.broadcast(message=test_message)
+    await connection.join()
     socket.send_text.assert_called_once_with(test_message)
     socket.close.assert_called_once()
+    assert connection.closed
 
     # Cleanup
-    socket_connection_manager.active_connections.clear()
+    socket_connection_manager.disconnect(websocket=socket)
 
 
 @pytest.mark.asyncio
@@ -203,29 +239,102 @@ async def test_broadcast_failed_for_RuntimeError() -> None:
     Tests if broadcast() is able to handle run time errors.
 
     Expected results:
-    1. RuntimeError is raised
+    1. RuntimeError is not raised to the broadcaster
     2. "Send" is called in an attempt to broadcast
+    3. The failed connection is closed, and no longer receives messages
     """
     test_message = "Test"
-    expected_parameter = {"type": "websocket.send", "text": test_message}
 
-    # Add a websocket object to the "active_connections" list to imitate
-    # an existing active connection
     socket_connection_manager.active_connections.clear()
     socket = mock.MagicMock(spec=WebSocket)
-    socket_connection_manager.active_connections.append(socket)
+    await socket_connection_manager.connect(websocket=socket)
     assert len(socket_connection_manager.active_connections) == 1
+    connection = socket_connection_manager.active_connections[socket]
 
     socket.send_text.side_effect = RuntimeError(
         'Cannot call "receive" once a disconnect message has been received.'
     )
 
-    with pytest.raises(RuntimeError):
-        await socket_connection_manager.broadcast(message=test_message)
-        socket.send_text.assert_called_with(expected_parameter)
+    await socket_connection_manager.broadcast(message=test_message)
+    await connection.join()
+    socket.send_text.assert_called_once_with(test_message)
+    assert connection.closed
+
+    await socket_connection_manager.broadcast(message=test_message)
+    await connection.join()
+    socket.send_text.assert_called_once()
 
     # Cleanup
+    socket_connection_manager.disconnect(websocket=socket)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_slow_connection() -> None:
+    """
+    Tests that broadcast() does not wait on a slow connection.
+
+    Expected results:
+    1. Messages are queued while the connection is busy sending
+    2. Pending messages with the same merge key are replaced by the latest one
+    3. The oldest pending messages are dropped when the queue is full
+    """
     socket_connection_manager.active_connections.clear()
+    socket = mock.MagicMock(spec=WebSocket)
+    connection = SocketConnection(websocket=socket, max_queue_size=3)
+    connection.start()
+    socket_connection_manager.active_connections[socket] = connection
+
+    sent_messages = []
+    send_allowed = asyncio.Event()
+
+    async def slow_send_text(message: str) -> None:
+        await send_allowed.wait()
+        sent_messages.append(message)
+
+    socket.send_text.side_effect = slow_send_text
+
+    # Let the connection block while sending the first message
+    socket_connection_manager.broadcast_nowait(message="first")
+    await asyncio.sleep(0)
+
+    socket_connection_manager.broadcast_nowait(message="dropped")
+    socket_connection_manager.broadcast_nowait(message="state 1", merge_key="state")
+    socket_connection_manager.broadcast_nowait(message="log")
+    socket_connection_manager.broadcast_nowait(message="state 2", merge_key="state")
+    socket_connection_manager.broadcast_nowait(message="last")
+    assert connection.dropped_messages == 1
+
+    send_allowed.set()
+    await connection.join()
+    assert sent_messages == ["first", "log", "state 2", "last"]
+
+    # Cleanup
+    socket_connection_manager.disconnect(websocket=socket)
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_idle_connection() -> None:
+    """
+    Tests that a heartbeat is sent to a connection after some time without messages.
+
+    Expected results:
+    1. A heartbeat message is sent while the connection is idle
+    2. Queued messages are sent without waiting for the heartbeat interval
+    """
+    socket = mock.MagicMock(spec=WebSocket)
+    connection = SocketConnection(websocket=socket, heartbeat_interval=0.01)
+    connection.start()
+
+    await asyncio.sleep(0.05)
+    heartbeat_message = json.dumps({"type": MessageTypeEnum.HEARTBEAT})
+    socket.send_text.assert_called_with(heartbeat_message)
+
+    connection.send_nowait(message="message")
+    await connection.join()
+    socket.send_text.assert_called_with("message")
+
+    # Cleanup
+    connection.stop()
 
 
 @pytest.mark.asyncio
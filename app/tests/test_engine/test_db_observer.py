@@ -14,10 +14,13 @@
 # limitations under the License.
 #
 import asyncio
+from unittest import mock
 
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app import models
 from app.models.test_enums import TestStateEnum
 from app.schemas.test_run_log_entry import TestRunLogEntry
 from app.test_engine.test_db_observer import TestDBObserver
@@ -62,6 +65,70 @@ async def test_test_db_observer_test_run_started_at(db: Session) -> None:
     assert len(test_run.log) == 1
 
 
+def test_test_db_observer_test_run_log_appended(db: Session) -> None:
+    test_script_manager = TestScriptManager()
+    test_db_observer = TestDBObserver()
+
+    test_run_execution = create_test_run_execution_with_some_test_cases(db=db)
+    test_run = test_script_manager.get_test_run(db, test_run_execution)
+
+    test_run.append_log_entries(
+        [
+            TestRunLogEntry(level="info", timestamp=0.0, message="Message1"),
+            TestRunLogEntry(level="info", timestamp=1.0, message="Message2"),
+        ]
+    )
+    test_db_observer.dispatch(test_run)
+    test_db_observer.apply_updates()
+
+    test_run.append_log_entries(
+        [TestRunLogEntry(level="info", timestamp=2.0, message="Message3")]
+    )
+    test_db_observer.dispatch(test_run)
+    test_db_observer.apply_updates()
+
+    # Each entry is stored once, in the order it was logged
+    log_entry_count = db.scalar(
+        select(func.count())
+        .select_from(models.TestRunLogEntry)
+        .filter_by(test_run_execution_id=test_run_execution.id)
+    )
+    assert log_entry_count == 3
+    assert [entry.message for entry in test_run_execution.log] == [
+        "Message1",
+        "Message2",
+        "Message3",
+    ]
+
+
+def test_test_db_observer_reapplies_failed_updates(db: Session) -> None:
+    test_script_manager = TestScriptManager()
+    test_db_observer = TestDBObserver()
+
+    test_run_execution = create_test_run_execution_with_some_test_cases(db=db)
+    test_run = test_script_manager.get_test_run(db, test_run_execution)
+
+    test_run.state = TestStateEnum.EXECUTING
+    test_run.append_log_entries(
+        [TestRunLogEntry(level="info", timestamp=0.0, message="Message1")]
+    )
+    test_db_observer.dispatch(test_run)
+
+    # The failed commit is rolled back
+    with mock.patch.object(
+        target=db, attribute="commit", side_effect=Exception("DB unavailable")
+    ):
+        with pytest.raises(Exception, match="DB unavailable"):
+            test_db_observer.apply_updates()
+    assert test_run_execution.state == TestStateEnum.PENDING
+
+    # The updates are applied again on the next flush, without duplicating log entries
+    test_db_observer.apply_updates()
+    db.expire_all()
+    assert test_run_execution.state == TestStateEnum.EXECUTING
+    assert [entry.message for entry in test_run_execution.log] == ["Message1"]
+
+
 @pytest.mark.asyncio
 async def test_test_db_observer_test_suite_started_at(db: Session) -> None:
     test_script_manager = TestScriptManager()
@@ -281,3 +348,56 @@ def test_test_db_observer_update(db: Session) -> None:
     db.close()
     test_db_observer.dispatch(test_step)
     assert TestStateEnum.EXECUTING == test_step.test_step_execution.state
+
+
+def test_test_db_observer_coalesces_updates(db: Session) -> None:
+    test_script_manager = TestScriptManager()
+    test_db_observer = TestDBObserver()
+
+    test_run_execution = create_test_run_execution_with_some_test_cases(db=db)
+    test_run = test_script_manager.get_test_run(db, test_run_execution)
+    test_suite = test_run.test_suites[0]
+
+    with mock.patch.object(db, "commit", wraps=db.commit) as commit:
+        for state in (TestStateEnum.EXECUTING, TestStateEnum.PASSED):
+            test_suite.state = state
+            test_db_observer.dispatch(test_suite)
+            for test_case in test_suite.test_cases:
+                test_case.state = state
+                test_db_observer.dispatch(test_case)
+
+        # All updates are committed at once
+        test_db_observer.apply_updates()
+        commit.assert_called_once()
+
+    db.expire_all()
+    assert test_run_execution.test_suite_executions[0].state == TestStateEnum.PASSED
+    for test_case_execution in test_run_execution.test_suite_executions[
+        0
+    ].test_case_executions:
+        assert test_case_execution.state == TestStateEnum.PASSED
+
+
+@pytest.mark.asyncio
+async def test_test_db_observer_periodic_flush(db: Session) -> None:
+    test_script_manager = TestScriptManager()
+    with mock.patch("app.test_engine.test_db_observer.DB_FLUSH_INTERVAL", new=0.01):
+        test_db_observer = TestDBObserver()
+
+    test_run_execution = create_test_run_execution_with_some_test_cases(db=db)
+    test_run = test_script_manager.get_test_run(db, test_run_execution)
+    test_suite = test_run.test_suites[0]
+
+    with mock.patch.object(db, "commit", wraps=db.commit) as commit:
+        test_db_observer.start()
+        test_suite.state = TestStateEnum.EXECUTING
+        test_db_observer.dispatch(test_suite)
+
+        # Updates are committed without waiting for the test run to finish
+        await asyncio.sleep(0.1)
+        commit.assert_called_once()
+
+        test_suite.state = TestStateEnum.PASSED
+        test_db_observer.dispatch(test_suite)
+        await test_db_observer.finish()
+        assert commit.call_count == 2
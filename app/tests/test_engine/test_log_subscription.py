@@ -0,0 +1,97 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from unittest import mock
+
+import pytest
+from fastapi import WebSocket
+from sqlalchemy.orm import Session
+
+from app.constants.websockets_constants import MessageKeysEnum, MessageTypeEnum
+from app.models.test_run_execution import TestRunExecution
+from app.schemas.test_run_log_entry import TestRunLogEntry
+from app.socket_connection_manager import socket_connection_manager
+from app.test_engine.models import TestRun
+from app.test_engine.test_log_subscription import test_log_subscription_manager
+from app.test_engine.test_runner import TestRunner
+from app.tests.utils.test_run_execution import create_random_test_run_execution
+
+
+def __log_entries(count: int) -> list[TestRunLogEntry]:
+    return [
+        TestRunLogEntry(level="info", timestamp=float(i), message=f"Message{i}")
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_running_test_run_log() -> None:
+    test_run = TestRun(test_run_execution=TestRunExecution(id=42))
+    log_entries = __log_entries(3)
+    test_run.append_log_entries(log_entries)
+    assert [entry.sequence_number for entry in test_run.log] == [0, 1, 2]
+
+    socket = mock.MagicMock(spec=WebSocket)
+    with mock.patch.object(TestRunner(), "test_run", test_run), mock.patch.object(
+        target=socket_connection_manager, attribute="send_personal_message_nowait"
+    ) as send_mock:
+        test_log_subscription_manager.received_message(
+            {"test_run_execution_id": 42, "since": 1}, socket
+        )
+
+    # Only the missed entries are replayed, from memory
+    send_mock.assert_called_once_with(
+        message={
+            MessageKeysEnum.TYPE: MessageTypeEnum.TEST_LOG_RECORDS,
+            MessageKeysEnum.PAYLOAD: log_entries[1:],
+        },
+        websocket=socket,
+    )
+
+
+@pytest.mark.asyncio
+async def test_subscribe_stored_test_run_log(db: Session) -> None:
+    test_run_execution = create_random_test_run_execution(db=db)
+    test_run_execution.extend_log(__log_entries(3))
+    db.commit()
+
+    socket = mock.MagicMock(spec=WebSocket)
+    with mock.patch.object(
+        target=socket_connection_manager, attribute="send_personal_message_nowait"
+    ) as send_mock:
+        test_log_subscription_manager.received_message(
+            {"test_run_execution_id": test_run_execution.id, "since": 1}, socket
+        )
+        replay_tasks = (
+            test_log_subscription_manager._TestLogSubscriptionManager__replay_tasks  # type: ignore  # noqa: E501
+        )
+        await asyncio.gather(*replay_tasks)
+
+    # Only the missed entries are replayed, from the DB
+    send_mock.assert_called_once()
+    replayed_entries = send_mock.call_args.kwargs["message"][MessageKeysEnum.PAYLOAD]
+    assert [entry.sequence_number for entry in replayed_entries] == [1, 2]
+    assert [entry.message for entry in replayed_entries] == ["Message1", "Message2"]
+
+
+def test_subscribe_invalid_message() -> None:
+    socket = mock.MagicMock(spec=WebSocket)
+    with mock.patch.object(
+        target=socket_connection_manager, attribute="send_personal_message_nowait"
+    ) as send_mock:
+        test_log_subscription_manager.received_message({"since": -1}, socket)
+
+    send_mock.assert_not_called()
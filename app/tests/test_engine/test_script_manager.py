@@ -13,14 +13,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+from unittest import mock
+
 import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 
+from app import models
+from app.test_engine.models.test_metadata import metadata_source_hash
 from app.test_engine.test_script_manager import (
     TestCaseNotFound,
     TestCollectionNotFound,
+    TestScriptManager,
     TestSuiteNotFound,
     test_script_manager,
 )
+from app.tests.utils.test_run_execution import (
+    create_random_test_run_execution,
+    create_test_run_execution_with_some_test_cases,
+)
 
 
 @pytest.mark.asyncio
@@ -108,3 +121,104 @@ async def test_validate_test_selection_invalid_test_case() -> None:
     }
     with pytest.raises(TestCaseNotFound):
         test_script_manager.validate_test_selection(selected_tests)
+
+
+def test_get_test_run_creates_pending_test_steps(db: Session) -> None:
+    test_run_execution = create_test_run_execution_with_some_test_cases(db=db)
+
+    with mock.patch.object(db, "commit", wraps=db.commit) as commit:
+        test_run = test_script_manager.get_test_run(db, test_run_execution)
+        # The test step executions of all test cases are committed together
+        commit.assert_called_once()
+
+    test_steps = [
+        test_step
+        for test_suite in test_run.test_suites
+        for test_case in test_suite.test_cases
+        for test_step in test_case.test_steps
+    ]
+    for test_suite in test_run.test_suites:
+        for test_case in test_suite.test_cases:
+            for index, test_step in enumerate(test_case.test_steps):
+                assert test_step.test_step_execution is not None
+                assert test_step.test_step_execution.title == test_step.name
+                assert test_step.test_step_execution.execution_index == index
+                assert (
+                    test_step.test_step_execution.test_case_execution_id
+                    == test_case.test_case_execution.id
+                )
+
+    test_case_execution_ids = [
+        test_case_execution.id
+        for test_suite_execution in test_run_execution.test_suite_executions
+        for test_case_execution in test_suite_execution.test_case_executions
+    ]
+    test_step_execution_count = db.scalar(
+        select(func.count())
+        .select_from(models.TestStepExecution)
+        .where(
+            models.TestStepExecution.test_case_execution_id.in_(test_case_execution_ids)
+        )
+    )
+    assert test_step_execution_count == len(test_steps)
+
+
+def test_pending_test_suite_executions_reuse_metadata(db: Session) -> None:
+    selected_tests = {"sample_tests": {"SampleTestSuite1": {"TCSS1001": 2}}}
+
+    first_test_run_execution = create_random_test_run_execution(
+        db=db, selected_tests=selected_tests
+    )
+
+    second_test_run_execution = create_random_test_run_execution(
+        db=db, selected_tests=selected_tests
+    )
+
+    # Metadata records are shared by the test runs of the same test versions
+    first_test_suite_execution = first_test_run_execution.test_suite_executions[0]
+    second_test_suite_execution = second_test_run_execution.test_suite_executions[0]
+    assert (
+        first_test_suite_execution.test_suite_metadata_id
+        == second_test_suite_execution.test_suite_metadata_id
+    )
+    test_case_metadata_ids = {
+        test_case_execution.test_case_metadata_id
+        for test_suite_execution in (
+            first_test_suite_execution,
+            second_test_suite_execution,
+        )
+        for test_case_execution in test_suite_execution.test_case_executions
+    }
+    assert len(test_case_metadata_ids) == 1
+
+    test_suite_metadata = first_test_suite_execution.test_suite_metadata
+    assert test_suite_metadata.source_hash == metadata_source_hash(
+        {
+            "public_id": test_suite_metadata.public_id,
+            "version": test_suite_metadata.version,
+            "title": test_suite_metadata.title,
+            "description": test_suite_metadata.description,
+        }
+    )
+
+
+def test_test_collections_discovered_once_by_concurrent_requests() -> None:
+    # Bypass the singleton, so discovery hasn't run yet
+    script_manager = TestScriptManager.__new__(TestScriptManager)
+    script_manager.__init__()  # type: ignore[misc]
+    test_collections: dict = {}
+
+    def slow_discovery() -> dict:
+        sleep(0.1)
+        return test_collections
+
+    with mock.patch(
+        "app.test_engine.test_script_manager.discover_test_collections",
+        side_effect=slow_discovery,
+    ) as discovery_mock, ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda _: script_manager.test_collections, range(4))
+        )
+
+    discovery_mock.assert_called_once()
+    assert all(result is test_collections for result in results)
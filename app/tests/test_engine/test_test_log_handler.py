@@ -21,7 +21,11 @@ from sqlalchemy.orm import Session
 from app.models import TestRunExecution
 from app.test_engine.logger import test_engine_logger
 from app.test_engine.models import TestRun
-from app.test_engine.test_log_handler import LOG_PROCESSING_INTERVAL, TestLogHandler
+from app.test_engine.test_log_handler import (
+    LOG_FLUSH_MAX_ENTRIES,
+    LOG_PROCESSING_INTERVAL,
+    TestLogHandler,
+)
 from app.tests.test_engine.test_runner import load_and_run_tool_unit_tests
 from test_collections.tool_unit_tests.test_suite_expected import TestSuiteExpected
 from test_collections.tool_unit_tests.test_suite_expected.tctr_expected_pass import (
@@ -134,6 +138,71 @@ async def test_test_log_handler_no_reuse() -> None:
     assert len(run.log) == 4
 
 
+@pytest.mark.asyncio
+async def test_test_log_handler_drops_oldest_entries() -> None:
+    run = TestRun(test_run_execution=TestRunExecution())
+    log_handler = TestLogHandler(run, max_pending_entries=2)
+
+    # Assert the oldest message is dropped when the queue is full
+    test_engine_logger.info("log message 1")
+    test_engine_logger.info("log message 2")
+    test_engine_logger.info("log message 3")
+    assert len(log_handler._TestLogHandler__pending_log_entries) == 2  # type: ignore
+    assert log_handler.dropped_log_entries == 1
+
+    # Assert remaining messages are processed after log processing interval
+    await sleep(LOG_PROCESSING_INTERVAL)
+    await log_handler.finish()
+    # Assert the dropped messages are marked in the test run log
+    assert [log_entry.message for log_entry in run.log] == [
+        "Test run log is not keeping up, dropped 1 log entries (1 so far).",
+        "log message 2",
+        "log message 3",
+    ]
+    assert run.log[0].level == "WARNING"
+
+
+@pytest.mark.asyncio
+async def test_test_log_handler_idle() -> None:
+    run = TestRun(test_run_execution=TestRunExecution())
+    log_handler = TestLogHandler(run)
+
+    # Assert nothing is processed while no messages are logged
+    await sleep(LOG_PROCESSING_INTERVAL * 2)
+    assert log_handler.flush_count == 0
+
+    # Assert a message is processed within the log processing interval
+    test_engine_logger.info("log message 1")
+    assert log_handler.queue_depth == 1
+    await sleep(LOG_PROCESSING_INTERVAL)
+    assert log_handler.queue_depth == 0
+    assert log_handler.flush_count == 1
+    assert log_handler.last_flush_latency >= LOG_PROCESSING_INTERVAL
+    assert len(run.log) == 1
+
+    await log_handler.finish()
+
+
+@pytest.mark.asyncio
+async def test_test_log_handler_flushes_on_threshold() -> None:
+    run = TestRun(test_run_execution=TestRunExecution())
+    log_handler = TestLogHandler(run)
+
+    message_count = LOG_FLUSH_MAX_ENTRIES + 1
+    for i in range(message_count):
+        test_engine_logger.info(f"log message {i}")
+    assert log_handler.queue_depth == message_count
+
+    # Assert messages are processed in bounded batches, without waiting for the log
+    # processing interval
+    await sleep(LOG_PROCESSING_INTERVAL / 10)
+    assert len(run.log) == message_count
+    assert log_handler.flush_count == 2
+    assert log_handler.max_queue_depth == message_count
+
+    await log_handler.finish()
+
+
 @pytest.mark.asyncio
 async def test_test_log_handler_metadata_exists(db: Session) -> None:
     # load and run a sample test suite
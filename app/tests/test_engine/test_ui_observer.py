@@ -17,13 +17,15 @@ from typing import Any, Dict
 from unittest import mock
 
 import pytest
+from fastapi import WebSocket
 from sqlalchemy.orm import Session
 
 from app.constants.websockets_constants import MessageKeysEnum, MessageTypeEnum
 from app.models.test_enums import TestStateEnum
 from app.models.test_run_execution import TestRunExecution
 from app.schemas.test_run_log_entry import TestRunLogEntry
-from app.test_engine.models import TestRun
+from app.socket_connection_manager import socket_connection_manager
+from app.test_engine.models import TestRun, TestStep
 from app.test_engine.test_ui_observer import TestUIObserver, TestUpdateTypeEnum
 
 
@@ -61,8 +63,147 @@ async def test_test_ui_observer_test_run_log(db: Session) -> None:
         run.notify()
         send_log_mock.assert_called_once_with(additional_log_entries)
 
-        # cleanup
-        await ui_observer.complete_tasks()
+
+def test_test_ui_observer_coalesces_test_step_updates() -> None:
+    ui_observer = TestUIObserver()
+    test_step = mock.MagicMock(spec=TestStep)
+    test_step_execution = mock.MagicMock(execution_index=2)
+    test_step_execution.test_case_execution.execution_index = 1
+    test_step_execution.test_case_execution.test_suite_execution.execution_index = 0
+    test_step.test_step_execution = test_step_execution
+    test_step.state = TestStateEnum.EXECUTING
+    test_step.errors = []
+    test_step.failures = []
+    indexes = {
+        "test_suite_execution_index": 0,
+        "test_case_execution_index": 1,
+        "test_step_execution_index": 2,
+    }
+
+    with mock.patch.object(
+        target=socket_connection_manager, attribute="broadcast_nowait"
+    ) as broadcast_mock:
+        # Updates until the next flush are merged
+        ui_observer.dispatch(test_step)
+        test_step.state = TestStateEnum.PASSED
+        ui_observer.dispatch(test_step)
+        broadcast_mock.assert_not_called()
+
+        ui_observer.send_updates()
+        broadcast_mock.assert_called_once_with(
+            __expected_test_update_dict(
+                TestUpdateTypeEnum.TEST_STEP,
+                {
+                    **indexes,
+                    "state": TestStateEnum.PASSED,
+                    "errors": [],
+                    "failures": [],
+                },
+            )
+        )
+        broadcast_mock.reset_mock()
+
+        # Only changed fields are sent
+        test_step.failures.append("Failure")
+        ui_observer.dispatch(test_step)
+        ui_observer.send_updates()
+        broadcast_mock.assert_called_once_with(
+            __expected_test_update_dict(
+                TestUpdateTypeEnum.TEST_STEP, {**indexes, "failures": ["Failure"]}
+            )
+        )
+        broadcast_mock.reset_mock()
+
+        # Nothing is sent when nothing changed
+        ui_observer.dispatch(test_step)
+        ui_observer.send_updates()
+        broadcast_mock.assert_not_called()
+
+
+def test_test_ui_observer_resyncs_connections() -> None:
+    ui_observer = TestUIObserver()
+    test_step = mock.MagicMock(spec=TestStep)
+    test_step_execution = mock.MagicMock(execution_index=2)
+    test_step_execution.test_case_execution.execution_index = 1
+    test_step_execution.test_case_execution.test_suite_execution.execution_index = 0
+    test_step.test_step_execution = test_step_execution
+    test_step.state = TestStateEnum.EXECUTING
+    test_step.errors = []
+    test_step.failures = []
+    indexes = {
+        "test_suite_execution_index": 0,
+        "test_case_execution_index": 1,
+        "test_step_execution_index": 2,
+    }
+    full_body: Dict[str, Any] = {
+        **indexes,
+        "state": TestStateEnum.PASSED,
+        "errors": [],
+        "failures": [],
+    }
+    connected_socket = mock.MagicMock(spec=WebSocket)
+    connection = mock.MagicMock(dropped_messages=0)
+    active_connections = {connected_socket: connection}
+
+    with mock.patch.object(
+        target=socket_connection_manager,
+        attribute="active_connections",
+        new=active_connections,
+    ), mock.patch.object(
+        target=socket_connection_manager, attribute="broadcast_nowait"
+    ) as broadcast_mock, mock.patch.object(
+        target=socket_connection_manager, attribute="send_personal_message_nowait"
+    ) as send_personal_mock:
+        ui_observer.dispatch(test_step)
+        ui_observer.send_updates()
+        send_personal_mock.reset_mock()
+
+        # A new connection gets the full state, the others only the changes
+        new_socket = mock.MagicMock(spec=WebSocket)
+        active_connections[new_socket] = mock.MagicMock(dropped_messages=0)
+        test_step.state = TestStateEnum.PASSED
+        ui_observer.dispatch(test_step)
+        ui_observer.send_updates()
+        broadcast_mock.assert_not_called()
+        assert send_personal_mock.call_args_list == [
+            mock.call(
+                __expected_test_update_dict(
+                    TestUpdateTypeEnum.TEST_STEP,
+                    {**indexes, "state": TestStateEnum.PASSED},
+                ),
+                connected_socket,
+            ),
+            mock.call(
+                __expected_test_update_dict(TestUpdateTypeEnum.TEST_STEP, full_body),
+                new_socket,
+            ),
+        ]
+        send_personal_mock.reset_mock()
+
+        # A connection that dropped messages gets the full state again
+        connection.dropped_messages = 1
+        ui_observer.send_updates()
+        send_personal_mock.assert_called_once_with(
+            __expected_test_update_dict(TestUpdateTypeEnum.TEST_STEP, full_body),
+            connected_socket,
+        )
+        send_personal_mock.reset_mock()
+
+        # Connections in sync only get the changes
+        test_step.failures.append("Failure")
+        ui_observer.dispatch(test_step)
+        ui_observer.send_updates()
+        send_personal_mock.assert_not_called()
+        broadcast_mock.assert_called_once()
+
+
+def __expected_test_update_dict(
+    test_type: TestUpdateTypeEnum, body: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        MessageKeysEnum.TYPE: MessageTypeEnum.TEST_UPDATE,
+        MessageKeysEnum.PAYLOAD: {"test_type": test_type, "body": body},
+    }
 
 
 def __expected_test_run_log_dict() -> Dict[str, Any]:
@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from io import BytesIO
 from typing import List
+from zipfile import ZipFile
 
 from fastapi.encoders import jsonable_encoder
 
@@ -443,3 +445,50 @@ def test_group_test_run_execution_logs() -> None:
     assert len(grouped_logs.cases[TestStateEnum.ERROR]["TC-Y-1.1"]) == 5
     assert len(grouped_logs.cases[TestStateEnum.FAILED]["TC-Y-1.2"]) == 3
     assert len(grouped_logs.cases[TestStateEnum.NOT_APPLICABLE]["TC-Y-1.4"]) == 2
+
+
+def test_log_stream_generator() -> None:
+    chunks = list(
+        log_utils.log_stream_generator(
+            log_entries=iter(mocked_log), json_entries=False, chunk_lines=3
+        )
+    )
+
+    assert len(chunks) == -(-len(mocked_log) // 3)
+    assert "".join(chunks) == "".join(
+        log_utils.log_generator(log_entries=mocked_log, json_entries=False)
+    )
+    assert chunks[0].count("\n") == 3
+
+
+def test_grouped_log_zip_generator() -> None:
+    test_run_execution = models.TestRunExecution(
+        **jsonable_encoder(mocked_test_run_execution)
+    )
+    test_run_execution.log = mocked_log
+    grouped_logs = log_utils.group_test_run_execution_logs(test_run_execution)
+
+    zip_file = ZipFile(
+        BytesIO(b"".join(log_utils.grouped_log_zip_generator(grouped_logs)))
+    )
+
+    assert zip_file.testzip() is None
+    assert zip_file.namelist() == [
+        "summary.txt",
+        "test_suites_setup_and_cleanup.log",
+        "passed_test_cases.log",
+        "error_test_cases.log",
+        "failed_test_cases.log",
+        "not_applicable_test_cases.log",
+    ]
+
+    general_logs = log_utils.LOG_SECTION_TEMPLATE.format("Test run general logs")
+    general_logs += "".join(
+        log_utils.log_generator(log_entries=grouped_logs.general, json_entries=False)
+    )
+    passed_logs = zip_file.read("passed_test_cases.log").decode()
+    assert passed_logs.startswith(general_logs)
+    assert log_utils.LOG_SECTION_TEMPLATE.format("TC-X-1.1 logs") in passed_logs
+    suites_logs = zip_file.read("test_suites_setup_and_cleanup.log").decode()
+    assert suites_logs.startswith(general_logs)
+    assert "TC-X-1.1" in zip_file.read("summary.txt").decode()
@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 import importlib
+import importlib.util
 from pathlib import Path
 from typing import Optional
 
@@ -57,7 +58,10 @@ def read_matter_sdk_sha() -> Optional[str]:
     """
     Retrieve short SDK SHA from settings (The information is kept in config.py file)
     """
-    if importlib.find_loader(MATTER_CONFIG_MODULE) is None:
+    try:
+        if importlib.util.find_spec(MATTER_CONFIG_MODULE) is None:
+            return None
+    except ModuleNotFoundError:
         return None
 
     matter_config_module = importlib.import_module(MATTER_CONFIG_MODULE)
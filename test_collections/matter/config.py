@@ -20,6 +20,9 @@ class MatterSettings(BaseSettings):
     # Test Engine Config
     CHIP_TOOL_TRACE: bool = True
     SDK_CONTAINER_NAME: str = "th-sdk"
+    # Seconds a released SDK container is kept running to be reused by the next test
+    # suite, 0 to destroy it right away
+    SDK_CONTAINER_KEEP_WARM_SECONDS: int = 300
 
     # SDK Docker Image
     SDK_DOCKER_IMAGE: str = "connectedhomeip/chip-cert-bins"
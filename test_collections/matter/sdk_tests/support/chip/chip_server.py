@@ -15,15 +15,19 @@
 #
 from __future__ import annotations
 
+import asyncio
+from asyncio import CancelledError
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from random import randrange
-from time import sleep, time
+from threading import Event
+from time import time
 from typing import Generator, Optional, Union, cast
 
 import loguru
 
+from app.container_manager import container_manager
 from app.singleton import Singleton
 from app.test_engine.logger import CHIPTOOL_LEVEL
 from app.test_engine.logger import test_engine_logger as logger
@@ -99,7 +103,32 @@ class ChipServer(metaclass=Singleton):
         return self.__node_id
 
     async def __wait_for_server_start(self, log_generator: Generator) -> bool:
+        # Reading the docker exec stream blocks, so it's done in a worker thread to
+        # keep the event loop responsive while the server starts
+        stop_reading = Event()
+        reader = asyncio.ensure_future(
+            container_manager.run_in_executor(
+                self.__read_logs_until_server_start, log_generator, stop_reading
+            )
+        )
+        try:
+            return await asyncio.shield(reader)
+        except CancelledError:
+            # The worker is blocked until the next log chunk, stopping the server
+            # ends the stream so it doesn't keep reading after the cancellation
+            stop_reading.set()
+            try:
+                await self.__send_server_stop_signal()
+            finally:
+                await asyncio.wait([reader], timeout=CHIP_SERVER_EXIT_TIMEOUT)
+            raise
+
+    def __read_logs_until_server_start(
+        self, log_generator: Generator, stop_reading: Event
+    ) -> bool:
         for chunk in log_generator:
+            if stop_reading.is_set():
+                return False
             decoded_log = chunk.decode().strip()
             log_lines = decoded_log.splitlines()
             for line in log_lines:
@@ -146,7 +175,8 @@ class ChipServer(metaclass=Singleton):
         # Need to store the command to use it later to stop the proccess
         self.__server_full_command = " ".join([prefix] + command)
 
-        exec_result = self.sdk_container.send_command(
+        exec_result = await container_manager.run_in_executor(
+            self.sdk_container.send_command,
             command,
             prefix=prefix,
             is_stream=True,
@@ -165,7 +195,7 @@ class ChipServer(metaclass=Singleton):
 
         return cast(Generator, self.__server_logs)
 
-    def __wait_for_server_exit(self) -> Optional[int]:
+    async def __wait_for_server_exit(self) -> Optional[int]:
         if self.__chip_server_id is None:
             self.logger.info(
                 "Server execution id not found, cannot wait for server exit."
@@ -177,15 +207,19 @@ class ChipServer(metaclass=Singleton):
         # In case the timeout is triggered, the process continues after logging
         sleeping_seconds = CHIP_SERVER_EXIT_TIMEOUT / 5
         timeout = time() + CHIP_SERVER_EXIT_TIMEOUT
-        exit_code = self.sdk_container.exec_exit_code(self.__chip_server_id)
+        exit_code = await container_manager.run_in_executor(
+            self.sdk_container.exec_exit_code, self.__chip_server_id
+        )
 
         while exit_code is None and time() <= timeout:
             self.logger.info(
                 f"Sleeping for {sleeping_seconds} seconds before verifying chip server "
                 "exit code again."
             )
-            sleep(sleeping_seconds)
-            exit_code = self.sdk_container.exec_exit_code(self.__chip_server_id)
+            await asyncio.sleep(sleeping_seconds)
+            exit_code = await container_manager.run_in_executor(
+                self.sdk_container.exec_exit_code, self.__chip_server_id
+            )
 
         if exit_code is None:
             raise ChipServerExitError("Timeout while waiting to exit chip server")
@@ -197,10 +231,8 @@ class ChipServer(metaclass=Singleton):
             return
 
         try:
-            self.sdk_container.send_command(
-                f'-SIGTERM -f "{self.__server_full_command}"', prefix="pkill"
-            )
-            self.__wait_for_server_exit()
+            await self.__send_server_stop_signal()
+            await self.__wait_for_server_exit()
         except Exception as e:
             # Issue: https://github.com/project-chip/certification-tool/issues/414
             self.logger.info(
@@ -211,6 +243,13 @@ class ChipServer(metaclass=Singleton):
 
         self.__server_started = False
 
+    async def __send_server_stop_signal(self) -> None:
+        await container_manager.run_in_executor(
+            self.sdk_container.send_command,
+            f'-SIGTERM -f "{self.__server_full_command}"',
+            prefix="pkill",
+        )
+
     def trace_file_params(self, topic: str) -> str:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H.%M.%S")
         filename = f"trace_log_{timestamp}_{hex(self.node_id)}_{topic}.log"
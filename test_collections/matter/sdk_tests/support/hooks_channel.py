@@ -0,0 +1,125 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import json
+import struct
+from typing import AsyncIterator, Callable, Generic, Optional, TypeVar, cast
+
+from app.test_engine.logger import test_engine_logger as logger
+
+# Keep these constants synced with "test_harness_client.py"
+HOOKS_CHANNEL_HOST = "0.0.0.0"
+HOOKS_CHANNEL_PORT = 50000
+HOOKS_FRAME_HEADER = struct.Struct("!I")
+HOOKS_STOP_EVENT = "stop"
+
+T = TypeVar("T")
+
+
+class HooksChannel(Generic[T]):
+    """Receives the test runner hook events pushed by the SDK container.
+
+    `test_harness_client.py` connects to this server and writes one frame per hook
+    call: a 4 bytes big-endian length followed by a JSON object with the hook name
+    under "type" and the hook arguments as the remaining keys. The client buffers
+    frames for a short interval (HOOKS_BATCH_INTERVAL in test_harness_client.py)
+    and sends them together, so a burst of step events arrives in a single read.
+
+    Frames are parsed into results and handed to the test case through `updates()`,
+    so the event loop is only woken up when the SDK actually reports something.
+
+    Usage:
+        channel = HooksChannel(parse_result)
+        await channel.start()
+        try:
+            # start the test in the SDK container
+            async for update in channel.updates():
+                ...
+        finally:
+            await channel.close()
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[dict], T],
+        host: str = HOOKS_CHANNEL_HOST,
+        port: int = HOOKS_CHANNEL_PORT,
+    ) -> None:
+        self.__parse = parse
+        self.__host = host
+        self.__port = port
+        self.__server: Optional[asyncio.AbstractServer] = None
+        # None is used as end of stream marker
+        self.__results: asyncio.Queue[Optional[T]] = asyncio.Queue()
+
+    async def start(self) -> None:
+        """Start listening. Must be awaited before the SDK test is launched."""
+        self.__server = await asyncio.start_server(
+            self.__handle_connection,
+            host=self.__host,
+            port=self.__port,
+            reuse_address=True,
+        )
+
+    async def close(self) -> None:
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+
+    async def updates(self) -> AsyncIterator[T]:
+        """Yield results until the SDK reports `stop` or closes the connection."""
+        async for batch in self.batches():
+            for result in batch:
+                yield result
+
+    async def batches(self) -> AsyncIterator[list[T]]:
+        """Yield all results received since the previous batch.
+
+        Waits for at least one result, so consumers are only woken up once per burst
+        of events instead of once per event.
+        """
+        finished = False
+        while not finished:
+            batch = [await self.__results.get()]
+            while not self.__results.empty():
+                batch.append(self.__results.get_nowait())
+
+            end = next((i for i, result in enumerate(batch) if result is None), None)
+            if end is not None:
+                finished = True
+                batch = batch[:end]
+
+            if batch:
+                yield cast(list[T], batch)
+
+    async def __handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                header = await reader.readexactly(HOOKS_FRAME_HEADER.size)
+                (length,) = HOOKS_FRAME_HEADER.unpack(header)
+                event = json.loads(await reader.readexactly(length))
+                self.__results.put_nowait(self.__parse(event))
+                if event.get("type") == HOOKS_STOP_EVENT:
+                    break
+        except asyncio.IncompleteReadError:
+            logger.debug("Test runner hooks connection closed by the SDK container")
+        except ValueError as e:
+            logger.error(f"Invalid test runner hooks event received: {e}")
+        finally:
+            self.__results.put_nowait(None)
+            writer.close()
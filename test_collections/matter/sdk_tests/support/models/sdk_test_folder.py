@@ -13,9 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from hashlib import sha1
 from pathlib import Path
 
 from ..paths import SDK_CHECKOUT_PATH
+from .sdk_test_manifest import SDKTestManifest
 
 UNKNOWN_version = "Unknown"
 VERSION_FILE_FILENAME = ".version"
@@ -55,3 +57,15 @@ class SDKTestFolder:
             list[Path]: list of paths to test files.
         """
         return list(self.path.glob(self.filename_pattern + extension))
+
+    def manifest(self, name: str) -> SDKTestManifest:
+        """Discovery manifest caching the parsed test files of this folder.
+
+        Args:
+            name (str): identifies what is cached, e.g. "yaml"
+
+        Returns:
+            SDKTestManifest: manifest bound to this folder and its SDK version.
+        """
+        folder_id = sha1(f"{self.path}/{self.filename_pattern}".encode()).hexdigest()
+        return SDKTestManifest(name=f"{name}-{folder_id[:12]}", version=self.version)
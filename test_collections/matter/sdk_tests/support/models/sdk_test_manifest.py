@@ -0,0 +1,178 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Callable, NamedTuple, Optional, TypeVar
+
+from loguru import logger
+
+from ..paths import SDK_CHECKOUT_PATH, SUPPORT_PATH
+
+MANIFESTS_PATH = SDK_CHECKOUT_PATH / ".discovery_manifests"
+# Bump when the layout of the manifest itself changes
+MANIFEST_FORMAT_VERSION = 1
+
+T = TypeVar("T")
+
+
+class ManifestEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+    parsed: Any
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def manifest_format() -> str:
+    """Manifest format version and hash of the backend code parsing SDK test files.
+
+    The manifest is stored in the SDK checkout, which is kept across backend updates,
+    and the pickled test models of a previous backend may not match the current ones.
+    """
+    digest = hashlib.sha256(str(MANIFEST_FORMAT_VERSION).encode())
+    for path in sorted(SUPPORT_PATH.rglob("*.py")):
+        relative_path = path.relative_to(SUPPORT_PATH)
+        if relative_path.parts[0] == "tests":
+            continue
+        digest.update(relative_path.as_posix().encode())
+        digest.update(path.read_bytes())
+
+    return f"{MANIFEST_FORMAT_VERSION}-{digest.hexdigest()}"
+
+
+class SDKTestManifest:
+    """On-disk cache of parsed SDK test files.
+
+    Parsing the SDK test files is the most expensive part of test collection
+    discovery, and discovery runs in every backend worker. The manifest stores the
+    parsed result of each file, so it is reused while the SDK version (.version file
+    read by SDKTestFolder) and the file content is unchanged. The file modification
+    time and size are checked first, the content hash is only computed when they
+    differ (e.g. the SDK checkout was fetched again). Only new or modified files are
+    parsed again. The whole manifest is discarded when the backend code changes.
+
+    Usage:
+        manifest = SDKTestManifest(name="sdk_yaml", version=folder.version)
+        tests = [manifest.load(path, parse_yaml_test) for path in paths]
+        manifest.save()
+    """
+
+    def __init__(
+        self, name: str, version: str, manifests_path: Path = MANIFESTS_PATH
+    ) -> None:
+        self.version = version
+        self.file_path = manifests_path / f"{name}.pickle"
+        self.__entries: dict[str, ManifestEntry] = self.__read()
+        self.__loaded: set[str] = set()
+        self.__changed = False
+
+    def load(self, path: Path, parse: Callable[[Path], T]) -> T:
+        """Return the parsed content of the file, parsing it only when needed.
+
+        Exceptions raised by `parse` are propagated and nothing is cached.
+        """
+        key = str(path)
+        self.__loaded.add(key)
+
+        entry = self.__fresh_entry(path)
+        if entry is not None:
+            return entry.parsed
+
+        parsed = parse(path)
+        stat = path.stat()
+        self.__entries[key] = ManifestEntry(
+            stat.st_mtime_ns, stat.st_size, file_digest(path), parsed
+        )
+        self.__changed = True
+        return parsed
+
+    def is_fresh(self, path: Path) -> bool:
+        """Whether `load` would return the cached content without parsing the file."""
+        return self.__fresh_entry(path) is not None
+
+    def save(self) -> None:
+        """Persist the manifest if files were parsed or removed since it was read."""
+        stale_keys = self.__entries.keys() - self.__loaded
+        for key in stale_keys:
+            del self.__entries[key]
+
+        if not self.__changed and not stale_keys:
+            return
+
+        try:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Several workers may discover at the same time, write the new manifest
+            # to a temporary file and atomically replace the existing one
+            with NamedTemporaryFile(
+                "wb", dir=self.file_path.parent, delete=False
+            ) as file:
+                pickle.dump(
+                    {
+                        "format": manifest_format(),
+                        "version": self.version,
+                        "entries": self.__entries,
+                    },
+                    file,
+                )
+            os.replace(file.name, self.file_path)
+            self.__changed = False
+        except OSError as e:
+            logger.warning(f"Could not save discovery manifest {self.file_path}: {e}")
+
+    def __fresh_entry(self, path: Path) -> Optional[ManifestEntry]:
+        key = str(path)
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+
+        stat = path.stat()
+        if entry.size != stat.st_size:
+            return None
+
+        if entry.mtime_ns != stat.st_mtime_ns:
+            if entry.digest != file_digest(path):
+                return None
+            entry = entry._replace(mtime_ns=stat.st_mtime_ns)
+            self.__entries[key] = entry
+            self.__changed = True
+
+        return entry
+
+    def __read(self) -> dict[str, ManifestEntry]:
+        if not self.file_path.exists():
+            return {}
+
+        try:
+            with open(self.file_path, "rb") as file:
+                manifest = pickle.load(file)
+        except Exception as e:
+            logger.warning(f"Ignoring invalid manifest {self.file_path}: {e}")
+            return {}
+
+        if (
+            manifest.get("format") != manifest_format()
+            or manifest.get("version") != self.version
+        ):
+            return {}
+
+        return manifest["entries"]
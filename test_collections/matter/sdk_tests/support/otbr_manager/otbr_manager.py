@@ -54,7 +54,7 @@ class ThreadBorderRouter(metaclass=Singleton):
 
     Usage:
     Create an instance by calling initializer. When ready to use, start the device by
-    calling start_device and when done cleanup by calling destroy_device
+    calling start_device and when done cleanup by calling destroy_device_async
     """
 
     tool_network_name = "host"
@@ -123,7 +123,7 @@ class ThreadBorderRouter(metaclass=Singleton):
         are running.
         Return false, if container is already running.
         """
-        if self.is_running():
+        if await container_manager.run_in_executor(self.is_running):
             logger.warning(
                 "OTBR container is already running for " + self.__docker_image
             )
@@ -144,7 +144,7 @@ class ThreadBorderRouter(metaclass=Singleton):
             err_msg = "Border router does not start properly for " + self.__docker_image
             logger.warning(self.__otbr_docker.logs().decode("utf-8"))
             logger.error(err_msg)
-            self.destroy_device()
+            await self.destroy_device_async()
             raise ThreadBorderRouterError(err_msg)
 
         logger.info(
@@ -225,6 +225,11 @@ class ThreadBorderRouter(metaclass=Singleton):
         # Allow OTBR extra time to form the network, before attempting to use.
         await asyncio.sleep(OTBR_READINESS_EXTRA_TIME)
 
+    async def destroy_device_async(self) -> None:
+        """Destroy the device container, running the docker calls in the docker
+        pool."""
+        await container_manager.run_in_executor(self.destroy_device)
+
     def destroy_device(self) -> None:
         """Destroy the device container and associated rpc client."""
         if self.__otbr_docker is None:
@@ -0,0 +1,122 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+from bisect import bisect_left, insort
+from typing import Any, Optional
+
+PERCENTILES = (50, 90, 95, 99)
+HISTOGRAM_BUCKETS = 10
+# Values outside [Q1 - k * IQR, Q3 + k * IQR] are flagged as outliers (Tukey fences)
+OUTLIER_IQR_FACTOR = 1.5
+
+
+class DurationAnalytics:
+    """Statistics for a series of durations, updated as each value is added.
+
+    Values are kept sorted on insertion and mean/variance are accumulated with
+    Welford's algorithm, so a report never needs to sort or scan all values again.
+    The summary is cached until the next value is added.
+    """
+
+    def __init__(self, unit: str = "ms") -> None:
+        self.unit = unit
+        self.__values: list[float] = []
+        self.__sorted: list[float] = []
+        self.__mean = 0.0
+        self.__m2 = 0.0
+        self.__summary: Optional[dict[str, Any]] = None
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def add(self, value: float) -> None:
+        self.__values.append(value)
+        insort(self.__sorted, value)
+
+        delta = value - self.__mean
+        self.__mean += delta / len(self.__values)
+        self.__m2 += delta * (value - self.__mean)
+        self.__summary = None
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.__mean if self.__values else None
+
+    @property
+    def stddev(self) -> Optional[float]:
+        if not self.__values:
+            return None
+        return math.sqrt(self.__m2 / len(self.__values))
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Percentile using linear interpolation between the closest ranks."""
+        if not self.__sorted:
+            return None
+
+        rank = (len(self.__sorted) - 1) * percentile / 100
+        lower = math.floor(rank)
+        upper = min(lower + 1, len(self.__sorted) - 1)
+        weight = rank - lower
+        return self.__sorted[lower] * (1 - weight) + self.__sorted[upper] * weight
+
+    def histogram(self, buckets: int = HISTOGRAM_BUCKETS) -> dict[str, list]:
+        """Equal width buckets between min and max, the last edge is inclusive."""
+        if not self.__sorted:
+            return {"edges": [], "counts": []}
+
+        low, high = self.__sorted[0], self.__sorted[-1]
+        if low == high:
+            return {"edges": [low, high], "counts": [len(self.__sorted)]}
+
+        width = (high - low) / buckets
+        edges = [low + width * i for i in range(buckets)] + [high]
+        positions = [bisect_left(self.__sorted, edge) for edge in edges[:-1]]
+        positions.append(len(self.__sorted))
+        counts = [end - begin for begin, end in zip(positions, positions[1:])]
+        return {"edges": edges, "counts": counts}
+
+    def outliers(self) -> list[int]:
+        """Indexes, in insertion order, of the values outside the Tukey fences."""
+        if len(self.__sorted) < 4:
+            return []
+
+        q1, q3 = self.percentile(25), self.percentile(75)
+        assert q1 is not None and q3 is not None
+        fence = (q3 - q1) * OUTLIER_IQR_FACTOR
+        low, high = q1 - fence, q3 + fence
+        # Most values are within the fences, check the sorted tails first
+        if self.__sorted[0] >= low and self.__sorted[-1] <= high:
+            return []
+
+        return [i for i, value in enumerate(self.__values) if not low <= value <= high]
+
+    def summary(self) -> dict[str, Any]:
+        if self.__summary is not None:
+            return self.__summary
+
+        summary: dict[str, Any] = {
+            "count": len(self.__values),
+            "unit": self.unit,
+            "min": self.__sorted[0] if self.__sorted else None,
+            "max": self.__sorted[-1] if self.__sorted else None,
+            "mean": self.mean,
+            "stddev": self.stddev,
+        }
+        for percentile in PERCENTILES:
+            summary[f"p{percentile}"] = self.percentile(percentile)
+        summary["histogram"] = self.histogram()
+        summary["outliers"] = self.outliers()
+        self.__summary = summary
+        return summary
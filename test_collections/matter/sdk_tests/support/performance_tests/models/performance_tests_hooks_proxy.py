@@ -14,10 +14,8 @@
 # limitations under the License.
 #
 from enum import Enum
-from queue import Empty, Queue
-from typing import Any, Optional, Union
+from typing import Any, Optional, Type
 
-from matter.yamltests.hooks import TestRunnerHooks
 from pydantic import BaseModel
 
 
@@ -116,97 +114,27 @@ class SDKPerformanceResultShowPrompt(SDKPerformanceResultBase):
     default_value: Optional[str]
 
 
-class SDKPerformanceRunnerHooks(TestRunnerHooks):
-    finished = False
-    results: Queue
-
-    def __init__(self) -> None:
-        SDKPerformanceRunnerHooks.finished = False
-        SDKPerformanceRunnerHooks.results = Queue()
-
-    def update_test(self) -> Union[dict, None]:
-        try:
-            result = self.results.get(block=False)
-            return result
-        except Empty:
-            return None
-
-    def is_finished(self) -> bool:
-        return SDKPerformanceRunnerHooks.finished
-
-    def start(self, count: int) -> None:
-        self.results.put(SDKPerformanceResultStart(count=count))
-
-    def stop(self, duration: int) -> None:
-        self.results.put(SDKPerformanceResultStop(duration=duration))
-        SDKPerformanceRunnerHooks.finished = True
-
-    def test_start(
-        self, filename: str, name: str, count: int, steps: list[str] = []
-    ) -> None:
-        self.results.put(
-            SDKPerformanceResultTestStart(
-                filename=filename, name=name, count=count, steps=steps
-            )
-        )
-
-    def test_stop(self, exception: Exception, duration: int) -> None:
-        self.results.put(
-            SDKPerformanceResultTestStop(exception=exception, duration=duration)
-        )
-
-    def test_skipped(self, filename: str, name: str) -> None:
-        self.results.put(SDKPerformanceResultTestSkipped(filename=filename, name=name))
-
-    def step_skipped(self, name: str, expression: str) -> None:
-        self.results.put(
-            SDKPerformanceResultStepSkipped(name=name, expression=expression)
-        )
-
-    def step_start(self, name: str) -> None:
-        self.results.put(SDKPerformanceResultStepStart(name=name))
-
-    def step_success(self, logger: Any, logs: Any, duration: int, request: Any) -> None:
-        self.results.put(
-            SDKPerformanceResultStepSuccess(
-                logger=logger,
-                logs=logs,
-                duration=duration,
-                request=request,
-            )
-        )
-
-    def step_failure(
-        self, logger: Any, logs: Any, duration: int, request: Any, received: Any
-    ) -> None:
-        self.results.put(
-            SDKPerformanceResultStepFailure(
-                logger=logger,
-                logs=logs,
-                duration=duration,
-                request=request,
-                received=received,
-            )
-        )
-
-    def step_unknown(self) -> None:
-        self.results.put(SDKPerformanceResultStepUnknown())
-
-    async def step_manual(self) -> None:
-        self.results.put(SDKPerformanceResultStepManual())
-
-    def show_prompt(
-        self,
-        msg: str,
-        placeholder: Optional[str] = None,
-        default_value: Optional[str] = None,
-        endpoint_id: Optional[int] = None,
-    ) -> None:
-        self.results.put(
-            SDKPerformanceResultShowPrompt(
-                msg=msg, placeholder=placeholder, default_value=default_value
-            )
-        )
-
-    def step_start_list(self) -> None:
-        pass
+SDK_PERFORMANCE_RESULT_TYPES: dict[
+    SDKPerformanceResultEnum, Type[SDKPerformanceResultBase]
+] = {
+    SDKPerformanceResultEnum.START: SDKPerformanceResultStart,
+    SDKPerformanceResultEnum.STOP: SDKPerformanceResultStop,
+    SDKPerformanceResultEnum.TEST_START: SDKPerformanceResultTestStart,
+    SDKPerformanceResultEnum.TEST_STOP: SDKPerformanceResultTestStop,
+    SDKPerformanceResultEnum.TEST_SKIPPED: SDKPerformanceResultTestSkipped,
+    SDKPerformanceResultEnum.STEP_SKIPPED: SDKPerformanceResultStepSkipped,
+    SDKPerformanceResultEnum.STEP_START: SDKPerformanceResultStepStart,
+    SDKPerformanceResultEnum.STEP_SUCCESS: SDKPerformanceResultStepSuccess,
+    SDKPerformanceResultEnum.STEP_FAILURE: SDKPerformanceResultStepFailure,
+    SDKPerformanceResultEnum.STEP_UNKNOWN: SDKPerformanceResultStepUnknown,
+    SDKPerformanceResultEnum.STEP_MANUAL: SDKPerformanceResultStepManual,
+    SDKPerformanceResultEnum.SHOW_PROMPT: SDKPerformanceResultShowPrompt,
+}
+
+
+def parse_performance_result(event: dict) -> SDKPerformanceResultBase:
+    """Parse a hook event sent by test_harness_client.py into its result model."""
+    result_type = SDK_PERFORMANCE_RESULT_TYPES[
+        SDKPerformanceResultEnum(event.get("type"))
+    ]
+    return result_type.parse_obj(event)
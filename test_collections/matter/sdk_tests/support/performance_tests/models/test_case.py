@@ -14,13 +14,12 @@
 # limitations under the License.
 #
 import re
-from asyncio import sleep
 from enum import IntEnum
 from inspect import iscoroutinefunction
-from multiprocessing.managers import BaseManager
 from pathlib import Path
 from typing import Any, Type, TypeVar
 
+from app.container_manager import container_manager
 from app.models import TestCaseExecution
 from app.test_engine.logger import PYTHON_TEST_LEVEL
 from app.test_engine.logger import test_engine_logger as logger
@@ -29,15 +28,34 @@ from app.test_engine.models.test_case import CUSTOM_TEST_IDENTIFIER
 from app.user_prompt_support.user_prompt_support import UserPromptSupport
 from test_collections.matter.test_environment_config import TestEnvironmentConfigMatter
 
+from ...hooks_channel import HooksChannel
 from ...pics import PICS_FILE_PATH
 from ...sdk_container import SDKContainer
+from ..analytics import DurationAnalytics
+from ..utils import CommissioningLogParser
 from .performance_tests_hooks_proxy import (
     SDKPerformanceResultBase,
-    SDKPerformanceRunnerHooks,
+    parse_performance_result,
 )
 from .performance_tests_models import PerformanceTest
 from .utils import EXECUTABLE, RUNNER_CLASS_PATH, generate_command_arguments
 
+TEST_OUTPUT_PATH = (
+    Path(__file__).parents[3] / "sdk_checkout/python_testing/test_output.txt"
+)
+
+# This is a temporary workaround since Python Test are generating a big amount of
+# log, only these entries are added to the test run log
+LOG_FILTER_ENTRIES = [
+    "INFO Successfully",
+    "INFO Performing next",
+    "INFO Internal Control",
+    "'kEstablishing' --> 'kActive'",
+    "SecureChannel:PBKDFParamRequest",
+    "Discovered Device:",
+    "|=====",
+]
+
 
 class PromptOption(IntEnum):
     YES = 1
@@ -69,7 +87,16 @@ class PerformanceTestCase(TestCase, UserPromptSupport):
     def __init__(self, test_case_execution: TestCaseExecution) -> None:
         super().__init__(test_case_execution=test_case_execution)
         self.test_stop_called = False
-        self.step_execution_times = []  # type: ignore[var-annotated]
+        self.step_execution_times = DurationAnalytics(unit="ms")
+        # Commissioning iterations are parsed from the test output while it is
+        # written, instead of reading the whole output back after the run
+        self.log_parser = CommissioningLogParser()
+        self.__test_output_offset = 0
+        self.__filtered_logs: list[str] = []
+
+    @property
+    def analytics(self) -> dict[str, Any]:
+        return self.generate_analytics_data()
 
     def start(self, count: int) -> None:
         pass
@@ -99,8 +126,7 @@ class PerformanceTestCase(TestCase, UserPromptSupport):
 
     def step_success(self, logger: Any, logs: str, duration: int, request: Any) -> None:
         duration_ms = int(duration / 1000)
-        self.step_execution_times.append(duration_ms)
-        self.analytics = self.generate_analytics_data()
+        self.step_execution_times.add(duration_ms)
         self.next_step()
 
     def step_failure(
@@ -113,25 +139,8 @@ class PerformanceTestCase(TestCase, UserPromptSupport):
         self.mark_step_failure(failure_msg)
         self.skip_to_last_step()
 
-    def generate_analytics_data(self) -> dict[str, str]:
-        print(self.step_execution_times)
-        self.step_execution_times.sort()
-        print(self.step_execution_times)
-        sorted_list_size = len(self.step_execution_times)
-        p50_index = int(sorted_list_size * (50 / 100))
-        p95_index = int(sorted_list_size * (95 / 100))
-        p99_index = int(sorted_list_size * (99 / 100))
-
-        try:
-            return {
-                "p50": f"{self.step_execution_times[p50_index]}",
-                "p95": f"{self.step_execution_times[p95_index]}",
-                "p99": f"{self.step_execution_times[p99_index]}",
-                "unit": "ms",
-            }
-        except:  # noqa: E722
-            logger.info("Error generating analytics data for step execution times.")
-        return {"p50": "0", "p95": "0", "p99": "0", "unit": "ms"}
+    def generate_analytics_data(self) -> dict[str, Any]:
+        return self.step_execution_times.summary()
 
     @classmethod
     def pics(cls) -> set[str]:
@@ -200,47 +209,45 @@ class PerformanceTestCase(TestCase, UserPromptSupport):
     async def cleanup(self) -> None:
         logger.info("Test Cleanup")
         try:
-            self.sdk_container.destroy()
+            await self.sdk_container.release()
         except Exception:
             pass
 
     def handle_logs_temp(self) -> None:
-        sdk_tests_path = Path(Path(__file__).parents[3])
-        file_output_path = (
-            sdk_tests_path / "sdk_checkout/python_testing/test_output.txt"
-        )
+        self.__read_test_output(final=True)
+        for line in self.__filtered_logs:
+            logger.log(PYTHON_TEST_LEVEL, line)
+        self.__filtered_logs.clear()
 
-        filter_entries = [
-            "INFO Successfully",
-            "INFO Performing next",
-            "INFO Internal Control",
-            "'kEstablishing' --> 'kActive'",
-            "SecureChannel:PBKDFParamRequest",
-            "Discovered Device:",
-            "|=====",
-        ]
-
-        # This is a temporary workaround since Python Test are generating a
-        # big amount of log
-        sdk_tests_path = Path(Path(__file__).parents[3])
-        file_output_path = (
-            sdk_tests_path / "sdk_checkout/python_testing/test_output.txt"
-        )
-        with open(file_output_path) as f:
-            for line in f:
-                if any(specific_string in line for specific_string in filter_entries):
-                    logger.log(PYTHON_TEST_LEVEL, line)
+    def __read_test_output(self, final: bool = False) -> None:
+        """Feed the test output written since the last read to the log parser.
+
+        A partially written last line is kept for the next read, unless this is the
+        final read after the test finished.
+        """
+        try:
+            with open(TEST_OUTPUT_PATH, "rb") as f:
+                f.seek(self.__test_output_offset)
+                output = f.read()
+        except FileNotFoundError:
+            return
+
+        end = len(output) if final else output.rfind(b"\n") + 1
+        self.__test_output_offset += end
+        for line in output[:end].decode(errors="replace").splitlines():
+            self.log_parser.feed(line)
+            if any(entry in line for entry in LOG_FILTER_ENTRIES):
+                self.__filtered_logs.append(line)
 
     async def execute(self) -> None:
+        hooks_channel = HooksChannel(parse_performance_result)
         try:
             logger.info(
                 "Running Stress & Stability Test: " + self.performance_test.name
             )
 
-            BaseManager.register("TestRunnerHooks", SDKPerformanceRunnerHooks)
-            manager = BaseManager(address=("0.0.0.0", 50000), authkey=b"abc")
-            manager.start()
-            test_runner_hooks = manager.TestRunnerHooks()  # type: ignore
+            # The channel must be listening before the test script is started
+            await hooks_channel.start()
 
             if not self.performance_test.path:
                 raise PerformanceTestCaseError(
@@ -272,7 +279,8 @@ class PerformanceTestCase(TestCase, UserPromptSupport):
 
             command.append(f" --interactions {(len(self.test_steps) - 2)}")
 
-            self.sdk_container.send_command(
+            await container_manager.run_in_executor(
+                self.sdk_container.send_command,
                 command,
                 prefix=EXECUTABLE,
                 is_stream=False,
@@ -280,14 +288,11 @@ class PerformanceTestCase(TestCase, UserPromptSupport):
                 is_detach=True,
             )
 
-            while ((update := test_runner_hooks.update_test()) is not None) or (
-                not test_runner_hooks.is_finished()
-            ):
-                if not update:
-                    await sleep(0.0001)
-                    continue
-
-                await self.__handle_update(update)
+            # Stress iterations report many steps in bursts, handle them per batch
+            async for batch in hooks_channel.batches():
+                for update in batch:
+                    await self.__handle_update(update)
+                self.__read_test_output()
 
             # Step: Show test logs
 
@@ -298,9 +303,12 @@ class PerformanceTestCase(TestCase, UserPromptSupport):
 
             logger.info("---- End of Performance test logs ----")
 
+            # The analytics are up to date once the last iteration was parsed
+            self.test_case_execution.analytics = self.log_parser.analytics_summary()
+
             self.current_test_step.mark_as_completed()
         finally:
-            pass
+            await hooks_channel.close()
 
     def skip_to_last_step(self) -> None:
         self.current_test_step.mark_as_completed()
@@ -19,9 +19,10 @@ import re
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from ..models.sdk_test_folder import SDKTestFolder
+from .analytics import DurationAnalytics
 
 STRESS_TEST_COLLECTION = "SDK Performance Tests"
 STRESS_TEST_SUITE = "Performance Test Suite"
@@ -29,19 +30,23 @@ STRESS_TEST_PATH = Path(__file__).resolve().parent / "scripts/sdk/"
 STRESS_TEST_FOLDER = SDKTestFolder(path=STRESS_TEST_PATH, filename_pattern="TC_*")
 
 date_pattern = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+"
+date_regex = re.compile(date_pattern)
 date_pattern_out_folder = "%d-%m-%Y_%H-%M-%S-%f"
 datetime_json_pattern = "%Y-%m-%dT%H:%M:%S.%f"
 
+ANALYTICS_PARAMETERS = [
+    "durations",
+    "discovery_durations",
+    "read_durations",
+    "PASE_durations",
+]
+
 
 # Creates the file structure and content required by matter_qa visualization tool.
 # Returns the test case name and the folder name where the report is save.
 def create_summary_report(
-    timestamp: str, log_lines: list, commissioning_method: str
+    timestamp: str, log_lines: Iterable[str], commissioning_method: str
 ) -> tuple[str, str]:
-    tc_name = ""
-    tc_suite = ""
-    log_lines_list = "\n".join(log_lines)
-
     LOGS_FOLDER = "/test_collections/logs"
     CONTAINER_BACKEND = os.getenv("PYTHONPATH") or ""
     CONTAINER_OUT_FOLDER = CONTAINER_BACKEND + LOGS_FOLDER
@@ -49,145 +54,56 @@ def create_summary_report(
         shutil.rmtree(CONTAINER_OUT_FOLDER)
     os.makedirs(CONTAINER_OUT_FOLDER)
 
-    with open(
-        CONTAINER_OUT_FOLDER + f"/Performance_Test_Run_{timestamp}.log", "w"
-    ) as f:
-        f.write(str(log_lines_list))
+    log_file_path = CONTAINER_OUT_FOLDER + f"/Performance_Test_Run_{timestamp}.log"
 
-    files = os.listdir(CONTAINER_OUT_FOLDER)
+    # Log lines are parsed while being written, so the log is read only once
+    parser = CommissioningLogParser()
+    with open(log_file_path, "w") as f:
+        for line in log_lines:
+            f.write(line + "\n")
+            parser.feed(line)
 
-    commissioning_list = []
+    commissioning_list = parser.iterations
 
     execution_begin_time = []
     execution_end_time = []
 
-    execution_logs = []
-    execution_status = []
-
-    for file_name in files:
-        file_path = os.path.join(CONTAINER_OUT_FOLDER, file_name)
-        commissioning_obj: Optional[Commissioning] = None
-        file_execution_time = None
-        tc_result = None
-        tc_execution_in_file = 0
-
-        if os.path.isfile(file_path):
-            with open(file_path, "r") as file:
-                for line in file:
-                    line = line.strip()
-
-                    if not line:
-                        continue
-
-                    if not file_execution_time:
-                        file_execution_time = extract_datetime(line)
-
-                    if not tc_suite:
-                        if line.find("Test Suite Executing:") > 0:
-                            tc_suite = line.split(": ")[1]
-
-                    if not tc_name:
-                        if line.find("Executing Test Case:") > 0:
-                            tc_name = line.split(": ")[1]
-
-                    if not tc_result:
-                        if line.find("Test Case Completed [") > 0:
-                            extract_datetime(line)
-
-                            m = re.search(r"\[([A-Za-z0-9_]+)\]", line)
-                            if m:
-                                tc_result = m.group(1)
-
-                                # Add TC result
-                                for x in range(0, tc_execution_in_file):
-                                    if tc_result == "PASSED":
-                                        tc_result = "PASS"
-                                    elif tc_result == "FAILED":
-                                        tc_result = "FAIL"
-
-                                    execution_status.append(tc_result)
-
-                    pattern_begin = f"(?=.*{re.escape('Begin Commission')})"
-                    pattern_end = (
-                        f"(?=.*{re.escape('Internal Control stop simulated app')})"
-                    )
-                    if re.search(pattern_begin, line) is not None:
-                        commissioning_obj = Commissioning()
-                        continue
-
-                    elif re.search(pattern_end, line) is not None:
-                        if commissioning_obj is not None:
-                            commissioning_list.append(commissioning_obj)
-                            execution_logs.append(file_path)
-                            tc_execution_in_file = tc_execution_in_file + 1
-
-                        continue
-
-                    elif commissioning_obj is not None:
-                        commissioning_obj.add_event(line)
-
     durations = []
     read_durations = []
     discovery_durations = []
     PASE_durations = []
     for commissioning in commissioning_list:
-        begin = int(commissioning.commissioning["begin"].timestamp() * 1000000)
-        end = int(commissioning.commissioning["end"].timestamp() * 1000000)
-
         execution_begin_time.append(commissioning.commissioning["begin"])
         execution_end_time.append(commissioning.commissioning["end"])
 
-        read_begin = int(
-            commissioning.commissioning["readCommissioningInfo"]["begin"].timestamp()
-            * 1000000
-        )
-        read_end = int(
-            commissioning.commissioning["readCommissioningInfo"]["end"].timestamp()
-            * 1000000
-        )
-
-        discovery_begin = int(
-            commissioning.commissioning["discovery"]["begin"].timestamp() * 1000000
-        )
-        discovery_end = int(
-            commissioning.commissioning["discovery"]["end"].timestamp() * 1000000
-        )
-
-        PASE_begin = int(
-            commissioning.commissioning["PASE"]["begin"].timestamp() * 1000000
-        )
-        PASE_end = int(commissioning.commissioning["PASE"]["end"].timestamp() * 1000000)
-
-        duration = end - begin
-        read_duration = read_end - read_begin
-        discovery_duration = discovery_end - discovery_begin
-        PASE_duration = PASE_end - PASE_begin
-        durations.append(duration)
-        read_durations.append(read_duration)
-        discovery_durations.append(discovery_duration)
-        PASE_durations.append(PASE_duration)
+        commissioning_durations = commissioning.durations()
+        durations.append(commissioning_durations["durations"])
+        read_durations.append(commissioning_durations["read_durations"])
+        discovery_durations.append(commissioning_durations["discovery_durations"])
+        PASE_durations.append(commissioning_durations["PASE_durations"])
 
     execution_time_folder = execution_begin_time[0].strftime(date_pattern_out_folder)[
         :-3
     ]
 
     generate_summary(
-        execution_logs,
-        execution_status,
+        [log_file_path] * len(commissioning_list),
+        parser.execution_status,
         execution_time_folder,
         execution_begin_time,
         execution_end_time,
-        tc_suite,
-        tc_name,
+        parser.tc_suite,
+        parser.tc_name,
         commissioning_method,
         durations,
         discovery_durations,
         read_durations,
         PASE_durations,
         CONTAINER_OUT_FOLDER,
+        parser.analytics_summary(),
     )
 
-    return (tc_name, execution_time_folder)
+    return (parser.tc_name, execution_time_folder)
 
 
 def compute_state(execution_status: list) -> str:
@@ -236,6 +152,7 @@ def generate_summary(
     read_durations: list,
     PASE_durations: list,
     container_out_folder: str,
+    analytics: Optional[dict[str, dict[str, Any]]] = None,
 ) -> None:
     summary_dict: dict[str, Any] = {}
     summary_dict["run_set_id"] = "d"
@@ -269,12 +186,9 @@ def generate_summary(
     summary_dict["test_summary_record"]["platform"] = "rpi"
     summary_dict["test_summary_record"]["commissioning_method"] = commissioning_method
     summary_dict["test_summary_record"]["list_of_iterations_failed"] = []
-    summary_dict["test_summary_record"]["analytics_parameters"] = [
-        "durations",
-        "discovery_durations",
-        "read_durations",
-        "PASE_durations",
-    ]
+    summary_dict["test_summary_record"]["analytics_parameters"] = ANALYTICS_PARAMETERS
+    if analytics is not None:
+        summary_dict["test_summary_record"]["analytics"] = analytics
 
     dut_information_record = {}
     dut_information_record["vendor_name"] = "TEST_VENDOR"
@@ -362,34 +276,46 @@ def generate_summary(
 
 
 def extract_datetime(line: str) -> Optional[datetime]:
+    # Lines read back from the test run log are prefixed with the TH log timestamp,
+    # the last one is the timestamp from the SDK test itself
     line_datetime = None
-    match = re.findall(date_pattern, line)
-    if match[0]:
-        line_datetime = datetime.strptime(match[0], "%Y-%m-%d %H:%M:%S.%f")
+    match = date_regex.findall(line)
+    if match:
+        line_datetime = datetime.strptime(match[-1], "%Y-%m-%d %H:%M:%S.%f")
 
     return line_datetime
 
 
 class Commissioning:
-    stages = {
+    # Every marker of a stage edge must be found in the line
+    stages: dict[str, dict[str, tuple[str, ...]]] = {
         "discovery": {
-            "begin": "(?=.*Internal\\ Control\\ start\\ simulated\\ app)",
-            "end": "(?=.*Discovered\\ Device)",
+            "begin": ("Internal Control start simulated app",),
+            "end": ("Discovered Device",),
         },
         "readCommissioningInfo": {
-            "begin": "(?=.*ReadCommissioningInfo)(?=.*Performing)",
-            "end": "(?=.*ReadCommissioningInfo)(?=.*Successfully)",
+            "begin": ("ReadCommissioningInfo", "Performing"),
+            "end": ("ReadCommissioningInfo", "Successfully"),
         },
         "PASE": {
-            "begin": "(?=.*PBKDFParamRequest)",
-            "end": "(?=.*'kEstablishing'\\ \\-\\->\\ 'kActive')",
+            "begin": ("PBKDFParamRequest",),
+            "end": ("'kEstablishing' --> 'kActive'",),
         },
         "cleanup": {
-            "begin": "(?=.*Cleanup)(?=.*Performing)",
-            "end": "(?=.*Cleanup)(?=.*Successfully)",
+            "begin": ("Cleanup", "Performing"),
+            "end": ("Cleanup", "Successfully"),
         },
     }
 
+    # Lines without any of the stages first marker are discarded with a single search
+    events_regex = re.compile(
+        "|".join(
+            re.escape(markers[0])
+            for patterns in stages.values()
+            for markers in patterns.values()
+        )
+    )
+
     def __init__(self) -> None:
         self.commissioning: dict[str, Any] = {}
 
@@ -397,28 +323,154 @@ class Commissioning:
         return self.commissioning.__repr__()
 
     def add_event(self, line: str) -> None:
+        if self.events_regex.search(line) is None:
+            return
+
+        line_datetime = None
         for stage, patterns in self.stages.items():
-            begin = None
-            end = None
-            if not (stage in self.commissioning):
-                self.commissioning[stage] = {}
-
-            # pattern_begin:
-            # f"(?=.*{re.escape(stage)})(?=.*{re.escape(self.step_type[0])})"
-            if re.search(patterns["begin"], line) is not None:
-                match = re.findall(date_pattern, line)
-                if match[0]:
-                    begin = datetime.strptime(match[0], "%Y-%m-%d %H:%M:%S.%f")
-                    if stage == "discovery":
-                        self.commissioning["begin"] = begin
-                    self.commissioning[stage]["begin"] = begin
-
-            # pattern_end:
-            # f"(?=.*{re.escape(stage)})(?=.*{re.escape(self.step_type[1])})"
-            if re.search(patterns["end"], line) is not None:
-                match = re.findall(date_pattern, line)
-                if match[0]:
-                    end = datetime.strptime(match[0], "%Y-%m-%d %H:%M:%S.%f")
-                    if stage == "cleanup":
-                        self.commissioning["end"] = end
-                    self.commissioning[stage]["end"] = end
+            for edge, markers in patterns.items():
+                if not all(marker in line for marker in markers):
+                    continue
+
+                if line_datetime is None:
+                    line_datetime = extract_datetime(line)
+                    if line_datetime is None:
+                        return
+
+                self.commissioning.setdefault(stage, {})[edge] = line_datetime
+                if stage == "discovery" and edge == "begin":
+                    self.commissioning["begin"] = line_datetime
+                elif stage == "cleanup" and edge == "end":
+                    self.commissioning["end"] = line_datetime
+
+    def durations(self) -> dict[str, int]:
+        """Durations in microseconds, keyed by the summary analytics parameters."""
+        return {
+            "durations": self.__duration(self.commissioning),
+            "discovery_durations": self.__duration(self.commissioning["discovery"]),
+            "read_durations": self.__duration(
+                self.commissioning["readCommissioningInfo"]
+            ),
+            "PASE_durations": self.__duration(self.commissioning["PASE"]),
+        }
+
+    @staticmethod
+    def __duration(stage: dict[str, Any]) -> int:
+        begin = int(stage["begin"].timestamp() * 1000000)
+        end = int(stage["end"].timestamp() * 1000000)
+        return end - begin
+
+
+class CommissioningLogParser:
+    """Single pass parser for performance test run logs.
+
+    Log records are fed as they are produced and each commissioning iteration is
+    available in `iterations` as soon as its last line is processed, so no log needs
+    to be stored and read again to compute the summary.
+    """
+
+    begin_marker = "Begin Commission"
+    end_marker = "Internal Control stop simulated app"
+    suite_marker = "Test Suite Executing:"
+    test_case_marker = "Executing Test Case:"
+    result_marker = "Test Case Completed ["
+
+    markers_regex = re.compile(
+        "|".join(
+            re.escape(marker)
+            for marker in (
+                begin_marker,
+                end_marker,
+                suite_marker,
+                test_case_marker,
+                result_marker,
+            )
+        )
+    )
+    result_regex = re.compile(r"\[([A-Za-z0-9_]+)\]")
+
+    def __init__(self) -> None:
+        self.tc_suite = ""
+        self.tc_name = ""
+        self.tc_result: Optional[str] = None
+        self.iterations: list[Commissioning] = []
+        self.execution_status: list[str] = []
+        self.analytics = {
+            parameter: DurationAnalytics(unit="us")
+            for parameter in ANALYTICS_PARAMETERS
+        }
+        self.__current: Optional[Commissioning] = None
+
+    def feed(self, record: str) -> list[Commissioning]:
+        """Process a log record, which may span several lines.
+
+        Returns:
+            list[Commissioning]: iterations completed by this record.
+        """
+        completed = []
+        for line in record.splitlines():
+            if commissioning := self.__feed_line(line.strip()):
+                completed.append(commissioning)
+
+        return completed
+
+    def __feed_line(self, line: str) -> Optional[Commissioning]:
+        if not line:
+            return None
+
+        marker = self.markers_regex.search(line)
+        if marker is None:
+            if self.__current is not None:
+                self.__current.add_event(line)
+            return None
+
+        match marker.group():
+            case self.begin_marker:
+                self.__current = Commissioning()
+            case self.end_marker:
+                commissioning, self.__current = self.__current, None
+                if commissioning is not None:
+                    self.iterations.append(commissioning)
+                    self.__update_analytics(commissioning)
+                return commissioning
+            case self.suite_marker:
+                if not self.tc_suite:
+                    self.tc_suite = line.split(": ")[1]
+            case self.test_case_marker:
+                if not self.tc_name:
+                    self.tc_name = line.split(": ")[1]
+            case self.result_marker:
+                self.__set_result(line)
+
+        return None
+
+    def analytics_summary(self) -> dict[str, dict[str, Any]]:
+        return {
+            parameter: analytics.summary()
+            for parameter, analytics in self.analytics.items()
+        }
+
+    def __update_analytics(self, commissioning: Commissioning) -> None:
+        try:
+            durations = commissioning.durations()
+        except KeyError:
+            # Incomplete iteration, e.g. commissioning failed before PASE
+            return
+
+        for parameter, duration in durations.items():
+            self.analytics[parameter].add(duration)
+
+    def __set_result(self, line: str) -> None:
+        if self.tc_result:
+            return
+
+        m = self.result_regex.search(line)
+        if not m:
+            return
+
+        self.tc_result = m.group(1)
+        status = {"PASSED": "PASS", "FAILED": "FAIL"}.get(
+            self.tc_result, self.tc_result
+        )
+        # The test case result applies to all iterations executed so far
+        self.execution_status.extend([status] * len(self.iterations))
@@ -17,17 +17,29 @@
 import ast
 import asyncio
 import json
+import os
 from pathlib import Path
+from typing import Optional
 
 from test_collections.matter.config import matter_settings
 from test_collections.matter.sdk_tests.support.models.sdk_test_folder import (
     SDKTestFolder,
 )
+from test_collections.matter.sdk_tests.support.models.sdk_test_manifest import (
+    file_digest,
+)
 from test_collections.matter.sdk_tests.support.sdk_container import SDKContainer
 
 # Make these constants synced with "test_harness_client.py"
 GET_TEST_INFO_ARGUMENT = "--get_test_info"
+GET_TEST_INFO_BATCH_ARGUMENT = "batch"
 TEST_INFO_JSON_FILENAME = "test_info.json"
+TEST_INFO_BATCH_FILENAME = "{batch_name}.json"
+TEST_INFO_BATCH_OUTPUT_FILENAME = "{batch_name}_info.json"
+
+# The test classes are split in batches, each batch gets the test info of all its
+# classes in a single interpreter inside the SDK container and batches run in parallel
+TEST_INFO_BATCH_COUNT = os.cpu_count() or 1
 
 SDK_TESTS_PATH = Path(__file__).parent.parent.parent
 PYTHON_TESTING_PATH = SDK_TESTS_PATH / "sdk_checkout/python_testing"
@@ -69,19 +81,63 @@ def base_test_classes(module: ast.Module) -> list[ast.ClassDef]:
     ]
 
 
+def _script_key(python_test_file: Path) -> str:
+    return f"{python_test_file.parent.name}/{python_test_file.stem}"
+
+
+def get_script_digests(test_folder: SDKTestFolder) -> dict[str, str]:
+    return {
+        _script_key(python_test_file): file_digest(python_test_file)
+        for python_test_file in test_folder.file_paths(extension=".py")
+    }
+
+
+def get_cached_tests(
+    json_output_file: Path, script_digests: dict[str, str]
+) -> dict[str, list]:
+    """Read the tests of the scripts unchanged since the output file was generated.
+
+    Scripts are compared by their content digest, which are stored in the output file
+    along with the tests. Nothing is reused if the file was generated for another SDK,
+    and scripts without any test are always inspected again.
+
+    Returns:
+        dict[str, list]: Tests found in each unchanged script, keyed by script path.
+    """
+    try:
+        with open(json_output_file, "r") as json_file:
+            json_data = json.load(json_file)
+    except (OSError, ValueError):
+        return {}
+
+    if json_data.get("sdk_sha") != matter_settings.SDK_SHA:
+        return {}
+
+    previous_digests = json_data.get("script_digests", {})
+    cached_tests: dict[str, list] = {
+        path: []
+        for path, digest in script_digests.items()
+        if previous_digests.get(path) == digest
+    }
+    for test in json_data.get("tests", []):
+        if test["path"] in cached_tests:
+            cached_tests[test["path"]].append(test)
+
+    return {path: tests for path, tests in cached_tests.items() if tests}
+
+
 def get_command_list(test_folder: SDKTestFolder) -> list:
     python_script_commands = []
     python_test_files = test_folder.file_paths(extension=".py")
     python_test_files.sort()
 
     for python_test_file in python_test_files:
-        parent_folder = python_test_file.parent.name
         with open(python_test_file, "r") as python_file:
             parsed_python_file = ast.parse(python_file.read())
 
         test_classes = base_test_classes(parsed_python_file)
         for test_class in test_classes:
-            script_command = [f"{parent_folder}/{python_test_file.stem}"]
+            script_command = [_script_key(python_test_file)]
             script_command.append(f"{test_class.name}")
             script_command.append(GET_TEST_INFO_ARGUMENT)
             python_script_commands.append(script_command)
@@ -89,61 +145,182 @@ def get_command_list(test_folder: SDKTestFolder) -> list:
     return python_script_commands
 
 
+def _run_test_info_command(sdk_container: SDKContainer, command: list) -> dict:
+    """Get the test info of a single test class.
+
+    All these commands write to the same output file, so they can't run in parallel.
+    """
+    result: dict = {"path": command[0], "class_name": command[1]}
+    exec_result = sdk_container.send_command(
+        " ".join(command),
+        prefix=CONTAINER_TH_CLIENT_EXEC,
+    )
+
+    try:
+        with open(JSON_OUTPUT_FILE_PATH, "r") as json_file:
+            json_data = json.load(json_file)
+    except (OSError, ValueError) as e:
+        result["detail"] = f"Could not read test info: {e}"
+        return result
+
+    if exec_result.exit_code != 0:
+        # The error details are only available if the script failed getting the info
+        result["detail"] = (
+            json_data["detail"]
+            if isinstance(json_data, dict)
+            else f"Exit code {exec_result.exit_code}"
+        )
+    else:
+        result["tests"] = json_data
+
+    return result
+
+
+def _run_test_info_batch(
+    sdk_container: SDKContainer, batch_name: str, commands: list
+) -> Optional[list[dict]]:
+    """Get the test info of all the test classes in a single command.
+
+    Returns None if the command failed without reporting the test info of the batch
+    (e.g. one of the scripts exits the interpreter on import).
+    """
+    batch_file = PYTHON_TESTING_PATH / TEST_INFO_BATCH_FILENAME.format(
+        batch_name=batch_name
+    )
+    output_file = PYTHON_TESTING_PATH / TEST_INFO_BATCH_OUTPUT_FILENAME.format(
+        batch_name=batch_name
+    )
+
+    with open(batch_file, "w") as json_file:
+        json.dump([command[:2] for command in commands], json_file)
+
+    try:
+        sdk_container.send_command(
+            f"{GET_TEST_INFO_BATCH_ARGUMENT} {batch_name} {GET_TEST_INFO_ARGUMENT}",
+            prefix=CONTAINER_TH_CLIENT_EXEC,
+        )
+        with open(output_file, "r") as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return None
+    finally:
+        batch_file.unlink(missing_ok=True)
+        output_file.unlink(missing_ok=True)
+
+
+async def _get_commands_test_info(commands: list) -> dict[tuple[str, str], dict]:
+    """Run the commands in the SDK container.
+
+    Returns:
+        dict[tuple[str, str], dict]: Test info of each command, keyed by script path
+        and class name.
+    """
+    results: dict[tuple[str, str], dict] = {}
+    if not commands:
+        return results
+
+    sdk_container: SDKContainer = SDKContainer()
+
+    await sdk_container.start()
+
+    batches = [
+        commands[index::TEST_INFO_BATCH_COUNT] for index in range(TEST_INFO_BATCH_COUNT)
+    ]
+    batches = [batch for batch in batches if batch]
+    print(f"Getting test info of {len(commands)} classes in {len(batches)} batches...")
+    batches_results = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                _run_test_info_batch, sdk_container, f"test_info_batch_{index}", batch
+            )
+            for index, batch in enumerate(batches)
+        )
+    )
+
+    for batch, batch_results in zip(batches, batches_results):
+        if batch_results is None:
+            # Fallback to getting the test info of each class of the batch on its own
+            batch_results = [
+                _run_test_info_command(sdk_container, command) for command in batch
+            ]
+        for result in batch_results:
+            results[(result["path"], result["class_name"])] = result
+
+    await sdk_container.destroy_async()
+
+    return results
+
+
 async def proccess_commands_sdk_container(
     commands: list,
     json_output_file: Path,
+    cached_tests: Optional[dict[str, list]] = None,
+    script_digests: Optional[dict[str, str]] = None,
 ) -> None:
+    """Get the test info of the commands and write them to the output file.
+
+    Commands of scripts found in `cached_tests` reuse the cached tests instead of
+    running in the SDK container, which isn't started if all of them are cached.
+    Digests are only stored for the scripts whose tests were all found, so failed
+    scripts are inspected again on the next run.
+    """
     complete_json = []
+    failed_scripts: set[str] = set()
     errors_found: list[str] = []
     warnings_found: list[str] = []
     test_function_count = 0
     invalid_test_function_count = 0
+    cached_tests = cached_tests or {}
 
-    sdk_container: SDKContainer = SDKContainer()
-
-    await sdk_container.start()
-    total_commands = len(commands)
-    for index, command in enumerate(commands):
-        print(f"Progress {index}/{total_commands}...")
-        command_string = " ".join(command)
-        result = sdk_container.send_command(
-            command_string,
-            prefix=CONTAINER_TH_CLIENT_EXEC,
+    results = await _get_commands_test_info(
+        [command for command in commands if command[0] not in cached_tests]
+    )
+    for path, tests in cached_tests.items():
+        for test in tests:
+            result = results.setdefault(
+                (path, test["class_name"]),
+                {"path": path, "class_name": test["class_name"], "tests": []},
+            )
+            result["tests"].append(test)
+
+    # Keep the order of the commands, so the output file only changes with the tests
+    for command in commands:
+        result = results.get(
+            (command[0], command[1]),
+            {"path": command[0], "class_name": command[1], "tests": []},
         )
-        if result.exit_code != 0:
-            try:
-                with open(JSON_OUTPUT_FILE_PATH, "r") as json_file:
-                    json_data = json.load(json_file)
-
-                    errors_found.append(
-                        f"Failed running command: {command}.\n"
-                        f"Error message: {json_data['detail']}"
-                    )
-            finally:
-                continue
-
-        with open(JSON_OUTPUT_FILE_PATH, "r") as json_file:
-            json_data = json.load(json_file)
-
-            for json_dict in json_data:
-                test_function_count += 1
-                json_dict["path"] = command[0]
-                json_dict["class_name"] = command[1]
-                function = json_dict["function"]
-                if not function.startswith("test_TC_"):
-                    invalid_test_function_count += 1
-                    warnings_found.append(
-                        f"Warning: File path: {json_dict['path']}  "
-                        f"Class: {json_dict['class_name']}. "
-                        f"Invalid test function: {function}"
-                    )
-                complete_json.append(json_dict)
-
-    sdk_container.destroy()
+        if "detail" in result:
+            failed_scripts.add(command[0])
+            errors_found.append(
+                f"Failed running command: {command}.\n"
+                f"Error message: {result['detail']}"
+            )
+            continue
+
+        for json_dict in result["tests"]:
+            test_function_count += 1
+            json_dict["path"] = command[0]
+            json_dict["class_name"] = command[1]
+            function = json_dict["function"]
+            if not function.startswith("test_TC_"):
+                invalid_test_function_count += 1
+                warnings_found.append(
+                    f"Warning: File path: {json_dict['path']}  "
+                    f"Class: {json_dict['class_name']}. "
+                    f"Invalid test function: {function}"
+                )
+            complete_json.append(json_dict)
 
     # complete_json.append({"sdk_sha": matter_settings.SDK_SHA})
     # Create a wrapper object with sdk_sha at root level
-    json_output = {"sdk_sha": matter_settings.SDK_SHA, "tests": complete_json}
+    json_output: dict = {"sdk_sha": matter_settings.SDK_SHA, "tests": complete_json}
+    if script_digests is not None:
+        found_scripts = {test["path"] for test in complete_json} - failed_scripts
+        json_output["script_digests"] = {
+            path: digest
+            for path, digest in script_digests.items()
+            if path in found_scripts
+        }
 
     with open(json_output_file, "w") as json_file:
         json.dump(json_output, json_file, indent=4, sort_keys=True)
@@ -173,11 +350,32 @@ async def proccess_commands_sdk_container(
 async def generate_python_test_json_file(
     test_folder: SDKTestFolder = PYTHON_SCRIPTS_FOLDER,
     json_output_file: Path = PYTHON_TESTS_PARSED_FILE,
+    incremental: bool = False,
 ) -> None:
+    """Generate the json file with the test info of the python scripts.
+
+    When incremental, the digests of the scripts are stored in the output file and
+    only new or modified scripts are inspected in the SDK container, the tests of
+    unchanged scripts are reused from the previous output file. The SDK container
+    isn't started at all when no script changed.
+    """
     python_scripts_command_list = get_command_list(test_folder=test_folder)
 
+    if not incremental:
+        await proccess_commands_sdk_container(
+            python_scripts_command_list, json_output_file=json_output_file
+        )
+        return
+
+    script_digests = get_script_digests(test_folder=test_folder)
+    cached_tests = get_cached_tests(
+        json_output_file=json_output_file, script_digests=script_digests
+    )
     await proccess_commands_sdk_container(
-        python_scripts_command_list, json_output_file=json_output_file
+        python_scripts_command_list,
+        json_output_file=json_output_file,
+        cached_tests=cached_tests,
+        script_digests=script_digests,
     )
 
 
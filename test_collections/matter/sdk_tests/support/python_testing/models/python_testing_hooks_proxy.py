@@ -14,10 +14,8 @@
 # limitations under the License.
 #
 from enum import Enum
-from queue import Empty, Queue
-from typing import Any, Optional, Union
+from typing import Any, Optional, Type
 
-from matter.yamltests.hooks import TestRunnerHooks
 from pydantic import BaseModel
 
 
@@ -116,94 +114,27 @@ class SDKPythonTestResultShowPrompt(SDKPythonTestResultBase):
     default_value: Optional[str]
 
 
-class SDKPythonTestRunnerHooks(TestRunnerHooks):
-    finished = False
-    results: Queue
-
-    def __init__(self) -> None:
-        SDKPythonTestRunnerHooks.finished = False
-        SDKPythonTestRunnerHooks.results = Queue()
-
-    def update_test(self) -> Union[dict, None]:
-        try:
-            result = self.results.get(block=False)
-            return result
-        except Empty:
-            return None
-
-    def is_finished(self) -> bool:
-        return SDKPythonTestRunnerHooks.finished
-
-    def start(self, count: int) -> None:
-        self.results.put(SDKPythonTestResultStart(count=count))
-
-    def stop(self, duration: int) -> None:
-        self.results.put(SDKPythonTestResultStop(duration=duration))
-        SDKPythonTestRunnerHooks.finished = True
-
-    def test_start(
-        self, filename: str, name: str, count: int, steps: list[str] = []
-    ) -> None:
-        self.results.put(
-            SDKPythonTestResultTestStart(
-                filename=filename, name=name, count=count, steps=steps
-            )
-        )
-
-    def test_stop(self, exception: Exception, duration: int) -> None:
-        self.results.put(
-            SDKPythonTestResultTestStop(exception=exception, duration=duration)
-        )
-
-    def test_skipped(self, filename: str, name: str) -> None:
-        self.results.put(SDKPythonTestResultTestSkipped(filename=filename, name=name))
-
-    def step_skipped(self, name: str, expression: str) -> None:
-        self.results.put(SDKPythonTestResultStepSkipped(expression=expression))
-
-    def step_start(self, name: str) -> None:
-        self.results.put(SDKPythonTestResultStepStart(name=name))
-
-    def step_success(self, logger: Any, logs: Any, duration: int, request: Any) -> None:
-        self.results.put(
-            SDKPythonTestResultStepSuccess(
-                logger=logger,
-                logs=logs,
-                duration=duration,
-                request=request,
-            )
-        )
-
-    def step_failure(
-        self, logger: Any, logs: Any, duration: int, request: Any, received: Any
-    ) -> None:
-        self.results.put(
-            SDKPythonTestResultStepFailure(
-                logger=logger,
-                logs=logs,
-                duration=duration,
-                request=request,
-                received=received,
-            )
-        )
-
-    def step_unknown(self) -> None:
-        self.results.put(SDKPythonTestResultStepUnknown())
-
-    def step_manual(self) -> None:
-        self.results.put(SDKPythonTestResultStepManual())
-
-    def show_prompt(
-        self,
-        msg: str,
-        placeholder: Optional[str] = None,
-        default_value: Optional[str] = None,
-    ) -> None:
-        self.results.put(
-            SDKPythonTestResultShowPrompt(
-                msg=msg, placeholder=placeholder, default_value=default_value
-            )
-        )
-
-    def step_start_list(self) -> None:
-        pass
+SDK_PYTHON_TEST_RESULT_TYPES: dict[
+    SDKPythonTestResultEnum, Type[SDKPythonTestResultBase]
+] = {
+    SDKPythonTestResultEnum.START: SDKPythonTestResultStart,
+    SDKPythonTestResultEnum.STOP: SDKPythonTestResultStop,
+    SDKPythonTestResultEnum.TEST_START: SDKPythonTestResultTestStart,
+    SDKPythonTestResultEnum.TEST_STOP: SDKPythonTestResultTestStop,
+    SDKPythonTestResultEnum.TEST_SKIPPED: SDKPythonTestResultTestSkipped,
+    SDKPythonTestResultEnum.STEP_SKIPPED: SDKPythonTestResultStepSkipped,
+    SDKPythonTestResultEnum.STEP_START: SDKPythonTestResultStepStart,
+    SDKPythonTestResultEnum.STEP_SUCCESS: SDKPythonTestResultStepSuccess,
+    SDKPythonTestResultEnum.STEP_FAILURE: SDKPythonTestResultStepFailure,
+    SDKPythonTestResultEnum.STEP_UNKNOWN: SDKPythonTestResultStepUnknown,
+    SDKPythonTestResultEnum.STEP_MANUAL: SDKPythonTestResultStepManual,
+    SDKPythonTestResultEnum.SHOW_PROMPT: SDKPythonTestResultShowPrompt,
+}
+
+
+def parse_python_test_result(event: dict) -> SDKPythonTestResultBase:
+    """Parse a hook event sent by test_harness_client.py into its result model."""
+    result_type = SDK_PYTHON_TEST_RESULT_TYPES[
+        SDKPythonTestResultEnum(event.get("type"))
+    ]
+    return result_type.parse_obj(event)
@@ -18,9 +18,11 @@
 # flake8: noqa
 import importlib
 import json
+import socket
+import struct
 import sys
+import threading
 from contextlib import redirect_stdout
-from multiprocessing.managers import BaseManager
 
 from chip.testing.matter_testing import (
     CommissionDeviceTest,
@@ -33,10 +35,20 @@ from chip.testing.matter_testing import (
 
 COMMISSION_ARGUMENT = "commission"
 GET_TEST_INFO_ARGUMENT = "--get_test_info"
+GET_TEST_INFO_BATCH_ARGUMENT = "batch"
 TEST_INFO_JSON_FILENAME = "test_info.json"
 TEST_INFO_JSON_PATH = "/root/python_testing/" + TEST_INFO_JSON_FILENAME
+TEST_INFO_BATCH_PATH = "/root/python_testing/{batch_name}.json"
+TEST_INFO_BATCH_OUTPUT_PATH = "/root/python_testing/{batch_name}_info.json"
 EXECUTION_LOG_OUTPUT = "/root/python_testing/test_output.txt"
 
+# Keep these constants synced with "hooks_channel.py"
+HOOKS_CHANNEL_ADDRESS = ("0.0.0.0", 50000)
+HOOKS_FRAME_HEADER = struct.Struct("!I")
+# Upper bound for how long an event can be held before being sent to the backend
+HOOKS_BATCH_INTERVAL = 0.05
+HOOKS_BATCH_MAX_EVENTS = 64
+
 
 class TestRunnerHooks:
     def start(self, count: int):
@@ -70,6 +82,127 @@ class TestRunnerHooks:
         print("=====> hooks.step_manual")
 
 
+class SocketTestRunnerHooks:
+    """Pushes every hook call to the Test Harness backend.
+
+    Each call is encoded as a length prefixed JSON frame. Frames are buffered and
+    sent together every HOOKS_BATCH_INTERVAL seconds, or as soon as
+    HOOKS_BATCH_MAX_EVENTS are pending, so a stress test reporting hundreds of
+    steps does not wake up the backend once per step. Events the backend must
+    react to right away (prompts and stop) are sent immediately.
+
+    Arguments that are not JSON serializable (exceptions, SDK objects) are sent as
+    their string representation.
+    """
+
+    def __init__(
+        self,
+        address=HOOKS_CHANNEL_ADDRESS,
+        batch_interval: float = HOOKS_BATCH_INTERVAL,
+        batch_max_events: int = HOOKS_BATCH_MAX_EVENTS,
+    ):
+        self._socket = socket.create_connection(address)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._batch_interval = batch_interval
+        self._batch_max_events = batch_max_events
+        self._pending: list[bytes] = []
+        self._closed = False
+        self._condition = threading.Condition()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+
+    def _send(self, type: str, flush: bool = False, **kwargs):
+        payload = json.dumps({"type": type, **kwargs}, default=str).encode()
+        with self._condition:
+            self._pending.append(HOOKS_FRAME_HEADER.pack(len(payload)) + payload)
+            if flush or len(self._pending) >= self._batch_max_events:
+                self._flush()
+            elif len(self._pending) == 1:
+                self._condition.notify_all()
+
+    def _flush(self):
+        # Must be called with self._condition acquired
+        if self._pending:
+            self._socket.sendall(b"".join(self._pending))
+            self._pending.clear()
+            self._condition.notify_all()
+
+    def _flush_periodically(self):
+        with self._condition:
+            while not self._closed:
+                self._condition.wait_for(lambda: self._closed or self._pending)
+                # Hold the first event for a while so following ones share the send
+                self._condition.wait_for(
+                    lambda: self._closed or not self._pending,
+                    timeout=self._batch_interval,
+                )
+                self._flush()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._flush()
+        self._flusher.join()
+        self._socket.close()
+
+    def start(self, count: int):
+        self._send("start", count=count)
+
+    def stop(self, duration: int):
+        self._send("stop", flush=True, duration=duration)
+
+    def test_start(self, filename: str, name: str, count: int, steps: list[str] = []):
+        self._send("test_start", filename=filename, name=name, count=count, steps=steps)
+
+    def test_stop(self, exception: Exception, duration: int):
+        self._send("test_stop", exception=exception, duration=duration)
+
+    def test_skipped(self, filename: str, name: str):
+        self._send("test_skipped", filename=filename, name=name)
+
+    def step_skipped(self, name: str, expression: str):
+        self._send("step_skipped", name=name, expression=expression)
+
+    def step_start(self, name: str):
+        self._send("step_start", name=name)
+
+    def step_success(self, logger, logs, duration: int, request: TestStep):
+        self._send(
+            "step_success", logger=logger, logs=logs, duration=duration, request=request
+        )
+
+    def step_failure(self, logger, logs, duration: int, request: TestStep, received):
+        self._send(
+            "step_failure",
+            logger=logger,
+            logs=logs,
+            duration=duration,
+            request=request,
+            received=received,
+        )
+
+    def step_unknown(self):
+        self._send("step_unknown")
+
+    def step_manual(self):
+        self._send("step_manual", flush=True)
+
+    def show_prompt(
+        self, msg: str, placeholder=None, default_value=None, endpoint_id=None
+    ):
+        self._send(
+            "show_prompt",
+            flush=True,
+            msg=msg,
+            placeholder=placeholder,
+            default_value=default_value,
+            endpoint_id=endpoint_id,
+        )
+
+    def step_start_list(self):
+        pass
+
+
 def main() -> None:
     # Load python_testing/scripts as a module. This folder is where all python scripts
     # are located
@@ -83,7 +216,12 @@ def main() -> None:
     print(test_args)
 
     config = parse_matter_test_args(test_args)
-    if GET_TEST_INFO_ARGUMENT in sys.argv:
+    if (
+        GET_TEST_INFO_ARGUMENT in sys.argv
+        and sys.argv[1] == GET_TEST_INFO_BATCH_ARGUMENT
+    ):
+        get_test_info_batch(batch_name=sys.argv[2], config=config)
+    elif GET_TEST_INFO_ARGUMENT in sys.argv:
         try:
             info = get_test_info_support(
                 script_path=sys.argv[1], class_name=sys.argv[2], config=config
@@ -117,6 +255,31 @@ def get_test_info_support(script_path: str, class_name: str, config: MatterTestC
     return json.loads(json.dumps(test_info, default=lambda o: o.__dict__))
 
 
+def get_test_info_batch(batch_name: str, config: MatterTestConfig):
+    """Get the test info of several test classes in a single interpreter.
+
+    The batch file lists [script_path, class_name] pairs. The test info of each class,
+    or the error found getting it, is written to the batch output file in the same
+    order.
+    """
+    with open(TEST_INFO_BATCH_PATH.format(batch_name=batch_name), "r") as f:
+        test_classes = json.load(f)
+
+    batch_info = []
+    for script_path, class_name in test_classes:
+        result = {"path": script_path, "class_name": class_name}
+        try:
+            result["tests"] = get_test_info_support(
+                script_path=script_path, class_name=class_name, config=config
+            )
+        except Exception as e:
+            result["detail"] = f"{str(e)}"
+        batch_info.append(result)
+
+    with open(TEST_INFO_BATCH_OUTPUT_PATH.format(batch_name=batch_name), "w") as f:
+        json.dump(batch_info, f, indent=4)
+
+
 def configure_interactions(args) -> []:
     result = args
     try:
@@ -157,12 +320,7 @@ def run_test(script_path: str, class_name: str, config: MatterTestConfig) -> Non
     if manual_execution:
         test_runner_hooks = TestRunnerHooks()
     else:
-        BaseManager.register(TestRunnerHooks.__name__)
-        manager = BaseManager(address=("0.0.0.0", 50000), authkey=b"abc")
-        manager.connect()
-        test_runner_hooks = (
-            manager.TestRunnerHooks()
-        )  # shared object proxy # type: ignore
+        test_runner_hooks = SocketTestRunnerHooks()
 
     try:
         # For a script_path like 'custom/TC_XYZ' the module is 'custom.TC_XYZ'
@@ -175,6 +333,9 @@ def run_test(script_path: str, class_name: str, config: MatterTestConfig) -> Non
             logger=None, logs=str(e), duration=0, request=None, received=None
         )
         test_runner_hooks.stop(duration=0)
+    finally:
+        if isinstance(test_runner_hooks, SocketTestRunnerHooks):
+            test_runner_hooks.close()
 
 
 def commission(config: MatterTestConfig) -> None:
@@ -14,13 +14,12 @@
 # limitations under the License.
 #
 import re
-from asyncio import sleep
 from inspect import iscoroutinefunction
-from multiprocessing.managers import BaseManager
 from pathlib import Path
 from socket import SocketIO
 from typing import Any, Optional, Type, TypeVar
 
+from app.container_manager import container_manager
 from app.models import TestCaseExecution
 from app.test_engine.logger import PYTHON_TEST_LEVEL
 from app.test_engine.logger import test_engine_logger as logger
@@ -33,13 +32,14 @@ from app.user_prompt_support.prompt_request import (
 from app.user_prompt_support.user_prompt_support import UserPromptSupport
 from test_collections.matter.test_environment_config import TestEnvironmentConfigMatter
 
+from ...hooks_channel import HooksChannel
 from ...pics import PICS_FILE_PATH
 from ...sdk_container import SDKContainer
 from ...utils import prompt_for_commissioning_mode
 from .python_test_models import PythonTest, PythonTestType
 from .python_testing_hooks_proxy import (
     SDKPythonTestResultBase,
-    SDKPythonTestRunnerHooks,
+    parse_python_test_result,
 )
 from .utils import (
     EXECUTABLE,
@@ -241,13 +241,12 @@ class PythonTestCase(TestCase, UserPromptSupport):
             logger.log(PYTHON_TEST_LEVEL, lines)
 
     async def execute(self) -> None:
+        hooks_channel = HooksChannel(parse_python_test_result)
         try:
             logger.info("Running Python Test: " + self.python_test.name)
 
-            BaseManager.register("TestRunnerHooks", SDKPythonTestRunnerHooks)
-            manager = BaseManager(address=("0.0.0.0", 50000), authkey=b"abc")
-            manager.start()
-            test_runner_hooks = manager.TestRunnerHooks()  # type: ignore
+            # The channel must be listening before the test script is started
+            await hooks_channel.start()
 
             if not self.python_test.path:
                 raise PythonTestCaseError(
@@ -276,7 +275,8 @@ class PythonTestCase(TestCase, UserPromptSupport):
             if self.sdk_container.pics_file_created:
                 command.append(f" --PICS {PICS_FILE_PATH}")
 
-            exec_result = self.sdk_container.send_command(
+            exec_result = await container_manager.run_in_executor(
+                self.sdk_container.send_command,
                 command,
                 prefix=EXECUTABLE,
                 is_stream=True,
@@ -284,13 +284,7 @@ class PythonTestCase(TestCase, UserPromptSupport):
             )
             self.test_socket = exec_result.socket
 
-            while ((update := test_runner_hooks.update_test()) is not None) or (
-                not test_runner_hooks.is_finished()
-            ):
-                if not update:
-                    await sleep(0.0001)
-                    continue
-
+            async for update in hooks_channel.updates():
                 await self.__handle_update(update)
 
             # Step: Show test logs
@@ -306,7 +300,7 @@ class PythonTestCase(TestCase, UserPromptSupport):
 
             self.current_test_step.mark_as_completed()
         finally:
-            pass
+            await hooks_channel.close()
 
     def skip_to_last_step(self) -> None:
         self.current_test_step.mark_as_completed()
@@ -117,11 +117,11 @@ class PythonTestSuite(TestSuite):
     async def cleanup(self) -> None:
         logger.info("Suite Cleanup")
 
-        logger.info("Stopping SDK container")
-        self.sdk_container.destroy()
+        logger.info("Releasing SDK container")
+        await self.sdk_container.release()
 
         logger.info("Stopping Border Router")
-        self.border_router.destroy_device()
+        await self.border_router.destroy_device_async()
 
 
 class CommissioningPythonTestSuite(PythonTestSuite, UserPromptSupport):
@@ -21,6 +21,7 @@ from typing import Generator, cast
 
 import loguru
 
+from app.container_manager import container_manager
 from app.schemas.test_environment_config import ThreadAutoConfig
 from app.test_engine.logger import PYTHON_TEST_LEVEL
 from app.user_prompt_support import UserPromptSupport
@@ -142,7 +143,7 @@ def __retrieve_storage_path(config: TestEnvironmentConfigMatter) -> Path:
     return storage_path
 
 
-def __copy_admin_storage_file(
+async def __copy_admin_storage_file(
     config: TestEnvironmentConfigMatter,
     logger: loguru.Logger,
 ) -> None:
@@ -151,7 +152,7 @@ def __copy_admin_storage_file(
     storage_path = __retrieve_storage_path(config)
 
     logger.info(f"Copy file '{storage_path}' from container")
-    sdk_container.copy_file_from_container(
+    await sdk_container.copy_file_from_container_async(
         container_file_path=Path(storage_path),
         destination_path=ADMIN_STORAGE_FILE_HOST_PATH,
         destination_file_name=ADMIN_STORAGE_FILE_DEFAULT_NAME,
@@ -168,23 +169,29 @@ async def commission_device(
     command_arguments = await generate_command_arguments(config)
     command.extend(command_arguments)
 
-    exec_result = sdk_container.send_command(
+    exec_result = await container_manager.run_in_executor(
+        sdk_container.send_command,
         command,
         prefix=EXECUTABLE,
         is_stream=True,
         is_socket=False,
     )
 
-    handle_logs(cast(Generator, exec_result.output), logger)
+    # Reading the exec output stream blocks until the commissioning is done
+    await container_manager.run_in_executor(
+        handle_logs, cast(Generator, exec_result.output), logger
+    )
 
-    exit_code = sdk_container.exec_exit_code(exec_result.exec_id)
+    exit_code = await container_manager.run_in_executor(
+        sdk_container.exec_exit_code, exec_result.exec_id
+    )
 
     if exit_code:
         raise DUTCommissioningError("Failed to commission DUT")
 
     # Copy admin_storage.json file from container, in case the user wants to
     # reuse this information in the next execution
-    __copy_admin_storage_file(config, logger)
+    await __copy_admin_storage_file(config, logger)
 
 
 async def __thread_dataset_hex(
@@ -225,7 +232,7 @@ async def should_perform_new_commissioning(
 
             storage_path = __retrieve_storage_path(config)
 
-            sdk_container.copy_file_to_container(
+            await sdk_container.copy_file_to_container_async(
                 host_file_path=ADMIN_STORAGE_FILE_HOST,
                 destination_container_path=storage_path,
             )
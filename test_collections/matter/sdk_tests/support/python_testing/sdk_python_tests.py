@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import Optional
 
 from ..models.sdk_test_folder import SDKTestFolder
+from ..models.sdk_test_manifest import SDKTestManifest
 from ..paths import SDK_CHECKOUT_PATH
 from .list_python_tests_classes import (
     CUSTOM_PYTHON_SCRIPTS_FOLDER,
@@ -86,9 +87,15 @@ def _init_test_suites(
 
 
 def _parse_python_script_to_test_case_declarations(
-    python_test_version: str, tests_file_path: Path
+    python_test_version: str,
+    tests_file_path: Path,
+    manifest: Optional[SDKTestManifest] = None,
 ) -> list[PythonCaseDeclaration]:
-    python_tests: list[PythonTest] = parse_python_script(tests_file_path)
+    python_tests: list[PythonTest]
+    if manifest is not None:
+        python_tests = manifest.load(tests_file_path, parse_python_script)
+    else:
+        python_tests = parse_python_script(tests_file_path)
 
     return [
         PythonCaseDeclaration(
@@ -101,12 +108,17 @@ def _parse_python_script_to_test_case_declarations(
 
 
 def __parse_python_tests(
-    python_test_version: str, mandatory: bool, tests_file_path: Path
+    python_test_version: str,
+    mandatory: bool,
+    tests_file_path: Path,
+    manifest: Optional[SDKTestManifest] = None,
 ) -> list[PythonSuiteDeclaration]:
     suites = _init_test_suites(python_test_version)
 
     test_cases = _parse_python_script_to_test_case_declarations(
-        python_test_version=python_test_version, tests_file_path=tests_file_path
+        python_test_version=python_test_version,
+        tests_file_path=tests_file_path,
+        manifest=manifest,
     )
 
     for test_case in test_cases:
@@ -133,12 +145,15 @@ def __sdk_python_test_collection(
     )
 
     python_test_version = python_test_folder.version
+    manifest = python_test_folder.manifest("python")
 
     suites = __parse_python_tests(
         python_test_version=python_test_version,
         mandatory=mandatory,
         tests_file_path=tests_file_path,
+        manifest=manifest,
     )
+    manifest.save()
 
     for suite in suites:
         suite.sort_test_cases()
@@ -181,6 +196,7 @@ def custom_python_test_collection(
         generate_python_test_json_file(
             test_folder=python_test_folder,
             json_output_file=tests_file_path,
+            incremental=True,
         )
     )
 
@@ -189,9 +205,14 @@ def custom_python_test_collection(
         name="Custom SDK Python Tests", folder=python_test_folder
     )
 
+    manifest = python_test_folder.manifest("python")
     suites = __parse_python_tests(
-        python_test_version="custom", mandatory=False, tests_file_path=tests_file_path
+        python_test_version="custom",
+        mandatory=False,
+        tests_file_path=tests_file_path,
+        manifest=manifest,
     )
+    manifest.save()
 
     for suite in suites:
         if not suite.test_cases:
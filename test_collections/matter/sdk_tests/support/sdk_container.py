@@ -15,7 +15,10 @@
 #
 from __future__ import annotations
 
+import asyncio
+from asyncio import Task, TimerHandle
 from pathlib import Path
+from time import monotonic
 from typing import Optional, Union
 
 import loguru
@@ -28,7 +31,11 @@ from app.test_engine.logger import test_engine_logger as logger
 from test_collections.matter.config import matter_settings
 
 from .exec_run_in_container import ExecResultExtended, exec_run_in_container
-from .pics import set_pics_command
+from .pics import PICS_FILE_PATH, SHELL_OPTION, SHELL_PATH, set_pics_command
+from .utils import (
+    ADMIN_STORAGE_FILE_CONTAINER_DEFAULT_PATH,
+    ADMIN_STORAGE_FILE_DEFAULT_NAME,
+)
 
 # Trace mount
 LOCAL_LOGS_PATH = Path("/var/tmp")
@@ -59,6 +66,17 @@ LOCAL_RPC_PYTHON_TESTING_PATH = Path(
 )
 DOCKER_RPC_PYTHON_TESTING_PATH = "/root/python_testing/scripts/sdk/matter_testing_infrastructure/chip/testing/test_harness_client.py"  # noqa
 
+# State left in the container by a test suite, removed before a released container is
+# reused. The chip-tool and chip app storage is kept in /tmp by default. The trace
+# logs are not removed, as they're kept on the host.
+SDK_CONTAINER_STATE_PATHS = [
+    PICS_FILE_PATH,
+    str(ADMIN_STORAGE_FILE_CONTAINER_DEFAULT_PATH / ADMIN_STORAGE_FILE_DEFAULT_NAME),
+    "/tmp/chip_*",
+]
+# Processes left running by a test suite, killed before a released container is reused
+SDK_CONTAINER_PROCESSES_PATTERN = f"chip-tool|chip-app|{DOCKER_PYTHON_TESTING_PATH}"
+
 
 class SDKContainerNotRunning(Exception):
     """Raised when we attempt to use the docker container, but it is not running"""
@@ -75,6 +93,11 @@ class SDKContainer(metaclass=Singleton):
 
     Usage:
     Create an instance by calling initializer. When ready to use, ...
+
+    Test suites release the container when they're done with it, instead of destroying
+    it. A released container is kept running, and reused by the next suite after its
+    state is reset, as creating a new container takes a long time. It is destroyed
+    when it's not reused within SDK_CONTAINER_KEEP_WARM_SECONDS.
     """
 
     container_name = matter_settings.SDK_CONTAINER_NAME
@@ -127,18 +150,28 @@ class SDKContainer(metaclass=Singleton):
         self.__pics_file_created = False
         self.logger = logger
 
+        # Released container, kept running to be reused
+        self.__released = False
+        self.__destroy_released_timer: Optional[TimerHandle] = None
+        self.__destroy_released_task: Optional[Task] = None
+        # Seconds it took to start the last new container, saved on each reuse
+        self.__start_duration = 0.0
+        self.time_saved = 0.0
+
     @property
     def pics_file_created(self) -> bool:
         return self.__pics_file_created
 
-    def __destroy_existing_container(self) -> None:
+    async def __destroy_existing_container(self) -> None:
         """This will kill and remove any existing container using the same name."""
-        existing_container = container_manager.get_container(self.container_name)
+        existing_container = await container_manager.get_container_async(
+            self.container_name
+        )
         if existing_container is not None:
             logger.info(
                 f'Existing container named "{self.container_name}" found. Destroying.'
             )
-            container_manager.destroy(existing_container)
+            await container_manager.destroy_async(existing_container)
 
     def is_running(self) -> bool:
         if self.__container is None:
@@ -152,31 +185,133 @@ class SDKContainer(metaclass=Singleton):
         Returns only when the container is created.
         """
 
-        if self.is_running():
+        released = self.__released
+        self.__cancel_release()
+        await self.__wait_for_released_container_destroyed()
+
+        if await container_manager.run_in_executor(self.is_running):
+            if released:
+                await self.__reuse_released_container()
+                return
+
             self.logger.info(
                 "SDK container already running, no need to start a new container"
             )
             return
 
+        start_time = monotonic()
+
         # Ensure there's no existing container running using the same name.
-        self.__destroy_existing_container()
+        await self.__destroy_existing_container()
 
         # Async return when the container is running
         self.__container = await container_manager.create_container(
             self.image_tag, self.run_parameters
         )
+        self.__start_duration = monotonic() - start_time
 
         self.logger.info(
             f"{self.container_name} container started"
             f" with configuration: {self.run_parameters}"
         )
 
+    async def release(self) -> None:
+        """Release the container, keeping it running to be reused by the next start.
+
+        The container is destroyed when it's not reused in time, or right away when
+        keeping it running is disabled.
+        """
+        if self.__container is None or self.__released:
+            return
+
+        keep_warm_seconds = matter_settings.SDK_CONTAINER_KEEP_WARM_SECONDS
+        if keep_warm_seconds <= 0:
+            await self.destroy_async()
+            return
+
+        self.logger.info(
+            f"Keeping {self.container_name} container running for "
+            f"{keep_warm_seconds}s to be reused"
+        )
+        self.__released = True
+        self.__destroy_released_timer = asyncio.get_running_loop().call_later(
+            keep_warm_seconds, self.__destroy_released_container
+        )
+
     def destroy(self) -> None:
         """Destroy the container."""
+        self.__cancel_release()
         if self.__container is not None:
             container_manager.destroy(self.__container)
         self.__container = None
 
+    async def destroy_async(self) -> None:
+        """Destroy the container, running the docker calls in the docker pool."""
+        self.__cancel_release()
+        container, self.__container = self.__container, None
+        if container is not None:
+            await container_manager.destroy_async(container)
+
+    def __cancel_release(self) -> None:
+        self.__released = False
+        if self.__destroy_released_timer is not None:
+            self.__destroy_released_timer.cancel()
+            self.__destroy_released_timer = None
+
+    def __destroy_released_container(self) -> None:
+        """Destroy the released container, as it was not reused in time."""
+        self.__destroy_released_timer = None
+        self.__released = False
+        if (container := self.__container) is None:
+            return
+
+        self.logger.info(f"Destroying unused {self.container_name} container")
+        self.__container = None
+        # Keep a reference to the task until it's done
+        self.__destroy_released_task = asyncio.create_task(
+            container_manager.destroy_async(container)
+        )
+        self.__destroy_released_task.add_done_callback(
+            self.__released_container_destroyed
+        )
+
+    def __released_container_destroyed(self, task: Task) -> None:
+        if self.__destroy_released_task is task:
+            self.__destroy_released_task = None
+        if not task.cancelled() and (error := task.exception()) is not None:
+            self.logger.error(
+                f"Failed to destroy unused {self.container_name} container: {error}"
+            )
+
+    async def __wait_for_released_container_destroyed(self) -> None:
+        """Wait for the released container to be destroyed, so a new container isn't
+        started while the previous one is being removed."""
+        if (task := self.__destroy_released_task) is not None:
+            # Errors are logged by the task's done callback
+            await asyncio.wait([task])
+
+    async def __reuse_released_container(self) -> None:
+        """Reset the state left by the previous test suite, instead of creating a new
+        container."""
+        self.reset_pics_state()
+        await container_manager.run_in_executor(
+            self.send_command,
+            f'-SIGKILL -f "{SDK_CONTAINER_PROCESSES_PATTERN}"',
+            prefix="pkill",
+        )
+        paths = " ".join(SDK_CONTAINER_STATE_PATHS)
+        await container_manager.run_in_executor(
+            self.send_command,
+            f'"rm -rf {paths}"',
+            prefix=f"{SHELL_PATH} {SHELL_OPTION}",
+        )
+
+        self.time_saved += self.__start_duration
+        self.logger.info(
+            f"Reusing {self.container_name} container, saved "
+            f"{self.__start_duration:.1f}s ({self.time_saved:.1f}s in total)"
+        )
+
     def send_command(
         self,
         command: Union[str, list],
@@ -266,3 +401,25 @@ class SDKContainer(metaclass=Singleton):
             host_file_path=host_file_path,
             destination_container_path=destination_container_path,
         )
+
+    async def copy_file_from_container_async(
+        self,
+        container_file_path: Path,
+        destination_path: Path,
+        destination_file_name: str,
+    ) -> None:
+        await container_manager.copy_file_from_container_async(
+            container=self.__container,
+            container_file_path=container_file_path,
+            destination_path=destination_path,
+            destination_file_name=destination_file_name,
+        )
+
+    async def copy_file_to_container_async(
+        self, host_file_path: Path, destination_container_path: Path
+    ) -> None:
+        await container_manager.copy_file_to_container_async(
+            container=self.__container,
+            host_file_path=host_file_path,
+            destination_container_path=destination_container_path,
+        )
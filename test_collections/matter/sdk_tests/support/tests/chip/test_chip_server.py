@@ -17,6 +17,9 @@
 # type: ignore
 # Ignore mypy type check for this file
 
+import asyncio
+from threading import Event
+from typing import Generator
 from unittest import mock
 
 import pytest
@@ -265,3 +268,83 @@ async def test_start_chip_app_using_paa_certs() -> None:
     chip_server._ChipServer__chip_server_id = None
     chip_server._ChipServer__server_started = False
     matter_settings.CHIP_TOOL_TRACE = original_trace_setting_value
+
+
+@pytest.mark.asyncio
+async def test_wait_for_server_start() -> None:
+    chip_server: ChipServer = ChipServer()
+    log_generator = iter(
+        [
+            "log output\n".encode(),
+            "LWS_CALLBACK_PROTOCOL_INIT\nlog output".encode(),
+            "not read".encode(),
+        ]
+    )
+
+    assert await chip_server._ChipServer__wait_for_server_start(log_generator) is True
+    # The remaining logs are not read
+    assert next(log_generator) == "not read".encode()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_server_start_cancelled() -> None:
+    chip_server: ChipServer = ChipServer()
+    sdk_container: SDKContainer = SDKContainer()
+    chip_server._ChipServer__server_full_command = CHIP_TOOL_EXE
+    server_stopped = Event()
+
+    def logs() -> Generator:
+        yield "log output\n".encode()
+        # Blocks until the server is stopped
+        server_stopped.wait(timeout=1)
+        yield "log output after stop".encode()
+        yield "not read".encode()
+
+    log_generator = logs()
+    with mock.patch.object(
+        target=sdk_container,
+        attribute="send_command",
+        side_effect=lambda *args, **kwargs: server_stopped.set(),
+    ) as mock_send_command:
+        wait_task = asyncio.create_task(
+            chip_server._ChipServer__wait_for_server_start(log_generator)
+        )
+        await asyncio.sleep(0.05)
+        wait_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await wait_task
+
+    # The server is stopped and the worker is done reading the logs
+    mock_send_command.assert_called_once_with(
+        f'-SIGTERM -f "{CHIP_TOOL_EXE}"', prefix="pkill"
+    )
+    assert next(log_generator) == "not read".encode()
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_exit_code() -> None:
+    chip_server: ChipServer = ChipServer()
+    sdk_container: SDKContainer = SDKContainer()
+    chip_server._ChipServer__server_started = True
+    chip_server._ChipServer__server_full_command = CHIP_TOOL_EXE
+    chip_server._ChipServer__chip_server_id = "ID"
+
+    with mock.patch.object(
+        target=sdk_container, attribute="send_command"
+    ) as mock_send_command, mock.patch.object(
+        target=sdk_container, attribute="exec_exit_code", side_effect=[None, 0]
+    ) as mock_exec_exit_code, mock.patch(
+        "test_collections.matter.sdk_tests.support.chip.chip_server"
+        ".CHIP_SERVER_EXIT_TIMEOUT",
+        0.05,
+    ):
+        await chip_server.stop()
+
+    mock_send_command.assert_called_once_with(
+        f'-SIGTERM -f "{CHIP_TOOL_EXE}"', prefix="pkill"
+    )
+    assert mock_exec_exit_code.call_count == 2
+    assert chip_server._ChipServer__server_started is False
+
+    # clean up:
+    chip_server._ChipServer__chip_server_id = None
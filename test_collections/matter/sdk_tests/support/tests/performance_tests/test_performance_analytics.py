@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from ...performance_tests.analytics import DurationAnalytics
+
+
+def test_duration_analytics_summary() -> None:
+    analytics = DurationAnalytics()
+    for value in [30, 10, 20, 40, 50, 60, 70, 80, 90, 1000]:
+        analytics.add(value)
+
+    summary = analytics.summary()
+
+    assert summary["count"] == 10
+    assert summary["unit"] == "ms"
+    assert summary["min"] == 10
+    assert summary["max"] == 1000
+    assert summary["mean"] == pytest.approx(145)
+    assert summary["stddev"] == pytest.approx(286.050695)
+    assert summary["p50"] == pytest.approx(55)
+    assert summary["p90"] == pytest.approx(181)
+    assert summary["p99"] == pytest.approx(918.1)
+    assert sum(summary["histogram"]["counts"]) == 10
+    assert summary["histogram"]["counts"][0] == 9
+    # Outliers are reported by insertion index
+    assert summary["outliers"] == [9]
+
+
+def test_duration_analytics_empty() -> None:
+    summary = DurationAnalytics().summary()
+
+    assert summary["count"] == 0
+    assert summary["p95"] is None
+    assert summary["histogram"] == {"edges": [], "counts": []}
+    assert summary["outliers"] == []
+
+
+def test_duration_analytics_summary_updated_on_add() -> None:
+    analytics = DurationAnalytics()
+    analytics.add(10)
+
+    summary = analytics.summary()
+    # The summary is only computed again once a value is added
+    assert analytics.summary() is summary
+
+    analytics.add(30)
+
+    assert analytics.summary()["count"] == 2
+    assert analytics.summary()["mean"] == pytest.approx(20)
@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from datetime import datetime
+
+from ...performance_tests.utils import CommissioningLogParser
+
+
+def commissioning_log(iteration: int, second: int) -> list[str]:
+    def line(millisecond: int, message: str) -> str:
+        return f"2024-01-01 10:00:{second:02}.{millisecond:03}000 INFO {message}"
+
+    return [
+        line(0, f"|============== Begin Commission {iteration} ============|"),
+        line(10, "Internal Control start simulated app"),
+        line(50, "Discovered Device: 1234"),
+        line(60, "SecureChannel:PBKDFParamRequest"),
+        line(90, "State change 'kEstablishing' --> 'kActive'"),
+        line(100, "Performing next commissioning step 'ReadCommissioningInfo'"),
+        line(150, "Successfully finished commissioning step 'ReadCommissioningInfo'"),
+        line(200, "Performing next commissioning step 'Cleanup'"),
+        line(300, "Successfully finished commissioning step 'Cleanup'"),
+        line(400, "Internal Control stop simulated app"),
+    ]
+
+
+def test_commissioning_log_parser() -> None:
+    parser = CommissioningLogParser()
+
+    parser.feed("INFO | Test Suite Executing: Performance Test Suite")
+    parser.feed("INFO | Executing Test Case: TC-COMMISSIONING-1.0")
+    for iteration in (1, 2):
+        log = commissioning_log(iteration, second=iteration)
+        # Records spanning multiple lines are split before parsing
+        assert parser.feed("\n".join(log[:-1])) == []
+        assert len(parser.feed(log[-1])) == 1
+    parser.feed("INFO | Test Case Completed [PASSED]")
+
+    assert parser.tc_suite == "Performance Test Suite"
+    assert parser.tc_name == "TC-COMMISSIONING-1.0"
+    assert parser.execution_status == ["PASS", "PASS"]
+    assert len(parser.iterations) == 2
+
+    commissioning = parser.iterations[1]
+    assert commissioning.commissioning["begin"] == datetime(2024, 1, 1, 10, 0, 2, 10000)
+    assert commissioning.durations() == {
+        "durations": 290000,
+        "discovery_durations": 40000,
+        "read_durations": 50000,
+        "PASE_durations": 30000,
+    }
@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# type: ignore
+# Ignore mypy type check for this file
+
+import asyncio
+import json
+import socket
+
+import pytest
+
+from ..hooks_channel import HOOKS_FRAME_HEADER, HooksChannel
+
+TEST_HOST = "127.0.0.1"
+
+
+@pytest.fixture
+def port() -> int:
+    # Tests may run in parallel, so each one gets its own free port
+    with socket.socket() as s:
+        s.bind((TEST_HOST, 0))
+        return s.getsockname()[1]
+
+
+async def send_events(port: int, events: list[dict], close: bool = True) -> None:
+    _, writer = await asyncio.open_connection(TEST_HOST, port)
+    for event in events:
+        payload = json.dumps(event).encode()
+        writer.write(HOOKS_FRAME_HEADER.pack(len(payload)) + payload)
+    await writer.drain()
+    if close:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def collect_updates(channel: HooksChannel) -> list:
+    return [update async for update in channel.updates()]
+
+
+@pytest.mark.asyncio
+async def test_hooks_channel_delivers_events_until_stop(port: int) -> None:
+    events = [
+        {"type": "start", "count": 1},
+        {"type": "step_start", "name": "Step 1"},
+        {"type": "stop", "duration": 10},
+        {"type": "step_start", "name": "After stop"},
+    ]
+    channel = HooksChannel(lambda event: event, host=TEST_HOST, port=port)
+    await channel.start()
+    try:
+        await send_events(port, events, close=False)
+        updates = await asyncio.wait_for(collect_updates(channel), timeout=5)
+    finally:
+        await channel.close()
+
+    assert updates == events[:3]
+
+
+@pytest.mark.asyncio
+async def test_hooks_channel_ends_when_connection_is_closed(port: int) -> None:
+    events = [{"type": "start", "count": 1}]
+    channel = HooksChannel(lambda event: event, host=TEST_HOST, port=port)
+    await channel.start()
+    try:
+        await send_events(port, events)
+        updates = await asyncio.wait_for(collect_updates(channel), timeout=5)
+    finally:
+        await channel.close()
+
+    assert updates == events
+
+
+@pytest.mark.asyncio
+async def test_hooks_channel_batches_buffered_events(port: int) -> None:
+    events = [{"type": "step_start", "name": f"Step {i}"} for i in range(10)]
+    events.append({"type": "stop", "duration": 10})
+    channel = HooksChannel(lambda event: event, host=TEST_HOST, port=port)
+    await channel.start()
+    try:
+        await send_events(port, events)
+        # Let the channel receive every frame before consuming them
+        await asyncio.sleep(0.1)
+        batches = [batch async for batch in channel.batches()]
+    finally:
+        await channel.close()
+
+    assert batches == [events]
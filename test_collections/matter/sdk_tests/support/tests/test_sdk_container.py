@@ -17,9 +17,11 @@
 # type: ignore
 # Ignore mypy type check for this file
 
+import asyncio
 from unittest import mock
 
 import pytest
+from docker.models.containers import Container
 
 from app.container_manager import container_manager
 from app.tests.conftest import real_sdk_container  # noqa: F401
@@ -208,3 +210,112 @@ async def test_send_command_custom_prefix(real_sdk_container) -> None:  # noqa
     # clean up:
     real_sdk_container._SDKContainer__last_exec_id = None
     real_sdk_container._SDKContainer__container = None
+
+
+@pytest.mark.asyncio
+async def test_reuse_released_container(real_sdk_container) -> None:  # noqa
+    with mock.patch.object(
+        target=container_manager, attribute="get_container", return_value=None
+    ), mock.patch.object(
+        target=container_manager, attribute="destroy"
+    ) as mock_destroy, mock.patch.object(
+        target=container_manager,
+        attribute="create_container",
+        return_value=make_fake_container(),
+    ) as mock_create_container:
+        with mock.patch.object(
+            target=real_sdk_container, attribute="is_running", return_value=False
+        ):
+            await real_sdk_container.start()
+
+        await real_sdk_container.release()
+
+        with mock.patch.object(
+            target=real_sdk_container, attribute="is_running", return_value=True
+        ), mock.patch.object(
+            target=real_sdk_container, attribute="send_command"
+        ) as mock_send_command:
+            await real_sdk_container.start()
+
+    # The released container is reset and reused, instead of creating a new one
+    mock_create_container.assert_called_once()
+    mock_destroy.assert_not_called()
+    assert mock_send_command.call_count == 2
+    kill_command, reset_command = mock_send_command.call_args_list
+    assert kill_command.kwargs["prefix"] == "pkill"
+    assert "rm -rf" in reset_command.args[0]
+    assert real_sdk_container._SDKContainer__container is not None
+
+    # clean up:
+    with mock.patch.object(target=container_manager, attribute="destroy"):
+        real_sdk_container.destroy()
+    real_sdk_container.time_saved = 0.0
+
+
+@pytest.mark.asyncio
+async def test_start_waits_for_released_destroy(real_sdk_container) -> None:  # noqa
+    original_keep_warm_seconds = matter_settings.SDK_CONTAINER_KEEP_WARM_SECONDS
+    matter_settings.SDK_CONTAINER_KEEP_WARM_SECONDS = 0.01
+    destroyed = False
+
+    async def destroy_async(container: Container) -> None:
+        nonlocal destroyed
+        await asyncio.sleep(0.05)
+        destroyed = True
+        raise Exception("Docker error")
+
+    with mock.patch.object(
+        target=real_sdk_container, attribute="is_running", return_value=False
+    ), mock.patch.object(
+        target=container_manager, attribute="get_container", return_value=None
+    ), mock.patch.object(
+        target=container_manager, attribute="destroy_async", side_effect=destroy_async
+    ), mock.patch.object(
+        target=container_manager,
+        attribute="create_container",
+        return_value=make_fake_container(),
+    ) as mock_create_container, mock.patch.object(
+        target=real_sdk_container, attribute="logger"
+    ) as mock_logger:
+        await real_sdk_container.start()
+        await real_sdk_container.release()
+        # The container isn't reused in time
+        await asyncio.sleep(0.02)
+
+        await real_sdk_container.start()
+
+        # The new container is only created once the released one is destroyed
+        assert destroyed
+        assert mock_create_container.call_count == 2
+        mock_logger.error.assert_called_once()
+
+    # clean up:
+    with mock.patch.object(target=container_manager, attribute="destroy"):
+        real_sdk_container.destroy()
+    matter_settings.SDK_CONTAINER_KEEP_WARM_SECONDS = original_keep_warm_seconds
+
+
+@pytest.mark.asyncio
+async def test_release_container_keep_warm_disabled(real_sdk_container) -> None:  # noqa
+    original_keep_warm_seconds = matter_settings.SDK_CONTAINER_KEEP_WARM_SECONDS
+    matter_settings.SDK_CONTAINER_KEEP_WARM_SECONDS = 0
+
+    with mock.patch.object(
+        target=real_sdk_container, attribute="is_running", return_value=False
+    ), mock.patch.object(
+        target=container_manager, attribute="get_container", return_value=None
+    ), mock.patch.object(
+        target=container_manager, attribute="destroy_async"
+    ) as mock_destroy_async, mock.patch.object(
+        target=container_manager,
+        attribute="create_container",
+        return_value=make_fake_container(),
+    ):
+        await real_sdk_container.start()
+        await real_sdk_container.release()
+
+    mock_destroy_async.assert_awaited_once()
+    assert real_sdk_container._SDKContainer__container is None
+
+    # clean up:
+    matter_settings.SDK_CONTAINER_KEEP_WARM_SECONDS = original_keep_warm_seconds
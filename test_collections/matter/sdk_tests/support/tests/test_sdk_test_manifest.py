@@ -0,0 +1,105 @@
+#
+# Copyright (c) 2023 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from pathlib import Path
+from unittest import mock
+
+from ..models.sdk_test_manifest import SDKTestManifest
+
+
+def test_manifest_reuses_unchanged_files(tmp_path: Path) -> None:
+    test_file = tmp_path / "Test_TC_1.yaml"
+    test_file.write_text("content")
+    parse = mock.Mock(return_value={"parsed": True})
+
+    manifest = SDKTestManifest(name="test", version="1.0", manifests_path=tmp_path)
+    assert manifest.load(test_file, parse) == {"parsed": True}
+    manifest.save()
+
+    # A new manifest (e.g. another backend worker) reads the persisted entries
+    manifest = SDKTestManifest(name="test", version="1.0", manifests_path=tmp_path)
+    assert manifest.load(test_file, parse) == {"parsed": True}
+    parse.assert_called_once_with(test_file)
+
+
+def test_manifest_parses_modified_files(tmp_path: Path) -> None:
+    test_file = tmp_path / "Test_TC_1.yaml"
+    test_file.write_text("content")
+    parse = mock.Mock(side_effect=lambda path: path.read_text())
+
+    manifest = SDKTestManifest(name="test", version="1.0", manifests_path=tmp_path)
+    manifest.load(test_file, parse)
+    manifest.save()
+
+    test_file.write_text("modified content")
+    stat = test_file.stat()
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    manifest = SDKTestManifest(name="test", version="1.0", manifests_path=tmp_path)
+    assert manifest.load(test_file, parse) == "modified content"
+    assert parse.call_count == 2
+
+
+def test_manifest_is_discarded_on_sdk_version_change(tmp_path: Path) -> None:
+    test_file = tmp_path / "Test_TC_1.yaml"
+    test_file.write_text("content")
+    parse = mock.Mock(return_value="parsed")
+
+    manifest = SDKTestManifest(name="test", version="1.0", manifests_path=tmp_path)
+    manifest.load(test_file, parse)
+    manifest.save()
+
+    manifest = SDKTestManifest(name="test", version="2.0", manifests_path=tmp_path)
+    manifest.load(test_file, parse)
+    assert parse.call_count == 2
+
+
+def test_manifest_is_discarded_on_backend_change(tmp_path: Path) -> None:
+    test_file = tmp_path / "Test_TC_1.yaml"
+    test_file.write_text("content")
+    parse = mock.Mock(return_value="parsed")
+
+    manifest = SDKTestManifest(name="test", version="1.0", manifests_path=tmp_path)
+    manifest.load(test_file, parse)
+    manifest.save()
+
+    # The pickled models of a previous backend may not match the current ones
+    with mock.patch(
+        "test_collections.matter.sdk_tests.support.models.sdk_test_manifest"
+        ".manifest_format",
+        return_value="updated",
+    ):
+        manifest = SDKTestManifest(name="test", version="1.0", manifests_path=tmp_path)
+    manifest.load(test_file, parse)
+    assert parse.call_count == 2
+
+
+def test_manifest_reuses_files_with_same_content(tmp_path: Path) -> None:
+    test_file = tmp_path / "Test_TC_1.yaml"
+    test_file.write_text("content")
+    parse = mock.Mock(return_value="parsed")
+
+    manifest = SDKTestManifest(name="test", version="1.0", manifests_path=tmp_path)
+    manifest.load(test_file, parse)
+    manifest.save()
+
+    # Only the modification time changes, e.g. the SDK checkout was fetched again
+    stat = test_file.stat()
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    manifest = SDKTestManifest(name="test", version="1.0", manifests_path=tmp_path)
+    assert manifest.is_fresh(test_file)
+    assert manifest.load(test_file, parse) == "parsed"
+    parse.assert_called_once_with(test_file)
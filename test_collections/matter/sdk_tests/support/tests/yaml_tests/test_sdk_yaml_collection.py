@@ -24,18 +24,19 @@ from ...yaml_tests.models.test_declarations import (
     YamlCaseDeclaration,
     YamlCollectionDeclaration,
 )
-from ...yaml_tests.sdk_yaml_tests import sdk_yaml_test_collection
+from ...yaml_tests.sdk_yaml_tests import _parse_all_yaml, sdk_yaml_test_collection
+
+TEST_SDK_YAML_PATH = Path(__file__).parent / "test_yamls"
 
 
 @pytest.fixture
 def yaml_collection() -> YamlCollectionDeclaration:
-    test_sdk_yaml_path = Path(__file__).parent / "test_yamls"
     with mock.patch.object(Path, "exists", return_value=True), mock.patch(
         "test_collections.matter.sdk_tests.support.models.sdk_test_folder.open",
         new=mock.mock_open(read_data="unit-test-yaml-version"),
     ):
         folder = SDKTestFolder(
-            path=test_sdk_yaml_path, filename_pattern="UnitTest_TC_*"
+            path=TEST_SDK_YAML_PATH, filename_pattern="UnitTest_TC_*"
         )
         return sdk_yaml_test_collection(folder)
 
@@ -95,3 +96,19 @@ def test_simulated_suite(yaml_collection: YamlCollectionDeclaration) -> None:
     for test_case in simulated_suite.test_cases.values():
         assert isinstance(test_case, YamlCaseDeclaration)
         assert test_case.test_type == MatterTestType.SIMULATED
+
+
+def test_parallel_parse_keeps_suites() -> None:
+    yaml_files = sorted(TEST_SDK_YAML_PATH.glob("UnitTest_TC_*.y*ml"))
+
+    serial_suites = _parse_all_yaml(yaml_files=yaml_files, yaml_version="1.0")
+    with mock.patch(
+        "test_collections.matter.sdk_tests.support.yaml_tests.sdk_yaml_tests"
+        ".PARALLEL_PARSE_MIN_FILES",
+        new=1,
+    ):
+        parallel_suites = _parse_all_yaml(yaml_files=yaml_files, yaml_version="1.0")
+
+    assert [(s.public_id, list(s.test_cases)) for s in parallel_suites] == [
+        (s.public_id, list(s.test_cases)) for s in serial_suites
+    ]
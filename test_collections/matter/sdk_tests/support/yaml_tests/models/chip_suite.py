@@ -15,6 +15,7 @@
 #
 from typing import Optional
 
+from app.container_manager import container_manager
 from app.models import TestSuiteExecution
 from app.test_engine.logger import test_engine_logger as logger
 from app.test_engine.models import TestSuite
@@ -74,7 +75,9 @@ class ChipSuite(TestSuite, UserPromptSupport):
         if self.config_matter.dut_config.pairing_mode is DutPairingModeEnum.NFC_THREAD:
             # When PCSC reader is used in a Docker container, pollkit should
             #  be disabled
-            self.sdk_container.send_command("--disable-polkit", prefix="pcscd")
+            await container_manager.run_in_executor(
+                self.sdk_container.send_command, "--disable-polkit", prefix="pcscd"
+            )
 
         logger.info("Setting up test runner")
         await self.runner.setup(
@@ -237,12 +240,12 @@ class ChipSuite(TestSuite, UserPromptSupport):
         logger.info("Stopping test runner")
         await self.runner.stop()
 
-        logger.info("Stopping SDK container")
-        self.sdk_container.destroy()
+        logger.info("Releasing SDK container")
+        await self.sdk_container.release()
 
         if self.border_router is not None:
             logger.info("Stopping border router container")
-            self.border_router.destroy_device()
+            await self.border_router.destroy_device_async()
 
     async def __verify_test_suite_prerequisites(self) -> None:
         # prerequisites apply for CHIP_APP only.
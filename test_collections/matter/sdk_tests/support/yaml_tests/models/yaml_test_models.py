@@ -15,6 +15,7 @@
 #
 from typing import Any
 
+import yaml
 from pydantic_yaml import YamlModelMixin
 
 from ...models.matter_test_models import MatterTest
@@ -23,7 +24,18 @@ from ...models.matter_test_models import MatterTest
 # This file declares YAML models that are used to parse the YAML Test Cases.
 ###
 
+# Use the libyaml (C) based loader when PyYAML was built with it, it's considerably
+# faster than the pure python loader used by default by pydantic_yaml.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def yaml_loads(stream: str) -> Any:
+    return yaml.load(stream, Loader=YamlLoader)
+
 
 class YamlTest(YamlModelMixin, MatterTest):
+    class Config:
+        yaml_loads = yaml_loads
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(steps=kwargs["tests"], **kwargs)
@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 from pathlib import Path
+from typing import Any, Optional
 
 from loguru import logger
 from pydantic import ValidationError
@@ -58,19 +59,22 @@ def _test_type(test: YamlTest) -> MatterTestType:
     return MatterTestType.AUTOMATED
 
 
-def parse_yaml_test(path: Path) -> YamlTest:
+def parse_yaml_test(path: Path, document: Optional[Any] = None) -> YamlTest:
     """Parse a single YAML file into YamlTest model.
 
-    This will also annotate parsed yaml with it's path and test type.
+    This will also annotate parsed yaml with it's path and test type. The file is
+    only read when its already loaded YAML `document` isn't given.
     """
-    with open(path, "r") as file:
-        try:
-            yaml_str = file.read()
-            test = YamlTest.parse_raw(yaml_str, proto="yaml")
-            test.path = path
-            test.type = _test_type(test)
-        except ValidationError as e:
-            logger.error(str(e))
-            raise YamlParserException(f"The YAML file {path} is invalid") from e
-
-        return test
+    try:
+        if document is None:
+            with open(path, "r") as file:
+                test = YamlTest.parse_raw(file.read(), proto="yaml")
+        else:
+            test = YamlTest.parse_obj(document)
+        test.path = path
+        test.type = _test_type(test)
+    except ValidationError as e:
+        logger.error(str(e))
+        raise YamlParserException(f"The YAML file {path} is invalid") from e
+
+    return test
@@ -13,13 +13,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, Union
 
+import yaml
 from loguru import logger
 
 from ..models.matter_test_models import MatterTestType
 from ..models.sdk_test_folder import SDKTestFolder
+from ..models.sdk_test_manifest import SDKTestManifest
 from ..paths import SDK_CHECKOUT_PATH
 from .models.test_declarations import (
     YamlCaseDeclaration,
@@ -27,6 +33,7 @@ from .models.test_declarations import (
     YamlSuiteDeclaration,
 )
 from .models.test_suite import SuiteType
+from .models.yaml_test_models import YamlLoader, YamlTest
 from .models.yaml_test_parser import YamlParserException, parse_yaml_test
 
 ###
@@ -49,6 +56,12 @@ CUSTOM_YAML_TEST_FOLDER = SDKTestFolder(
     path=CUSTOM_YAML_PATH, filename_pattern="Test_TC*"
 )
 
+# Parsing is only spread across processes when there are enough files to make up for
+# the cost of starting the pool (e.g. the custom folder usually has just a few files)
+PARALLEL_PARSE_MIN_FILES = 32
+PARALLEL_PARSE_CHUNK_SIZE = 8
+PARALLEL_PARSE_MAX_WORKERS = min(os.cpu_count() or 1, 4)
+
 
 def _init_test_suites(yaml_version: str) -> dict[SuiteType, YamlSuiteDeclaration]:
     # Append `custom` text in order to differ from the regular suite name
@@ -76,26 +89,93 @@ def _init_test_suites(yaml_version: str) -> dict[SuiteType, YamlSuiteDeclaration
 
 
 def _parse_yaml_to_test_case_declaration(
-    yaml_path: Path, yaml_version: str
+    yaml_path: Path,
+    yaml_version: str,
+    manifest: Optional[SDKTestManifest] = None,
+    parse: Callable[[Path], YamlTest] = parse_yaml_test,
 ) -> YamlCaseDeclaration:
-    yaml_test = parse_yaml_test(yaml_path)
+    if manifest is not None:
+        yaml_test = manifest.load(yaml_path, parse)
+    else:
+        yaml_test = parse(yaml_path)
     return YamlCaseDeclaration(test=yaml_test, yaml_version=yaml_version)
 
 
+def _parse_yaml_test_or_error(
+    path: Path, document: Optional[Any] = None
+) -> Union[YamlTest, YamlParserException]:
+    # Exceptions are returned instead of raised, so a single invalid file doesn't
+    # interrupt the results of the other files
+    try:
+        return parse_yaml_test(path, document)
+    except YamlParserException as e:
+        return e
+
+
+def _parse_yaml_files(
+    yaml_files: list[Path],
+) -> dict[Path, Union[YamlTest, YamlParserException]]:
+    """Parse the yaml files, loading their YAML in a process pool when there are many
+    of them."""
+    if len(yaml_files) < PARALLEL_PARSE_MIN_FILES:
+        return {path: _parse_yaml_test_or_error(path) for path in yaml_files}
+
+    # Forking the server process isn't safe, as it runs other threads. The spawned
+    # workers would discover the test collections again when importing this package,
+    # so they only load the YAML documents with PyYAML and the models are created
+    # here.
+    yaml_strs = [path.read_text() for path in yaml_files]
+    with ProcessPoolExecutor(
+        max_workers=PARALLEL_PARSE_MAX_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        documents = executor.map(
+            partial(yaml.load, Loader=YamlLoader),
+            yaml_strs,
+            chunksize=PARALLEL_PARSE_CHUNK_SIZE,
+        )
+        return {
+            path: _parse_yaml_test_or_error(path, document)
+            for path, document in zip(yaml_files, documents)
+        }
+
+
 def _parse_all_yaml(
-    yaml_files: list[Path], yaml_version: str
+    yaml_files: list[Path],
+    yaml_version: str,
+    manifest: Optional[SDKTestManifest] = None,
 ) -> list[YamlSuiteDeclaration]:
     """Parse all yaml files and organize them in the 3 test suites:
     - Automated and Semi-Automated using Chip-Tool
     - Simulated using Chip-App1
     - Manual
+
+    When a manifest is given, files unchanged since they were last parsed are loaded
+    from it instead. The remaining files are parsed up front, in parallel, while the
+    test cases are still added to the suites in the order of `yaml_files`.
     """
     suites = _init_test_suites(yaml_version)
 
+    pending_files = [
+        f for f in yaml_files if manifest is None or not manifest.is_fresh(f)
+    ]
+    parsed_files = _parse_yaml_files(pending_files)
+
+    def parse(path: Path) -> YamlTest:
+        if path not in parsed_files:
+            return parse_yaml_test(path)
+        result = parsed_files[path]
+        if isinstance(result, YamlParserException):
+            raise result
+        return result
+
     for yaml_file in yaml_files:
         try:
             test_case = _parse_yaml_to_test_case_declaration(
-                yaml_path=yaml_file, yaml_version=yaml_version
+                yaml_path=yaml_file,
+                yaml_version=yaml_version,
+                manifest=manifest,
+                parse=parse,
             )
 
             if test_case.test_type == MatterTestType.MANUAL:
@@ -122,7 +202,9 @@ def sdk_yaml_test_collection(
 
     files = yaml_test_folder.file_paths(extension=".y*ml")
     version = yaml_test_folder.version
-    suites = _parse_all_yaml(yaml_files=files, yaml_version=version)
+    manifest = yaml_test_folder.manifest("yaml")
+    suites = _parse_all_yaml(yaml_files=files, yaml_version=version, manifest=manifest)
+    manifest.save()
 
     for suite in suites:
         suite.sort_test_cases()
@@ -140,7 +222,9 @@ def custom_yaml_test_collection(
     )
 
     files = yaml_test_folder.file_paths(extension=".y*ml")
-    suites = _parse_all_yaml(yaml_files=files, yaml_version="custom")
+    manifest = yaml_test_folder.manifest("yaml")
+    suites = _parse_all_yaml(yaml_files=files, yaml_version="custom", manifest=manifest)
+    manifest.save()
 
     for suite in suites:
         if not suite.test_cases: